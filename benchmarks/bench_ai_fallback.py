@@ -0,0 +1,74 @@
+"""
+CyberDailyWatch - Benchmark du basculement entre providers IA
+Mesure la latence (médiane et p95) des appels IA avec des providers
+locaux simulés, en mode séquentiel puis en mode hedged, et vérifie que
+le disjoncteur écarte un provider au quota épuisé.
+
+Usage:
+    python benchmarks/bench_ai_fallback.py [nombre_d_appels]
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import ai_providers
+from ai_providers import complete, register_provider
+from fake_services import FakeProvider
+
+
+class TailLatencyProvider(FakeProvider):
+    """Provider rapide la plupart du temps, mais parfois très lent."""
+
+    def __init__(self, *args, slow_rate: float = 0.2, slow_latency: float = 2.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fast_latency = self.latency
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+
+    async def _complete(self, *args):
+        self.latency = self.slow_latency if random.random() < self.slow_rate else self.fast_latency
+        return await super()._complete(*args)
+
+
+async def measure(calls: int, hedge_delay: float | None) -> list[float]:
+    durations = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await complete("système", "question", chain=["primary", "backup"], hedge_delay=hedge_delay)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def summary(label: str, durations: list[float]) -> None:
+    ordered = sorted(durations)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"   {label:<22} médiane {statistics.median(ordered):.2f}s | p95 {p95:.2f}s | max {ordered[-1]:.2f}s")
+
+
+async def run(calls: int = 40) -> None:
+    random.seed(42)
+    register_provider(TailLatencyProvider("primary", latency=0.05, slow_latency=1.0))
+    register_provider(FakeProvider("backup", latency=0.15))
+
+    print(f"🤖 {calls} appels, provider principal lent dans 20% des cas")
+    summary("Séquentiel", await measure(calls, None))
+    summary("Hedged (0.2s)", await measure(calls, 0.2))
+
+    # Disjoncteur: un quota épuisé écarte le provider pour les appels suivants
+    quota = register_provider(FakeProvider("quota", latency=0.05, error_rate=1.0, quota_error=True))
+    register_provider(FakeProvider("backup", latency=0.05))
+    for _ in range(5):
+        await complete("système", "question", chain=["quota", "backup"], hedge_delay=None)
+    print(f"   Disjoncteur: provider au quota épuisé appelé {quota.calls} fois sur 5 requêtes "
+          f"(état: {quota.breaker.state})")
+
+
+if __name__ == "__main__":
+    ai_providers.AI_TIMEOUT = 10
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 40))
@@ -0,0 +1,152 @@
+"""
+CyberDailyWatch - Benchmark du modèle d'article et de l'écriture NDJSON
+Compare, pour un nombre croissant d'articles, le chemin historique et le
+chemin compact (voir src/articles.py):
+
+    - dict: liste de dicts, copie à la traduction (main.translate_articles),
+      puis un seul objet écrit avec json.dump(indent=2) (main.save_data_json)
+    - ndjson: articles.Article produits par un générateur, traduits sur
+      place et écrits au fil de l'eau avec write_ndjson (.ndjson et .ndjson.gz)
+
+Pour chaque chemin: pic de mémoire (tracemalloc), durée d'écriture et
+de relecture, taille du fichier. La mémoire du chemin NDJSON doit rester
+stable quand le nombre d'articles augmente.
+
+Usage:
+    python benchmarks/bench_articles.py
+    python benchmarks/bench_articles.py --sizes 1000,10000,100000 --repeat 3
+"""
+
+import argparse
+import gc
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from articles import Article, read_ndjson, write_ndjson
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+WORDS = ("ransomware", "zero-day", "patch", "vulnerability", "exploit", "attackers", "botnet", "CISA",
+         "Microsoft", "Chrome", "phishing", "campaign", "malware", "critical", "flaw", "researchers",
+         "disclosed", "actively", "exploited", "supply", "chain", "credentials", "cloud", "breach")
+
+
+def sample_articles(count: int):
+    """Articles synthétiques, tels que les produit un parser (dicts), un à la fois."""
+    rng = random.Random(0)
+    for i in range(count):
+        yield {
+            "title": " ".join(rng.choices(WORDS, k=9)).capitalize(),
+            "url": f"https://thehackernews.com/2026/01/article-{i}.html",
+            "summary": " ".join(rng.choices(WORDS, k=60)).capitalize() + ".",
+            "source": "thehackernews",
+        }
+
+
+def translate(article):
+    # Traduction factice: seul le volume des champs ajoutés compte ici
+    article["title_fr"] = "FR " + article["title"]
+    article["summary_fr"] = "FR " + article["summary"]
+    return article
+
+
+def dict_path(count: int, directory: Path) -> Path:
+    news = list(sample_articles(count))
+    translated = [translate(article.copy()) for article in news]
+    data = {"generated_at": "2026-01-01T00:00:00Z", "articles": translated, "script": ""}
+    path = directory / "data.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def ndjson_path(count: int, directory: Path, suffix: str) -> Path:
+    path = directory / f"articles{suffix}"
+    write_ndjson(path, (translate(Article.from_dict(article)) for article in sample_articles(count)))
+    return path
+
+
+def read_dict(path: Path) -> int:
+    with open(path, encoding="utf-8") as f:
+        return len(json.load(f)["articles"])
+
+
+def read_stream(path: Path) -> int:
+    return sum(1 for _ in read_ndjson(path))
+
+
+def measure(func, *args, repeat: int) -> tuple[float, float]:
+    """Durée médiane (s) hors tracemalloc, puis pic de mémoire (Mio) d'un appel."""
+    durations = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func(*args)
+        durations.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return statistics.median(durations), peak / 2**20
+
+
+def record_size(count: int = 10000) -> tuple[float, float]:
+    """Mémoire moyenne (octets) d'un article traduit, hors chaînes: dict, puis Article."""
+    # Les chaînes sont créées avant la mesure: seuls les conteneurs sont comptés
+    articles = [translate(article) for article in sample_articles(count)]
+    sizes = []
+    for convert in (dict, Article.from_dict):
+        gc.collect()
+        tracemalloc.start()
+        kept = [convert(article) for article in articles]
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        sizes.append((current - sys.getsizeof(kept)) / count)
+        del kept
+    return sizes[0], sizes[1]
+
+
+def run(sizes: list[int], repeat: int) -> None:
+    as_dict, as_article = record_size()
+    print(f"🧱 Article traduit en mémoire (hors chaînes): dict {as_dict:.0f} o, "
+          f"Article {as_article:.0f} o ({1 - as_article / as_dict:.0%} de moins)")
+    print()
+    print(f"{'articles':>9}  {'chemin':<13} {'écriture':>10} {'pic mémoire':>12} {'fichier':>10} {'relecture':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for count in sizes:
+            paths = {
+                "dict + json": (lambda: dict_path(count, directory), read_dict),
+                "ndjson": (lambda: ndjson_path(count, directory, ".ndjson"), read_stream),
+                "ndjson.gz": (lambda: ndjson_path(count, directory, ".ndjson.gz"), read_stream),
+            }
+            for name, (write, read) in paths.items():
+                duration, peak = measure(write, repeat=repeat)
+                path = write()
+                read_duration, read_peak = measure(read, path, repeat=repeat)
+                assert read(path) == count
+                print(f"{count:>9}  {name:<13} {duration * 1000:8.0f}ms {peak:9.1f} Mio "
+                      f"{path.stat().st_size / 2**20:6.1f} Mio {read_duration * 1000:8.0f}ms"
+                      f"  (pic relecture {read_peak:.1f} Mio)")
+            print()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark du modèle d'article compact et de NDJSON.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Nombres d'articles, séparés par des virgules")
+    parser.add_argument("--repeat", type=int, default=3, help="Répétitions par mesure de durée")
+    args = parser.parse_args()
+    run([int(size) for size in args.sizes.split(",")], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+CyberDailyWatch - Benchmark des moteurs de parsing HTML
+Compare les moteurs de parsers.py sur la page d'accueil enregistrée de
+TheHackerNews, avec et sans arrêt anticipé après num_articles articles.
+
+La référence "bs4" correspond au code historique (arbre BeautifulSoup
+complet puis find_all/find_parent).
+
+Usage:
+    python benchmarks/bench_parsers.py [num_articles] [répétitions]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from parsers import BACKENDS, available_backends
+
+FIXTURE = Path(__file__).parent / "fixtures" / "thehackernews.html"
+
+
+def bench(func, content: str, num_articles: int, repeat: int) -> tuple[float, list]:
+    """Durée moyenne (en ms) d'un appel et résultat du dernier appel."""
+    result = func(content, num_articles)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(content, num_articles)
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def run(num_articles: int = 3, repeat: int = 50) -> None:
+    page = FIXTURE.read_text(encoding="utf-8")
+    # Variante volumineuse: les blocs d'articles répétés 10 fois (~taille réelle du site)
+    head, _, tail = page.partition('<div class="left-box">')
+    body, _, footer = tail.partition("</div></div><footer>")
+    large_page = head + '<div class="left-box">' + body * 10 + "</div></div><footer>" + footer
+
+    for label, content in (("fixture", page), ("x10", large_page)):
+        print(f"📄 Page {label} ({len(content) / 1024:.0f} Ko)")
+        reference_time, reference = bench(BACKENDS["bs4"], content, 10**6, repeat)
+        print(f"   {'bs4 (code historique)':<28} {reference_time:8.2f} ms")
+
+        for name in available_backends():
+            full_time, full = bench(BACKENDS[name], content, 10**6, repeat)
+            early_time, early = bench(BACKENDS[name], content, num_articles, repeat)
+            assert full == reference, f"{name}: résultat différent de bs4"
+            assert early == reference[:num_articles], f"{name}: arrêt anticipé incorrect"
+            print(f"   {name:<12} complet {full_time:8.2f} ms (x{reference_time / full_time:5.1f})"
+                  f" | {num_articles} articles {early_time:8.2f} ms (x{reference_time / early_time:5.1f})")
+        print()
+
+
+if __name__ == "__main__":
+    run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 3,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    )
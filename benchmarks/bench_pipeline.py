@@ -0,0 +1,231 @@
+"""
+CyberDailyWatch - Benchmark de bout en bout du pipeline (hors ligne)
+Mesure la durée et le débit de chaque étape pour des briefings de 3 à
+1000 articles, sans aucun accès réseau.
+
+    - scrape_hackernews: page d'accueil enregistrée (fixtures/), agrandie
+      au nombre d'articles voulu et servie par un FixtureServer local
+    - translate_articles_to_french / generate_radio_script: vrai client
+      OpenAI redirigé vers un endpoint local simulé (latence et taux
+      d'erreur réglables), Gemini remplacé par un FakeProvider
+    - generate_audio: TTS de substitution produisant des trames MP3 valides
+    - save_data_json: écriture réelle dans un dossier temporaire
+
+Les caches (HTTP, traduction, audio) sont désactivés ou vidés à chaque
+run pour mesurer le travail complet. Les résultats sont enregistrés en
+JSON (benchmarks/results/) et peuvent être comparés à un run précédent.
+
+Usage:
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --sizes 3,30,300 --repeat 5 --llm-latency 0.2
+    python benchmarks/bench_pipeline.py --compare benchmarks/results/pipeline-20260101-120000.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Tout le trafic local doit contourner un éventuel proxy
+# (avant les imports: ai_providers lit sa configuration à l'import)
+os.environ["NO_PROXY"] = os.environ["no_proxy"] = "127.0.0.1,localhost"
+os.environ["OPENAI_API_KEY"] = "sk-benchmark"
+os.environ["AI_PROVIDER_CHAIN"] = "openai,gemini"
+
+from fake_services import (
+    FakeOpenAIServer, FakeProvider, fake_completion, homepage_html, make_fake_synthesize_stream
+)
+from fixture_server import FixtureServer
+
+import ai_providers
+import audio_gen
+import main
+import outputs
+import scraper
+import translation_cache
+from metrics import METRICS
+from parsers import parse_hackernews_html
+from sources import register_source
+
+RESULTS_DIR = Path(__file__).parent / "results"
+DEFAULT_SIZES = [3, 10, 30, 100, 300, 1000]
+STAGES = {
+    "scrape_hackernews": "scraping",
+    "translate_articles_to_french": "traduction",
+    "generate_radio_script": "script",
+    "generate_audio": "audio",
+    "save_data_json": "sauvegarde",
+}
+
+
+def configure(workdir: Path, llm_latency: float, tts_latency: float, mode: str) -> None:
+    """Redirige le pipeline vers les services simulés et un dossier temporaire."""
+    scraper.USE_HTTP_CACHE = False
+    audio_gen.USE_AUDIO_CACHE = False
+    audio_gen.synthesize_stream = make_fake_synthesize_stream(tts_latency)
+    main.TRANSLATION_MODE = mode
+    main.PUBLIC_DIR = workdir
+    main.AUDIO_DIR = workdir / "audio"
+    main.DATA_FILE = workdir / "data.json"
+    outputs.OUTPUTS_ROOT = workdir
+    outputs.OUTPUTS_MANIFEST = workdir / ".cache" / "outputs_manifest.json"
+    ai_providers.register_provider(FakeProvider(
+        "gemini", model=ai_providers.GEMINI_MODEL, latency=llm_latency,
+        response=fake_completion
+    ))
+    main.get_ai_provider()
+
+
+def run_once(num_articles: int) -> dict:
+    """Un passage complet; retourne les durées par étape et les mesures détaillées."""
+    translation_cache._cache = translation_cache.TranslationCache(":memory:")
+    METRICS.reset()
+    durations = {}
+
+    def timed(stage: str, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        durations[stage] = time.perf_counter() - start
+        return result
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        news = timed("scrape_hackernews", scraper.scrape_hackernews, num_articles)
+        assert len(news) == num_articles, f"{len(news)} articles au lieu de {num_articles}"
+        news = timed("translate_articles_to_french", main.translate_articles_to_french, news)
+        assert all(article["title_fr"].startswith("[FR]") for article in news), "Traductions manquantes"
+        script = timed("generate_radio_script", main.generate_radio_script, news)
+        main.AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+        audio = timed("generate_audio", audio_gen.generate_audio_sync, script,
+                      main.AUDIO_DIR / "latest_briefing.mp3")
+        timed("save_data_json", main.save_data_json, news, script)
+
+    calls = {
+        summary["name"].removesuffix("_seconds"): {
+            "count": summary["count"],
+            "mean": summary["sum"] / summary["count"],
+            "max": summary["max"]
+        }
+        for summary in METRICS.snapshot()["summaries"]
+        if summary["name"] in ("http_request_seconds", "ai_request_seconds", "tts_segment_seconds")
+    }
+    return {
+        "stages": durations,
+        "end_to_end": sum(durations.values()),
+        "calls": calls,
+        "audio_bytes": Path(audio).stat().st_size,
+        "data_json_bytes": main.DATA_FILE.stat().st_size
+    }
+
+
+def summarize(num_articles: int, runs: list[dict]) -> dict:
+    """Médiane, minimum et débit (articles/s) de chaque étape sur les répétitions."""
+    def stats(values: list[float]) -> dict:
+        median = statistics.median(values)
+        return {"median": round(median, 5), "min": round(min(values), 5),
+                "max": round(max(values), 5),
+                "articles_per_second": round(num_articles / median, 2) if median else None}
+
+    return {
+        "articles": num_articles,
+        "stages": {stage: stats([run["stages"][stage] for run in runs]) for stage in STAGES},
+        "end_to_end": stats([run["end_to_end"] for run in runs]),
+        "calls": runs[-1]["calls"],
+        "audio_bytes": runs[-1]["audio_bytes"],
+        "data_json_bytes": runs[-1]["data_json_bytes"]
+    }
+
+
+def print_result(result: dict) -> None:
+    print(f"📰 {result['articles']} articles: {result['end_to_end']['median']:.2f}s "
+          f"({result['end_to_end']['articles_per_second']} articles/s)")
+    for stage, stats in result["stages"].items():
+        print(f"   {stage:<30} médiane {stats['median']:8.3f}s | min {stats['min']:8.3f}s "
+              f"| {stats['articles_per_second']} articles/s")
+    for name, call in result["calls"].items():
+        print(f"   ↳ {name:<28} {call['count']:5d} appels | moyenne {call['mean']:.3f}s | max {call['max']:.3f}s")
+
+
+def compare(current: dict, previous_path: Path) -> None:
+    """Affiche l'évolution des médianes par rapport à un run enregistré."""
+    previous = json.loads(previous_path.read_text(encoding="utf-8"))
+    before = {result["articles"]: result for result in previous["results"]}
+    print()
+    print(f"📊 Comparaison avec {previous_path.name} (durée actuelle / précédente)")
+    for result in current["results"]:
+        old = before.get(result["articles"])
+        if old is None:
+            continue
+        ratios = [
+            f"{label} x{result['stages'][stage]['median'] / old['stages'][stage]['median']:.2f}"
+            for stage, label in STAGES.items() if old["stages"].get(stage, {}).get("median")
+        ]
+        total = result["end_to_end"]["median"] / old["end_to_end"]["median"]
+        print(f"   {result['articles']:>5} articles: total x{total:.2f} | " + " | ".join(ratios))
+
+
+def main_cli() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark hors ligne du pipeline complet.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Nombres d'articles, séparés par des virgules")
+    parser.add_argument("--repeat", type=int, default=3, help="Répétitions par taille")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="Latence des providers IA (s)")
+    parser.add_argument("--llm-error-rate", type=float, default=0.0, help="Taux d'erreur de l'endpoint OpenAI")
+    parser.add_argument("--tts-latency", type=float, default=0.05, help="Latence par segment TTS (s)")
+    parser.add_argument("--http-latency", type=float, default=0.0, help="Latence du serveur de fixtures (s)")
+    parser.add_argument("--mode", choices=["parallel", "batch"], default=main.TRANSLATION_MODE,
+                        help="Mode de traduction")
+    parser.add_argument("--output", type=Path, help="Fichier de résultats (défaut: benchmarks/results/)")
+    parser.add_argument("--compare", type=Path, help="Résultats d'un run précédent à comparer")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    with tempfile.TemporaryDirectory() as tmp, \
+         FixtureServer(root=Path(tmp), latency=args.http_latency) as fixtures, \
+         FakeOpenAIServer(args.llm_latency, args.llm_error_rate) as llm:
+        os.environ["OPENAI_BASE_URL"] = llm.base_url
+        configure(Path(tmp) / "public", args.llm_latency, args.tts_latency, args.mode)
+
+        results = []
+        for size in sizes:
+            page = f"thehackernews-{size}.html"
+            (Path(tmp) / page).write_text(homepage_html(size), encoding="utf-8")
+            register_source("thehackernews", fixtures.url(page), parse_hackernews_html)
+            result = summarize(size, [run_once(size) for _ in range(args.repeat)])
+            results.append(result)
+            print_result(result)
+
+        llm_stats = {"requests": llm.requests, "errors": llm.errors}
+
+    report = {
+        "version": 1,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": {"python": platform.python_version(), "platform": platform.platform(),
+                        "cpus": os.cpu_count()},
+        "config": {"sizes": sizes, "repeat": args.repeat, "llm_latency": args.llm_latency,
+                   "llm_error_rate": args.llm_error_rate, "tts_latency": args.tts_latency,
+                   "http_latency": args.http_latency, "translation_mode": args.mode},
+        "fake_openai": llm_stats,
+        "results": results
+    }
+    output = args.output or RESULTS_DIR / f"pipeline-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print()
+    print(f"💾 Résultats enregistrés: {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,54 @@
+"""
+CyberDailyWatch - Benchmark du scraper multi-sources
+Compare le téléchargement séquentiel et concurrent de plusieurs sources
+servies localement avec une latence artificielle.
+
+Usage:
+    python benchmarks/bench_scraper.py [latence_en_secondes]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fixture_server import FixtureServer
+from sources import Source, parse_feed, parse_hackernews_html
+import scraper
+
+
+def run(latency: float = 0.5) -> None:
+    # Mesurer les téléchargements réels, sans requêtes conditionnelles
+    scraper.USE_HTTP_CACHE = False
+
+    # Un serveur par source pour simuler des hôtes distincts
+    with FixtureServer(latency=latency) as thn, \
+         FixtureServer(latency=latency) as bleeping, \
+         FixtureServer(latency=latency) as krebs:
+        sources = [
+            Source("thehackernews", thn.url("thehackernews.html"), parse_hackernews_html),
+            Source("bleepingcomputer", bleeping.url("feed_rss.xml"), parse_feed),
+            Source("krebsonsecurity", krebs.url("feed_atom.xml"), parse_feed),
+        ]
+
+        start = time.perf_counter()
+        sequential = scraper.scrape_sources(sources, 5, max_workers=1)
+        sequential_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        concurrent = scraper.scrape_sources(sources, 5)
+        concurrent_time = time.perf_counter() - start
+
+    assert sequential == concurrent, "Les deux modes doivent produire la même liste"
+    titles = [article["title"] for article in concurrent]
+    assert len(titles) == len(set(titles)), "Doublons dans la liste fusionnée"
+
+    print(f"📡 {len(sources)} sources, latence {latency:.2f}s par requête")
+    print(f"   Séquentiel : {sequential_time:.2f}s")
+    print(f"   Concurrent : {concurrent_time:.2f}s")
+    print(f"   ✓ {len(concurrent)} articles fusionnés et dédupliqués")
+
+
+if __name__ == "__main__":
+    run(float(sys.argv[1]) if len(sys.argv) > 1 else 0.5)
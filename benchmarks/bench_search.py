@@ -0,0 +1,111 @@
+"""
+CyberDailyWatch - Benchmark de l'index de recherche
+Construit l'index de search_index.py sur une archive synthétique
+(100 000 articles par défaut), puis mesure l'écriture, le rechargement,
+l'ajout incrémental d'un run et la latence des requêtes. Les résultats
+sont comparés à un parcours linéaire de l'archive.
+
+Usage:
+    python benchmarks/bench_search.py [nombre_d_articles]
+"""
+
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from search_index import SearchIndex, query_terms, tokenize
+
+WORDS = (
+    "attack breach botnet campaign cloud credential data driver espionage exploit "
+    "firmware hackers infostealer kernel leak loader malware patch phishing router "
+    "server supply-chain vulnerability windows zero-day attaque correctif fuite "
+    "logiciel malveillant rançongiciel serveur vulnérabilité chercheurs pirates"
+).split()
+FAMILIES = ["LockBit", "BlackCat", "Akira", "Cl0p", "Play", "Osiris", "Qilin", "RansomHub"]
+VENDORS = ["Microsoft", "Cisco", "Fortinet", "Ivanti", "Palo Alto", "VMware", "Citrix"]
+
+
+def synthetic_articles(count: int, seed: int = 42) -> list[dict]:
+    rng = random.Random(seed)
+    articles = []
+    for i in range(count):
+        cve = f"CVE-{rng.randint(2019, 2026)}-{rng.randint(1000, 49999)}"
+        family, vendor = rng.choice(FAMILIES), rng.choice(VENDORS)
+        words = " ".join(rng.choices(WORDS, k=25))
+        articles.append({
+            "url": f"https://example.com/{i}",
+            "title": f"{vendor} {rng.choice(WORDS)} {cve}",
+            "summary": f"{family} {words}",
+            "title_fr": f"{vendor} corrige la {cve}",
+            "summary_fr": f"Le groupe {family} {words}"
+        })
+    return articles
+
+
+def linear_scan(articles: list[dict], query: str) -> list[str]:
+    """Référence: recherche par parcours de tous les articles."""
+    terms = query_terms(query)
+    results = []
+    for article in reversed(articles):
+        tokens = set(tokenize(" ".join(article[k] for k in ("title", "summary", "title_fr", "summary_fr"))))
+        if all(term in tokens or (parts := tokenize(term)[1:]) and set(parts) <= tokens for term in terms):
+            results.append(article["url"])
+    return results
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def run(count: int = 100_000) -> None:
+    articles = synthetic_articles(count)
+    queries = ["LockBit", "CVE-2024", articles[count // 2]["title"].split()[-1], "Akira fortinet",
+               "rançongiciel zero-day", "inexistant"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp) / "search"
+        index = SearchIndex(directory)
+        days = [articles[i:i + 1000] for i in range(0, count, 1000)]
+        build_time = 0.0
+        for day, batch in enumerate(days):
+            duration, _ = timed(index.add_articles, batch, f"2026-01-{day % 28 + 1:02d}")
+            build_time += duration
+        save_time, _ = timed(index.save)
+        size = sum(p.stat().st_size for p in directory.rglob("*.json"))
+        print(f"🔎 {count} articles, {index.stats()['terms']} termes")
+        print(f"   Construction {build_time:6.2f}s | écriture {save_time:6.2f}s | {size / 1024 / 1024:.1f} Mo")
+
+        load_time, index = timed(SearchIndex, directory)
+        print(f"   Rechargement {load_time:6.2f}s")
+
+        # Ajout incrémental d'un run (3 articles): seuls quelques fichiers changent
+        before = {p: p.stat().st_mtime_ns for p in directory.rglob("*.json")}
+        new = synthetic_articles(3, seed=7)
+        for i, article in enumerate(new):
+            article["url"] = f"https://example.com/new/{i}"
+        add_time, _ = timed(lambda: (index.add_articles(new, "2026-02-01"), index.save()))
+        changed = sum(1 for p, mtime in before.items() if p.stat().st_mtime_ns != mtime)
+        print(f"   Ajout d'un run {add_time * 1000:6.1f} ms | {changed}/{len(before)} fichiers réécrits")
+        print()
+
+        for query in queries:
+            latencies = []
+            for _ in range(20):
+                duration, found = timed(index.search, query, 10**9)
+                latencies.append(duration * 1000)
+            scan_time, expected = timed(linear_scan, articles, query)
+            found_urls = [doc["url"] for doc in found if "/new/" not in doc["url"]]
+            assert found_urls == expected, f"{query}: résultats différents du parcours linéaire"
+            print(f"   {query!r:<26} {len(found):6d} résultats | index {statistics.median(latencies):7.2f} ms"
+                  f" | parcours {scan_time * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,94 @@
+"""
+CyberDailyWatch - Benchmark du temps de démarrage
+Mesure le temps d'import de chaque sous-commande de cli.py avec
+`python -X importtime`, et vérifie qu'aucune ne charge un module lourd
+dont elle n'a pas besoin (SDK IA, edge-tts, BeautifulSoup, NumPy...).
+
+Chaque mesure est faite dans un nouvel interpréteur (médiane de
+plusieurs essais). Le script échoue (code de sortie 1) si un module
+interdit est chargé ou si un temps dépasse le budget --max-ms: il peut
+servir de garde-fou contre les régressions.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 5] [--max-ms 400] [--output startup.json]
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from cli import COMMAND_MODULES
+
+# Modules chargés au plus tôt au premier appel, jamais au démarrage
+LAZY_MODULES = ["openai", "google.generativeai", "edge_tts", "aiohttp", "bs4", "numpy"]
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def measure(command: str | None) -> dict:
+    """Temps d'import (µs) de cli.py puis des modules d'une sous-commande."""
+    code = "import cli" + (f"; cli.load({command!r})" if command else "")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=SRC_DIR, capture_output=True, text=True, check=True)
+    total = 0
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        modules[name] = cumulative
+        if indent == 1:
+            total += cumulative
+    return {"total_us": total, "modules": modules}
+
+
+def run(repeat: int, max_ms: float | None) -> tuple[dict, list[str]]:
+    report, problems = {}, []
+    for command in [None, *COMMAND_MODULES]:
+        label = command or "cli"
+        samples = [measure(command) for _ in range(repeat)]
+        total_ms = statistics.median(s["total_us"] for s in samples) / 1000
+        modules = samples[-1]["modules"]
+        slowest = sorted(((us, name) for name, us in modules.items() if "." not in name), reverse=True)[:5]
+        report[label] = {"import_ms": round(total_ms, 1), "modules": len(modules),
+                         "slowest": {name: round(us / 1000, 1) for us, name in slowest}}
+        print(f"   {label:<10} {total_ms:7.1f} ms  ({len(modules)} modules; "
+              + ", ".join(f"{name} {us / 1000:.0f}ms" for us, name in slowest[:3]) + ")")
+
+        loaded = [name for name in LAZY_MODULES if name in modules]
+        if loaded:
+            problems.append(f"{label}: modules chargés au démarrage: {', '.join(loaded)}")
+        if max_ms is not None and total_ms > max_ms:
+            problems.append(f"{label}: {total_ms:.0f} ms > budget de {max_ms:.0f} ms")
+    return report, problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Temps d'import des sous-commandes de cli.py.")
+    parser.add_argument("--repeat", type=int, default=5, help="Essais par sous-commande")
+    parser.add_argument("--max-ms", type=float, help="Budget maximal par sous-commande (ms)")
+    parser.add_argument("--output", type=Path, help="Fichier JSON des résultats")
+    args = parser.parse_args()
+
+    print(f"🚀 Temps d'import (médiane de {args.repeat} essais, python -X importtime)")
+    report, problems = run(args.repeat, args.max_ms)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"💾 Résultats enregistrés: {args.output}")
+    for problem in problems:
+        print(f"   ❌ {problem}")
+    if problems:
+        sys.exit(1)
+    print("   ✓ Aucun module lourd chargé au démarrage")
+
+
+if __name__ == "__main__":
+    main()
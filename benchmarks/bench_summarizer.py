@@ -0,0 +1,109 @@
+"""
+CyberDailyWatch - Benchmark du résumé extractif
+Mesure, sur un corpus de pages d'articles enregistrées, l'extraction du
+corps (parsers.parse_article_body) et le résumé local (summarizer.py):
+durée par article avec NumPy et en pur Python, pour chaque méthode, et
+réduction du nombre de tokens envoyés à l'IA.
+
+Les articles sont aussi concaténés (x4, x16...) pour mesurer le
+comportement sur des textes longs, où la notation vectorisée fait la
+différence.
+
+Usage:
+    python benchmarks/bench_summarizer.py
+    python benchmarks/bench_summarizer.py --corpus pages/ --scales 1,8,32 --repeat 20
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import summarizer
+from parsers import parse_article_body
+from token_budget import count_tokens
+
+CORPUS_DIR = Path(__file__).parent / "fixtures" / "articles"
+METHODS = ("textrank", "tfidf")
+
+
+def timed(func, *args, repeat: int) -> tuple[float, object]:
+    """Durée médiane (en ms) d'un appel et résultat du dernier appel."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations) * 1000, result
+
+
+def engines() -> list[tuple[str, bool]]:
+    available = [("python", False)]
+    if summarizer._numpy() is not None:
+        available.insert(0, ("numpy", True))
+    else:
+        print("⚠️ NumPy non installé: seul le calcul en pur Python est mesuré")
+    return available
+
+
+def run(corpus: Path, scales: list[int], repeat: int) -> None:
+    pages = sorted(corpus.glob("*.html"))
+    if not pages:
+        raise SystemExit(f"❌ Aucune page .html dans {corpus}")
+
+    print(f"📄 Corpus: {len(pages)} pages ({corpus})")
+    bodies = []
+    parse_total = 0.0
+    for page in pages:
+        html = page.read_text(encoding="utf-8", errors="replace")
+        duration, body = timed(parse_article_body, html, repeat=repeat)
+        parse_total += duration
+        if body:
+            bodies.append(body)
+    print(f"   Extraction du corps: {parse_total / len(pages):.2f} ms/page, "
+          f"{len(bodies)} corps extraits")
+
+    body_tokens = sum(count_tokens(body) for body in bodies)
+    summary_tokens = sum(count_tokens(summarizer.summarize(body)) for body in bodies)
+    print(f"   Tokens: {body_tokens} (texte complet) → {summary_tokens} "
+          f"(résumés de {summarizer.SUMMARY_SENTENCES} phrases), x{body_tokens / max(1, summary_tokens):.1f}")
+    print()
+
+    for scale in scales:
+        texts = bodies if scale == 1 else ["\n\n".join(bodies * scale)]
+        sentences = sum(len(summarizer.split_sentences(text)) for text in texts)
+        label = "articles du corpus" if scale == 1 else f"corpus concaténé x{scale}"
+        print(f"✂️ {label} ({len(texts)} textes, {sentences} phrases)")
+        for method in METHODS:
+            reference = None
+            times = {}
+            for engine, use_numpy in engines():
+                summarizer.USE_NUMPY = use_numpy
+                duration, summaries = timed(lambda: [summarizer.summarize(text, method=method) for text in texts],
+                                            repeat=repeat)
+                times[engine] = duration / len(texts)
+                if reference is None:
+                    reference = summaries
+                elif summaries != reference:
+                    print(f"   ⚠️ {method}: résumés différents entre les moteurs")
+            summarizer.USE_NUMPY = True
+            speedup = f" (x{times['python'] / times['numpy']:.1f})" if "numpy" in times else ""
+            print(f"   {method:<9} " + " | ".join(f"{engine} {ms:8.2f} ms/texte" for engine, ms in times.items())
+                  + speedup)
+        print()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark du résumé extractif local.")
+    parser.add_argument("--corpus", type=Path, default=CORPUS_DIR, help="Dossier des pages d'articles (.html)")
+    parser.add_argument("--scales", default="1,4,16", help="Facteurs de concaténation, séparés par des virgules")
+    parser.add_argument("--repeat", type=int, default=10, help="Répétitions par mesure")
+    args = parser.parse_args()
+    run(args.corpus, [int(scale) for scale in args.scales.split(",")], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""
+CyberDailyWatch - Services simulés pour les benchmarks hors ligne
+Remplace les dépendances réseau du pipeline par des équivalents locaux.
+
+    - homepage_html(): page d'accueil TheHackerNews de N articles, construite
+      en répétant les articles de la page enregistrée (fixtures/)
+    - FakeOpenAIServer: endpoint local compatible avec l'API OpenAI
+      (/v1/chat/completions), avec latence et taux d'erreur réglables;
+      le vrai client AsyncOpenAI y est redirigé via OPENAI_BASE_URL
+    - fake_completion(): réponses plausibles aux prompts du pipeline
+      (traduction JSON, traduction groupée, script radio)
+    - FakeProvider: provider IA local (latence, erreurs et réponses
+      réglables), qui remplace notamment Gemini (son SDK ne peut pas
+      être redirigé vers un serveur local)
+    - make_fake_synthesize_stream(): TTS de substitution qui produit des trames
+      MP3 valides (silence), en durée proportionnelle au texte
+
+Exemple d'utilisation:
+    >>> with FakeOpenAIServer(latency=0.05) as server:
+    ...     os.environ["OPENAI_BASE_URL"] = server.base_url
+"""
+
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import AsyncIterator
+
+from ai_providers import AIProvider
+from fixture_server import FIXTURES_DIR
+
+POST_RE = re.compile(r'<div class="body-post clear">.*?</a>\s*</div>', re.S)
+
+
+# =============================================================================
+# PAGE D'ACCUEIL
+# =============================================================================
+
+def homepage_html(num_articles: int, fixture: Path = FIXTURES_DIR / "thehackernews.html") -> str:
+    """
+    Page d'accueil de num_articles articles.
+
+    Les articles de la page enregistrée sont répétés; à partir du
+    deuxième passage, titres et URLs sont numérotés pour rester uniques.
+    """
+    html = fixture.read_text(encoding="utf-8")
+    posts = POST_RE.findall(html)
+    start, end = html.index(posts[0]), html.index(posts[-1]) + len(posts[-1])
+    generated = []
+    for i in range(num_articles):
+        post = posts[i % len(posts)]
+        copy = i // len(posts)
+        if copy:
+            post = re.sub(r'(href="[^"]+?)(\.html")', rf'\1-{copy}\2', post)
+            post = re.sub(r"(</h2>)", rf" #{copy}\1", post)
+        generated.append(post)
+    return html[:start] + "\n".join(generated) + html[end:]
+
+
+# =============================================================================
+# RÉPONSES IA
+# =============================================================================
+
+SCRIPT_WORDS = ("Bonjour et bienvenue dans votre Flash Info Cyber. Aujourd'hui, les équipes de "
+                "sécurité font face à de nouvelles vulnérabilités critiques, des campagnes de "
+                "rançongiciels et des correctifs urgents à déployer sans attendre.").split()
+
+
+def _field(prompt: str, name: str) -> list[str]:
+    return re.findall(rf"^{name}: (.*)$", prompt, re.M)
+
+
+def fake_completion(system_prompt: str, user_prompt: str, json_mode: bool) -> str:
+    """Réponse plausible à un prompt du pipeline (traduction ou script)."""
+    titles, summaries = _field(user_prompt, "TITLE"), _field(user_prompt, "SUMMARY")
+    if json_mode and titles:
+        return json.dumps({"titre": f"[FR] {titles[0]}", "resume": f"[FR] {summaries[0]}"},
+                          ensure_ascii=False)
+    if titles:
+        return "\n\n".join(
+            f"[ARTICLE {i + 1}]\nTITRE: [FR] {title}\nRESUME: [FR] {summary}"
+            for i, (title, summary) in enumerate(zip(titles, summaries))
+        )
+    words = [SCRIPT_WORDS[i % len(SCRIPT_WORDS)] for i in range(170)]
+    return " ".join(words) + "."
+
+
+# =============================================================================
+# PROVIDER IA
+# =============================================================================
+
+class FakeProvider(AIProvider):
+    """
+    Provider IA local pour les tests et benchmarks (aucun appel réseau).
+
+    Args:
+        name: Nom sous lequel le provider est enregistré
+        latency: Latence simulée (en secondes)
+        error_rate: Probabilité d'échec d'un appel (0-1)
+        quota_error: Les échecs simulent une erreur de quota
+        response: Fonction (system_prompt, user_prompt, json_mode) -> texte
+                  (défaut: réponse fixe)
+    """
+
+    def __init__(self, name: str = "fake", model: str = "fake-model", latency: float = 0.0,
+                 error_rate: float = 0.0, quota_error: bool = False, response=None):
+        super().__init__(model)
+        self.name = name
+        self.latency = latency
+        self.error_rate = error_rate
+        self.quota_error = quota_error
+        self.response = response
+        self.calls = 0
+
+    def is_configured(self) -> bool:
+        return True
+
+    def _create_client(self):
+        return object()
+
+    async def _complete(self, system_prompt, user_prompt, temperature, max_tokens, json_mode):
+        self.get_client()
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if random.random() < self.error_rate:
+            raise RuntimeError("insufficient_quota" if self.quota_error else f"{self.name}: erreur simulée")
+        if self.response is not None:
+            return self.response(system_prompt, user_prompt, json_mode)
+        return '{"titre": "Titre", "resume": "Résumé"}' if json_mode else f"Réponse de {self.name}"
+
+
+# =============================================================================
+# ENDPOINT OPENAI
+# =============================================================================
+
+class FakeOpenAIServer:
+    """
+    Serveur local répondant aux requêtes /v1/chat/completions.
+
+    Args:
+        latency: Délai avant chaque réponse (en secondes)
+        error_rate: Probabilité de répondre par une erreur 500 (0-1)
+        seed: Graine du tirage des erreurs (résultats reproductibles)
+    """
+
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0, seed: int = 42):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.requests = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                with server._lock:
+                    server.requests += 1
+                    failed = server._random.random() < server.error_rate
+                    server.errors += failed
+                if server.latency:
+                    time.sleep(server.latency)
+                if failed or not self.path.endswith("/chat/completions"):
+                    self._send(500 if failed else 404,
+                               {"error": {"message": "erreur simulée", "type": "server_error"}})
+                    return
+
+                messages = {m["role"]: m["content"] for m in body.get("messages", [])}
+                json_mode = (body.get("response_format") or {}).get("type") == "json_object"
+                text = fake_completion(messages.get("system", ""), messages.get("user", ""), json_mode)
+                prompt_tokens = sum(len(m) for m in messages.values()) // 4
+                self._send(200, {
+                    "id": "chatcmpl-fake",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": body.get("model", "fake"),
+                    "choices": [{"index": 0, "finish_reason": "stop",
+                                 "message": {"role": "assistant", "content": text}}],
+                    "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": len(text) // 4,
+                              "total_tokens": prompt_tokens + len(text) // 4}
+                })
+
+            def _send(self, status: int, payload: dict) -> None:
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def __enter__(self) -> "FakeOpenAIServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+# =============================================================================
+# SYNTHÈSE VOCALE
+# =============================================================================
+
+# Trame MPEG-1 Layer III, 128 kbit/s, 44.1 kHz, mono: 417 octets, 26 ms de son
+MP3_FRAME = bytes([0xFF, 0xFB, 0x90, 0xC0]) + bytes(413)
+FRAME_DURATION = 1152 / 44100
+
+# Débit de lecture simulé (caractères par seconde de son)
+CHARS_PER_SECOND = 15
+
+
+def make_fake_synthesize_stream(latency: float = 0.0, frames_per_chunk: int = 32):
+    """
+    Crée un remplaçant de audio_gen.synthesize_stream.
+
+    Args:
+        latency: Délai avant le premier bloc d'un segment (en secondes)
+        frames_per_chunk: Nombre de trames MP3 par bloc produit
+    """
+    async def fake_synthesize_stream(text: str, voice: str = "", rate: str = "",
+                                     pitch: str = "") -> AsyncIterator[bytes]:
+        await asyncio.sleep(latency)
+        frames = max(1, round(len(text) / CHARS_PER_SECOND / FRAME_DURATION))
+        for start in range(0, frames, frames_per_chunk):
+            yield MP3_FRAME * min(frames_per_chunk, frames - start)
+            await asyncio.sleep(0)
+
+    return fake_synthesize_stream
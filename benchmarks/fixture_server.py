@@ -0,0 +1,97 @@
+"""
+CyberDailyWatch - Serveur HTTP de substitution
+Sert les fixtures locales (HTML, flux RSS/Atom) pour exercer le scraper
+sans connexion internet.
+
+Chaque instance écoute sur son propre port, ce qui permet de simuler
+plusieurs hôtes distincts. Une latence artificielle peut être ajoutée
+pour mesurer l'effet du téléchargement concurrent. Les réponses portent
+un ETag et un Last-Modified, et les requêtes conditionnelles reçoivent
+un 304.
+
+Exemple d'utilisation:
+    >>> with FixtureServer(latency=0.5) as server:
+    ...     url = server.url("thehackernews.html")
+"""
+
+import hashlib
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Dossier des fixtures
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Types MIME selon l'extension
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".xml": "application/xml; charset=utf-8",
+    ".json": "application/json",
+}
+
+
+class FixtureServer:
+    """
+    Serveur HTTP local servant un dossier de fixtures.
+
+    Args:
+        root: Dossier servi (défaut: benchmarks/fixtures)
+        latency: Délai ajouté avant chaque réponse (en secondes)
+    """
+
+    def __init__(self, root: Path = FIXTURES_DIR, latency: float = 0.0):
+        self.root = Path(root)
+        self.latency = latency
+        self.requests = 0
+        self.not_modified = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # HTTP/1.1 pour permettre le keep-alive côté client
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                path = (server.root / self.path.lstrip("/").split("?")[0]).resolve()
+                if server.root.resolve() not in path.parents or not path.is_file():
+                    self.send_error(404)
+                    return
+                body = path.read_bytes()
+                etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    server.not_modified += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", formatdate(path.stat().st_mtime, usegmt=True))
+                self.send_header("Content-Type", CONTENT_TYPES.get(path.suffix, "application/octet-stream"))
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def url(self, name: str) -> str:
+        """URL complète d'une fixture servie par cette instance."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/{name}"
+
+    def __enter__(self) -> "FixtureServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -501,6 +501,92 @@ function renderContact() {
 // 📰 CYBER NEWS RENDERING
 // ========================================
 
+// Textes et URLs des articles (sites tiers, saisie de l'utilisateur)
+// insérés dans du HTML : jamais interprétés comme balises
+function escapeHtml(text) {
+    return String(text ?? '').replace(/[&<>"']/g, char => ({
+        '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+    })[char]);
+}
+
+function safeUrl(url) {
+    return /^https?:\/\//i.test(url || '') ? escapeHtml(url) : '#';
+}
+
+function renderNewsItems(newsGrid, articles) {
+    newsGrid.innerHTML = articles.map((article, index) => `
+        <article class="cyber-news-item reveal" style="transition-delay: ${index * 0.1}s">
+            <span class="news-item-index">[${String(index + 1).padStart(2, '0')}]</span>
+            <h3 class="news-item-title">
+                <a href="${safeUrl(article.url)}" target="_blank" rel="noopener noreferrer">
+                    ${escapeHtml(article.title)}
+                </a>
+            </h3>
+            <p class="news-item-summary">${escapeHtml(article.summary)}</p>
+            <a href="${safeUrl(article.url)}" target="_blank" rel="noopener noreferrer" class="news-item-link">
+                <i class="fas fa-external-link-alt"></i> Lire l'article
+            </a>
+        </article>
+    `).join('');
+
+    // Re-init reveal animations
+    initScrollReveal();
+}
+
+// Lecture progressive de la playlist HLS (segments MP3, voir src/outputs.py)
+// via MediaSource, pour les navigateurs sans lecture HLS native: la lecture
+// démarre dès le premier segment ajouté au lieu d'attendre tout le MP3
+function playAudioSegments(audioPlayer, playlistUrl, fallbackUrl) {
+    const mediaSource = new MediaSource();
+    const useFallback = (error) => {
+        console.warn('🔊 [CyberPulse] Lecture segmentée impossible, MP3 complet:', error);
+        audioPlayer.src = fallbackUrl;
+        audioPlayer.load();
+    };
+
+    mediaSource.addEventListener('sourceopen', async () => {
+        URL.revokeObjectURL(audioPlayer.src);
+        try {
+            const response = await fetch(playlistUrl);
+            if (!response.ok) throw new Error(`Playlist: HTTP ${response.status}`);
+            const base = new URL(playlistUrl, window.location.href);
+            const segments = (await response.text()).split('\n')
+                .map(line => line.trim())
+                .filter(line => line && !line.startsWith('#'))
+                .map(line => new URL(line, base).href);
+            if (!segments.length) throw new Error('Playlist vide');
+
+            const sourceBuffer = mediaSource.addSourceBuffer('audio/mpeg');
+            sourceBuffer.mode = 'sequence';
+            const appended = () => new Promise((resolve, reject) => {
+                sourceBuffer.addEventListener('updateend', resolve, { once: true });
+                sourceBuffer.addEventListener('error', reject, { once: true });
+            });
+
+            // Segment suivant téléchargé pendant l'ajout du précédent
+            let next = fetch(segments[0]);
+            for (let i = 0; i < segments.length; i++) {
+                const segment = await next;
+                if (!segment.ok) throw new Error(`Segment: HTTP ${segment.status}`);
+                const data = await segment.arrayBuffer();
+                if (i + 1 < segments.length) next = fetch(segments[i + 1]);
+                const done = appended();
+                sourceBuffer.appendBuffer(data);
+                await done;
+            }
+            mediaSource.endOfStream();
+        } catch (error) {
+            useFallback(error);
+        }
+    }, { once: true });
+
+    audioPlayer.src = URL.createObjectURL(mediaSource);
+}
+
+function canPlayAudioSegments() {
+    return typeof MediaSource !== 'undefined' && MediaSource.isTypeSupported('audio/mpeg');
+}
+
 async function renderCyberNews() {
     const newsGrid = document.getElementById('cyber-news-grid');
     const audioPlayer = document.getElementById('cyber-audio-player');
@@ -512,14 +598,31 @@ async function renderCyberNews() {
     if (!newsGrid) return;
 
     try {
-        // Fetch local data.json
-        const response = await fetch('./cyber-news/data.json');
+        // Données complètes: data.min.json (minifié, précompressé), sinon data.json
+        const dataRequest = fetch('./cyber-news/data.min.json')
+            .then(response => response.ok ? response : fetch('./cyber-news/data.json'))
+            .catch(() => fetch('./cyber-news/data.json'));
+
+        // Premier affichage: titres du briefing (headlines.json, quelques centaines
+        // d'octets, voir src/outputs.py) pendant le chargement des données complètes
+        let dataLoaded = false;
+        fetch('./cyber-news/headlines.json')
+            .then(response => response.ok ? response.json() : null)
+            .then(headlines => {
+                if (!dataLoaded && headlines?.articles?.length) {
+                    renderNewsItems(newsGrid, headlines.articles);
+                }
+            })
+            .catch(() => {});
+
+        const response = await dataRequest;
 
         if (!response.ok) {
             throw new Error('Données non disponibles');
         }
 
         const data = await response.json();
+        dataLoaded = true;
 
         // DEV LOGS - Cyber Pulse Pipeline
         console.log('🛡️ [CyberPulse] Données chargées avec succès');
@@ -536,34 +639,33 @@ async function renderCyberNews() {
 
         // 🎵 FORCE AUDIO UPDATE (Cache Busting)
         if (data.audio_file && audioPlayer) {
+            // Playlist HLS (lecture dès le premier segment): lue nativement (Safari)
+            // ou segment par segment via MediaSource (Chrome, Edge, Firefox...);
+            // sinon le MP3 complet
+            const useHls = data.audio_playlist && audioPlayer.canPlayType('application/vnd.apple.mpegurl');
+            const useSegments = data.audio_playlist && !useHls && canPlayAudioSegments();
             // Construit le chemin avec un timestamp pour éviter le cache navigateur
             // data.audio_file est relatif (ex: "audio/latest_briefing.mp3")
-            const audioPath = `./cyber-news/${data.audio_file}?t=${new Date().getTime()}`;
-            console.log('🔊 [CyberPulse] Updating audio source:', audioPath);
-            
-            audioPlayer.src = audioPath;
-            audioPlayer.load(); // Force le rechargement du flux
+            const timestamp = new Date().getTime();
+            const mp3Path = `./cyber-news/${data.audio_file}?t=${timestamp}`;
+            const audioPath = data.audio_playlist ? `./cyber-news/${data.audio_playlist}?t=${timestamp}` : mp3Path;
+            console.log('🔊 [CyberPulse] Updating audio source:', useHls || useSegments ? audioPath : mp3Path);
+
+            if (useSegments) {
+                playAudioSegments(audioPlayer, audioPath, mp3Path);
+            } else {
+                audioPlayer.src = useHls ? audioPath : mp3Path;
+                audioPlayer.load(); // Force le rechargement du flux
+            }
         }
 
         // Render articles
         if (data.articles && data.articles.length > 0) {
-            newsGrid.innerHTML = data.articles.map((article, index) => `
-                <article class="cyber-news-item reveal" style="transition-delay: ${index * 0.1}s">
-                    <span class="news-item-index">[${String(index + 1).padStart(2, '0')}]</span>
-                    <h3 class="news-item-title">
-                        <a href="${article.url}" target="_blank" rel="noopener noreferrer">
-                            ${article.title_fr || article.title}
-                        </a>
-                    </h3>
-                    <p class="news-item-summary">${article.summary_fr || article.summary}</p>
-                    <a href="${article.url}" target="_blank" rel="noopener noreferrer" class="news-item-link">
-                        <i class="fas fa-external-link-alt"></i> Lire l'article
-                    </a>
-                </article>
-            `).join('');
-
-            // Re-init reveal animations
-            initScrollReveal();
+            renderNewsItems(newsGrid, data.articles.map(article => ({
+                title: article.title_fr || article.title,
+                summary: article.summary_fr || article.summary,
+                url: article.url
+            })));
         } else {
             newsGrid.innerHTML = `
                 <div class="cyber-error">
@@ -579,6 +681,16 @@ async function renderCyberNews() {
             scriptContent.textContent = data.script;
         }
 
+        // Archive (chargée page par page, à la demande)
+        if (data.archive_index) {
+            initCyberArchive(`./cyber-news/${data.archive_index}`);
+        }
+
+        // Recherche dans l'archive (index prégénéré, voir src/search_index.py)
+        if (data.search_index) {
+            initCyberSearch(`./cyber-news/${data.search_index}`);
+        }
+
     } catch (error) {
         console.error('Erreur chargement Cyber News:', error);
         newsGrid.innerHTML = `
@@ -605,6 +717,218 @@ async function renderCyberNews() {
     }
 }
 
+// ========================================
+// 🗄️ CYBER NEWS ARCHIVE
+// ========================================
+//
+// L'archive est découpée en fichiers (voir src/archive.py) :
+// - index.json : manifeste (nombre de pages, dates)
+// - pages/page-00001.json : résumés, de la plus ancienne à la plus récente
+// - days/AAAA/AAAA-MM-JJ.json : briefings complets d'un jour
+// Seules les pages affichées sont téléchargées.
+
+async function fetchArchiveJson(url) {
+    const response = await fetch(url);
+    if (!response.ok) {
+        throw new Error(`Archive indisponible (${response.status})`);
+    }
+    return response.json();
+}
+
+function archivePagePath(base, page) {
+    return `${base}/pages/page-${String(page).padStart(5, '0')}.json`;
+}
+
+function archiveDayPath(base, date) {
+    return `${base}/days/${date.slice(0, 4)}/${date}.json`;
+}
+
+function renderArchiveEntry(entry) {
+    const date = new Date(entry.generated_at);
+    return `
+        <div class="archive-entry">
+            <span class="archive-date">${date.toLocaleDateString('fr-FR')} · ${date.toLocaleTimeString('fr-FR', { hour: '2-digit', minute: '2-digit' })}</span>
+            <ul class="archive-articles">
+                ${entry.articles.map(article => `
+                    <li><a href="${safeUrl(article.url)}" target="_blank" rel="noopener noreferrer">${escapeHtml(article[`title_${entry.edition || 'fr'}`] || article.title)}</a></li>
+                `).join('')}
+            </ul>
+        </div>
+    `;
+}
+
+async function initCyberArchive(indexUrl) {
+    const section = document.getElementById('cyber-archive-section');
+    const list = document.getElementById('cyber-archive-list');
+    const moreBtn = document.getElementById('cyber-archive-more');
+    const dateInput = document.getElementById('cyber-archive-date');
+    if (!section || !list) return;
+
+    const base = indexUrl.replace(/\/index\.json$/, '');
+    let index;
+    try {
+        index = await fetchArchiveJson(`${indexUrl}?t=${new Date().getTime()}`);
+    } catch (error) {
+        console.warn('🗄️ [CyberPulse] Archive non disponible:', error.message);
+        return;
+    }
+    if (!index.total) return;
+
+    console.log('🗄️ [CyberPulse] Archive:', index.total, 'briefings,', index.pages, 'pages');
+    section.style.display = 'block';
+
+    // Pages chargées de la plus récente à la plus ancienne
+    let nextPage = index.pages;
+
+    async function loadNextPage() {
+        if (nextPage < 1) return;
+        const page = await fetchArchiveJson(archivePagePath(base, nextPage));
+        list.insertAdjacentHTML('beforeend', page.entries.slice().reverse().map(renderArchiveEntry).join(''));
+        nextPage -= 1;
+        if (moreBtn) moreBtn.style.display = nextPage >= 1 ? 'inline-flex' : 'none';
+    }
+
+    if (moreBtn) {
+        moreBtn.addEventListener('click', () => loadNextPage().catch(error => showToast(error.message)));
+    }
+
+    if (dateInput) {
+        dateInput.min = index.first_date;
+        dateInput.max = index.last_date;
+        dateInput.addEventListener('change', async () => {
+            if (!dateInput.value) return;
+            try {
+                const day = await fetchArchiveJson(archiveDayPath(base, dateInput.value));
+                list.innerHTML = day.briefings.slice().reverse().map(renderArchiveEntry).join('');
+                if (moreBtn) moreBtn.style.display = 'none';
+            } catch (error) {
+                list.innerHTML = `<p class="archive-empty">Aucun briefing le ${dateInput.value}</p>`;
+            }
+        });
+    }
+
+    await loadNextPage();
+}
+
+// ========================================
+// 🔎 CYBER NEWS SEARCH
+// ========================================
+//
+// L'index est prégénéré par src/search_index.py :
+// - terms/NN.json : documents contenant chaque terme (écarts successifs)
+// - docs/NNNNN.json : titre, URL et date des documents
+// Une recherche ne télécharge que les fragments utiles.
+// Le découpage en termes et le hash doivent rester identiques au Python.
+
+const SEARCH_STOP_WORDS = new Set(`
+    a an and are as at be by for from has have in is it its of on or that the
+    this to was were will with au aux avec ce ces dans de des du en est et il
+    ils la le les leur mais ne par pas plus pour qu que qui se sont sur un une
+`.split(/\s+/).filter(Boolean));
+
+function searchNormalize(text) {
+    return text.toLowerCase().normalize('NFKD').replace(/[\u0300-\u036f]/g, '');
+}
+
+function searchQueryTerms(query) {
+    const terms = [];
+    for (const match of searchNormalize(query).matchAll(/[a-z0-9]+(?:[-_.][a-z0-9]+)*/g)) {
+        const token = match[0];
+        if (token.length > 1 && !SEARCH_STOP_WORDS.has(token) && !terms.includes(token)) {
+            terms.push(token);
+        }
+    }
+    return terms;
+}
+
+function searchShardOf(term, numShards) {
+    // FNV-1a 32 bits sur les octets UTF-8 du terme
+    let h = 0x811c9dc5;
+    for (const byte of new TextEncoder().encode(term)) {
+        h = Math.imul(h ^ byte, 0x01000193) >>> 0;
+    }
+    return h % numShards;
+}
+
+function decodePostings(deltas) {
+    let total = 0;
+    return deltas.map(delta => (total += delta));
+}
+
+async function initCyberSearch(indexUrl) {
+    const form = document.getElementById('cyber-search-form');
+    const input = document.getElementById('cyber-search-input');
+    const results = document.getElementById('cyber-search-results');
+    if (!form || !input || !results) return;
+
+    const base = indexUrl.replace(/\/index\.json$/, '');
+    let manifest;
+    try {
+        manifest = await fetchArchiveJson(`${indexUrl}?t=${new Date().getTime()}`);
+    } catch (error) {
+        console.warn('🔎 [CyberPulse] Index de recherche non disponible:', error.message);
+        return;
+    }
+    if (!manifest.docs) return;
+    form.style.display = 'flex';
+
+    // Fragments et blocs déjà téléchargés
+    const shards = new Map();
+    const chunks = new Map();
+    const cached = (cache, key, url) => {
+        if (!cache.has(key)) cache.set(key, fetchArchiveJson(url));
+        return cache.get(key);
+    };
+    const shard = n => cached(shards, n, `${base}/terms/${String(n).padStart(2, '0')}.json`);
+    const chunk = n => cached(chunks, n, `${base}/docs/${String(n).padStart(5, '0')}.json`);
+
+    async function postings(term) {
+        const terms = await shard(searchShardOf(term, manifest.num_shards));
+        if (terms[term]) return [decodePostings(terms[term])];
+        // Identifiant partiel ("CVE-2024") : tous ses morceaux
+        const parts = term.split(/[-_.]/).filter(part => part.length > 1 && !SEARCH_STOP_WORDS.has(part));
+        if (!parts.length || parts[0] === term) return [[]];
+        return Promise.all(parts.map(async part => {
+            const partTerms = await shard(searchShardOf(part, manifest.num_shards));
+            return decodePostings(partTerms[part] || []);
+        }));
+    }
+
+    form.addEventListener('submit', async event => {
+        event.preventDefault();
+        const terms = searchQueryTerms(input.value);
+        if (!terms.length) {
+            results.innerHTML = '';
+            return;
+        }
+        try {
+            const lists = (await Promise.all(terms.map(postings))).flat().sort((a, b) => a.length - b.length);
+            let matches = lists[0];
+            for (const ids of lists.slice(1)) {
+                const set = new Set(ids);
+                matches = matches.filter(id => set.has(id));
+            }
+            const top = matches.slice().reverse().slice(0, 20);
+            const docs = await Promise.all(top.map(async id => {
+                const docsChunk = await chunk(Math.floor(id / manifest.doc_chunk_size));
+                return docsChunk[id % manifest.doc_chunk_size];
+            }));
+            results.innerHTML = docs.length
+                ? `<p class="archive-empty">${matches.length} résultat(s)</p>` + docs.map(([title, url, date]) => `
+                    <div class="archive-entry">
+                        <span class="archive-date">${new Date(date).toLocaleDateString('fr-FR')}</span>
+                        <ul class="archive-articles">
+                            <li><a href="${safeUrl(url)}" target="_blank" rel="noopener noreferrer">${escapeHtml(title)}</a></li>
+                        </ul>
+                    </div>
+                `).join('')
+                : `<p class="archive-empty">Aucun résultat pour « ${escapeHtml(input.value)} »</p>`;
+        } catch (error) {
+            showToast(error.message);
+        }
+    });
+}
+
 // ========================================
 // 🎵 CUSTOM AUDIO PLAYER
 // ========================================
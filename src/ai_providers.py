@@ -0,0 +1,643 @@
+"""
+CyberDailyWatch - Providers IA
+Abstraction asynchrone des fournisseurs de modèles de langage.
+
+Chaque provider garde un client asynchrone unique (créé au premier
+appel puis réutilisé), au lieu de reconstruire un client à chaque
+requête. Les providers sont enregistrés dans un registre et essayés
+dans l'ordre de la chaîne de basculement AI_PROVIDER_CHAIN, avec un
+délai maximal par tentative.
+
+Chaque provider possède un disjoncteur (circuit breaker): après plusieurs
+échecs, ou immédiatement après une erreur de quota, il est ignoré
+pendant une période de refroidissement. En mode "hedged", le provider
+suivant est sollicité si le premier n'a pas répondu après AI_HEDGE_DELAY
+secondes, et la première réponse reçue est retenue.
+
+Providers supportés:
+    - openai: OpenAI (GPT-4o-mini)
+    - gemini: Google Gemini (gemini-1.5-flash)
+
+Configuration modifiable:
+    - OPENAI_MODEL / GEMINI_MODEL: Modèles utilisés
+    - AI_PROVIDER_CHAIN: Ordre de basculement (variable d'environnement
+      AI_PROVIDER_CHAIN, ex: "gemini,openai")
+    - AI_TIMEOUT: Délai maximal d'une tentative (en secondes)
+    - AI_HEDGE_DELAY: Délai avant requête de secours (variable
+      d'environnement, vide = mode hedged désactivé)
+    - AI_MAX_CONCURRENCY / AI_REQUESTS_PER_MINUTE: Limites de débit par
+      provider (variables d'environnement)
+    - CIRCUIT_*: Seuils et durées du disjoncteur
+
+Exemple d'utilisation:
+    >>> result = await complete("Tu es un assistant.", "Bonjour !")
+    >>> print(result.provider, result.text)
+"""
+
+import asyncio
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from metrics import METRICS
+from token_budget import USAGE, count_tokens
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Modèles IA utilisés
+OPENAI_MODEL = "gpt-4o-mini"
+GEMINI_MODEL = "gemini-1.5-flash"
+
+# Ordre dans lequel les providers sont essayés
+AI_PROVIDER_CHAIN = [
+    name.strip()
+    for name in os.environ.get("AI_PROVIDER_CHAIN", "openai,gemini").split(",")
+    if name.strip()
+]
+
+# Délai maximal d'une tentative avant de passer au provider suivant (en secondes)
+AI_TIMEOUT = float(os.environ.get("AI_TIMEOUT", "60"))
+
+# Mode hedged: délai après lequel le provider suivant est aussi sollicité
+# (None = désactivé, les providers sont essayés l'un après l'autre)
+AI_HEDGE_DELAY = float(os.environ["AI_HEDGE_DELAY"]) if os.environ.get("AI_HEDGE_DELAY") else None
+
+# Limites de débit par provider, communes à toutes les tâches et threads
+# du processus (utile en mode backfill): requêtes simultanées maximales
+# et requêtes par minute (0 = pas de limite)
+AI_MAX_CONCURRENCY = int(os.environ.get("AI_MAX_CONCURRENCY", "8"))
+AI_REQUESTS_PER_MINUTE = float(os.environ.get("AI_REQUESTS_PER_MINUTE", "0"))
+
+# Disjoncteur: nombre d'échecs consécutifs avant d'ignorer un provider
+CIRCUIT_FAILURE_THRESHOLD = 3
+
+# Durée pendant laquelle un provider en échec est ignoré (en secondes)
+CIRCUIT_COOLDOWN = 300
+
+# Durée pendant laquelle un provider au quota épuisé est ignoré (en secondes)
+CIRCUIT_QUOTA_COOLDOWN = 3600
+
+# Erreurs de quota: code HTTP, types d'exception des SDK, expressions du message
+QUOTA_STATUS_CODES = (429,)
+QUOTA_ERROR_TYPES = ("RateLimitError", "ResourceExhausted", "TooManyRequests")
+QUOTA_ERROR_PHRASES = ("quota", "rate limit", "rate_limit", "ratelimit", "too many requests",
+                       "resource exhausted", "resource_exhausted")
+
+
+@dataclass
+class AIResult:
+    """Réponse d'un provider: texte généré, provider, modèle et tokens consommés."""
+    text: str
+    provider: str
+    model: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+
+# =============================================================================
+# LIMITE DE DÉBIT
+# =============================================================================
+
+class RateLimiter:
+    """
+    Limite le nombre de requêtes simultanées et leur cadence.
+
+    Le compteur de cadence est partagé entre boucles d'événements et
+    threads; le sémaphore est recréé pour chaque boucle (les primitives
+    asyncio sont liées à la boucle qui les utilise).
+
+    Args:
+        max_concurrency: Requêtes simultanées maximales (par boucle)
+        requests_per_minute: Cadence maximale (0 = pas de limite)
+    """
+
+    def __init__(self, max_concurrency: int = AI_MAX_CONCURRENCY,
+                 requests_per_minute: float = AI_REQUESTS_PER_MINUTE):
+        self.max_concurrency = max_concurrency
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._semaphores: dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if loop not in self._semaphores:
+                self._semaphores = {l: sem for l, sem in self._semaphores.items() if not l.is_closed()}
+                self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+            return self._semaphores[loop]
+
+    async def _wait_slot(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        await asyncio.sleep(slot - now)
+
+    @asynccontextmanager
+    async def slot(self):
+        """Attend une place libre pour une requête."""
+        async with self._semaphore():
+            await self._wait_slot()
+            yield
+
+
+# =============================================================================
+# DISJONCTEUR
+# =============================================================================
+
+class CircuitOpenError(RuntimeError):
+    """Appel refusé par le disjoncteur (circuit ouvert ou tentative d'essai en cours)."""
+
+
+class CircuitBreaker:
+    """
+    Disjoncteur d'un provider.
+
+    États:
+        - fermé: le provider est appelé normalement
+        - ouvert: le provider est ignoré jusqu'à la fin du refroidissement
+        - semi-ouvert: après le refroidissement, une seule tentative
+          d'essai est autorisée à la fois; un succès referme le circuit,
+          un échec le rouvre
+
+    Le disjoncteur est partagé entre les tâches et les threads (boucle
+    de run_sync, backfill): ses changements d'état sont protégés par un
+    verrou.
+
+    Args:
+        failure_threshold: Échecs consécutifs avant ouverture
+        cooldown: Durée d'ouverture après des échecs (en secondes)
+        quota_cooldown: Durée d'ouverture après une erreur de quota
+    """
+
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 cooldown: float = CIRCUIT_COOLDOWN, quota_cooldown: float = CIRCUIT_QUOTA_COOLDOWN):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.quota_cooldown = quota_cooldown
+        self.failures = 0
+        self.open_until = 0.0
+        self.half_open = False
+        self.probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.open_until > time.monotonic():
+            return "open"
+        return "half_open" if self.half_open or self.open_until else "closed"
+
+    def available(self) -> bool:
+        """Indique si un appel serait autorisé maintenant (sans le réserver)."""
+        with self._lock:
+            if not self.open_until and not self.half_open:
+                return True
+            return not self.probing and time.monotonic() >= self.open_until
+
+    def acquire(self) -> str | None:
+        """
+        Réserve un appel au provider.
+
+        Returns:
+            "closed" (circuit fermé), "probe" (tentative d'essai du circuit
+            semi-ouvert, réservée à un seul appelant) ou None (appel refusé)
+        """
+        with self._lock:
+            if not self.open_until and not self.half_open:
+                return "closed"
+            if self.probing or time.monotonic() < self.open_until:
+                return None
+            # Refroidissement terminé: une seule tentative d'essai à la fois
+            self.open_until = 0.0
+            self.half_open = True
+            self.probing = True
+            return "probe"
+
+    def allow(self) -> bool:
+        """Réserve un appel au provider s'il est autorisé maintenant (voir acquire)."""
+        return self.acquire() is not None
+
+    def release(self) -> None:
+        """Abandonne la tentative d'essai sans résultat (appel annulé): un autre appelant peut la faire."""
+        with self._lock:
+            self.probing = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.open_until = 0.0
+            self.half_open = False
+            self.probing = False
+
+    def record_failure(self, quota: bool = False) -> None:
+        with self._lock:
+            self.failures += 1
+            if quota:
+                self.open_until = time.monotonic() + self.quota_cooldown
+            elif self.half_open or self.failures >= self.failure_threshold:
+                self.open_until = time.monotonic() + self.cooldown
+            self.half_open = False
+            self.probing = False
+
+
+# =============================================================================
+# PROVIDERS
+# =============================================================================
+
+class AIProvider:
+    """
+    Interface commune des providers IA.
+
+    Les sous-classes implémentent is_configured() et _complete(). Le
+    client asynchrone est créé une seule fois par boucle d'événements
+    (les clients HTTP asynchrones sont liés à la boucle qui les a créés).
+
+    _complete() retourne le texte généré, ou un tuple (texte, tokens du
+    prompt, tokens de la réponse) quand l'API indique sa consommation;
+    à défaut, elle est estimée avec token_budget.count_tokens().
+    """
+
+    name = "base"
+
+    def __init__(self, model: str):
+        self.model = model
+        self.breaker = CircuitBreaker()
+        self.limiter = RateLimiter()
+        self._client = None
+        self._client_loop = None
+
+    def is_configured(self) -> bool:
+        """Indique si les identifiants du provider sont disponibles."""
+        raise NotImplementedError
+
+    def _create_client(self):
+        raise NotImplementedError
+
+    def get_client(self):
+        """Retourne le client du provider pour la boucle courante."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = self._create_client()
+            self._client_loop = loop
+        return self._client
+
+    async def _complete(self, system_prompt: str, user_prompt: str, temperature: float,
+                        max_tokens: int, json_mode: bool) -> str | tuple[str, int, int]:
+        raise NotImplementedError
+
+    async def complete(self, system_prompt: str, user_prompt: str, temperature: float = 0.7,
+                       max_tokens: int = 500, json_mode: bool = False) -> AIResult:
+        """Génère une réponse, comptabilise sa consommation et l'encapsule dans un AIResult."""
+        output = await self._complete(system_prompt, user_prompt, temperature, max_tokens, json_mode)
+        if isinstance(output, tuple):
+            text, prompt_tokens, completion_tokens = output
+        else:
+            text = output
+            prompt_tokens = count_tokens(f"{system_prompt}\n\n{user_prompt}", self.model)
+            completion_tokens = count_tokens(text, self.model)
+        USAGE.record(self.name, self.model, prompt_tokens, completion_tokens)
+        METRICS.observe("ai_prompt_tokens", prompt_tokens, provider=self.name)
+        METRICS.observe("ai_completion_tokens", completion_tokens, provider=self.name)
+        return AIResult(text=text.strip(), provider=self.name, model=self.model,
+                        prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+
+
+class OpenAIProvider(AIProvider):
+    """Provider OpenAI (client AsyncOpenAI réutilisé)."""
+
+    name = "openai"
+
+    def is_configured(self) -> bool:
+        return bool(os.environ.get("OPENAI_API_KEY"))
+
+    def _create_client(self):
+        # SDK chargé au premier appel seulement (import coûteux)
+        from openai import AsyncOpenAI
+        return AsyncOpenAI()
+
+    async def _complete(self, system_prompt, user_prompt, temperature, max_tokens, json_mode):
+        extra = {"response_format": {"type": "json_object"}} if json_mode else {}
+        response = await self.get_client().chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **extra
+        )
+        text = response.choices[0].message.content or ""
+        usage = response.usage
+        if usage is None:
+            return text
+        return text, usage.prompt_tokens, usage.completion_tokens
+
+
+class GeminiProvider(AIProvider):
+    """Provider Google Gemini (configuration et modèle créés une seule fois)."""
+
+    name = "gemini"
+
+    def __init__(self, model: str):
+        super().__init__(model)
+        self._configured = False
+        self._genai = None
+
+    @staticmethod
+    def _api_key() -> str | None:
+        return os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
+
+    def is_configured(self) -> bool:
+        return bool(self._api_key())
+
+    def _create_client(self):
+        # SDK chargé au premier appel seulement (import coûteux), puis conservé
+        import google.generativeai as genai
+        if not self._configured:
+            genai.configure(api_key=self._api_key())
+            self._configured = True
+        self._genai = genai
+        return genai.GenerativeModel(self.model)
+
+    async def _complete(self, system_prompt, user_prompt, temperature, max_tokens, json_mode):
+        client = self.get_client()
+        genai = self._genai
+
+        # Gemini n'a pas de "system prompt" séparé, on combine
+        full_prompt = f"{system_prompt}\n\n{user_prompt}"
+
+        response = await client.generate_content_async(
+            full_prompt,
+            generation_config=genai.types.GenerationConfig(
+                temperature=temperature,
+                max_output_tokens=max_tokens,
+                response_mime_type="application/json" if json_mode else None
+            )
+        )
+        usage = getattr(response, "usage_metadata", None)
+        if not usage:
+            return response.text
+        return response.text, usage.prompt_token_count, usage.candidates_token_count
+
+
+# =============================================================================
+# REGISTRE
+# =============================================================================
+
+PROVIDERS: dict[str, AIProvider] = {}
+
+
+def register_provider(provider: AIProvider) -> AIProvider:
+    """Ajoute (ou remplace) un provider dans le registre."""
+    PROVIDERS[provider.name] = provider
+    return provider
+
+
+def get_provider(name: str) -> AIProvider:
+    """
+    Retourne le provider enregistré sous ce nom.
+
+    Raises:
+        KeyError: Si le provider est inconnu
+    """
+    try:
+        return PROVIDERS[name]
+    except KeyError:
+        raise KeyError(f"Provider IA inconnu: {name} (disponibles: {', '.join(PROVIDERS)})") from None
+
+
+register_provider(OpenAIProvider(OPENAI_MODEL))
+register_provider(GeminiProvider(GEMINI_MODEL))
+
+
+def configured_chain(chain: list[str] | None = None) -> list[AIProvider]:
+    """Providers de la chaîne dont les identifiants sont disponibles, dans l'ordre."""
+    return [
+        provider
+        for provider in (get_provider(name) for name in (chain or AI_PROVIDER_CHAIN))
+        if provider.is_configured()
+    ]
+
+
+def _is_quota_error(error: BaseException) -> bool:
+    """Erreur de quota ou de limite de débit (HTTP 429), d'après le code, le type ou le message."""
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if isinstance(status, int) and status in QUOTA_STATUS_CODES:
+        return True
+    if any(cls.__name__ in QUOTA_ERROR_TYPES for cls in type(error).__mro__):
+        return True
+    error_msg = str(error).lower()
+    return any(phrase in error_msg for phrase in QUOTA_ERROR_PHRASES)
+
+
+def _report_failure(provider: AIProvider, error: BaseException, timeout: float) -> None:
+    """Affiche l'échec d'un provider et met à jour son disjoncteur."""
+    quota = _is_quota_error(error)
+    provider.breaker.record_failure(quota=quota)
+    reason = "timeout" if isinstance(error, asyncio.TimeoutError) else "quota" if quota else "error"
+    METRICS.incr("ai_failures_total", provider=provider.name, reason=reason)
+    if isinstance(error, asyncio.TimeoutError):
+        print(f"   ⚠️ {provider.name.capitalize()}: pas de réponse après {timeout:.0f}s")
+    elif quota:
+        print(f"   ⚠️ {provider.name.capitalize()}: quota dépassé")
+    else:
+        print(f"   ⚠️ Erreur {provider.name.capitalize()}: {error}")
+    if provider.breaker.state == "open":
+        print(f"   ⏸️ {provider.name.capitalize()} ignoré pendant le refroidissement")
+
+
+def _available(providers: list[AIProvider]) -> list[AIProvider]:
+    """Providers dont le disjoncteur autoriserait un appel (fermé, ou semi-ouvert sans essai en cours)."""
+    allowed = [provider for provider in providers if provider.breaker.available()]
+    for provider in providers:
+        if provider not in allowed:
+            METRICS.incr("ai_circuit_skips_total", provider=provider.name)
+    return allowed
+
+
+async def _attempt(provider: AIProvider, args: tuple, timeout: float, force: bool = False) -> AIResult:
+    """
+    Une tentative: réservation auprès du disjoncteur, attente d'une place
+    (limite de débit), puis appel borné par timeout.
+
+    Args:
+        force: Appeler le provider même si son disjoncteur le refuse
+
+    Raises:
+        CircuitOpenError: Si le disjoncteur refuse l'appel (sans force)
+    """
+    admitted = provider.breaker.acquire()
+    if admitted is None and not force:
+        raise CircuitOpenError(f"{provider.name}: circuit ouvert")
+    try:
+        async with provider.limiter.slot():
+            with METRICS.span("ai_request", provider=provider.name):
+                return await asyncio.wait_for(provider.complete(*args), timeout)
+    except asyncio.CancelledError:
+        if admitted == "probe":
+            provider.breaker.release()
+        raise
+
+
+async def _complete_sequential(providers: list[AIProvider], args: tuple, timeout: float,
+                               force: bool = False) -> AIResult:
+    """Essaie les providers l'un après l'autre jusqu'au premier succès."""
+    last_error = None
+    for i, provider in enumerate(providers):
+        try:
+            result = await _attempt(provider, args, timeout, force)
+        except Exception as e:
+            last_error = e
+            if not isinstance(e, CircuitOpenError):
+                _report_failure(provider, e, timeout)
+            if i + 1 < len(providers):
+                METRICS.incr("ai_fallbacks_total", provider=providers[i + 1].name)
+                print(f"   🔄 Basculement vers {providers[i + 1].name.capitalize()}...")
+            continue
+        provider.breaker.record_success()
+        return result
+
+    raise RuntimeError(f"❌ Erreur {providers[-1].name.capitalize()}: {last_error}")
+
+
+async def _complete_hedged(providers: list[AIProvider], args: tuple, timeout: float,
+                           hedge_delay: float, force: bool = False) -> AIResult:
+    """
+    Sollicite le provider suivant si aucune réponse n'est arrivée après
+    hedge_delay secondes (ou dès qu'un provider échoue), et retient la
+    première réponse reçue. Les requêtes encore en cours sont annulées.
+    """
+    tasks: dict[asyncio.Task, AIProvider] = {}
+    queue = list(providers)
+    last_error = None
+
+    def launch() -> None:
+        provider = queue.pop(0)
+        if tasks or len(queue) + 1 < len(providers):
+            METRICS.incr("ai_fallbacks_total", provider=provider.name)
+        task = asyncio.ensure_future(_attempt(provider, args, timeout, force))
+        tasks[task] = provider
+
+    launch()
+    try:
+        while tasks:
+            done, _ = await asyncio.wait(
+                tasks, timeout=hedge_delay if queue else None,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                print(f"   🏁 Pas de réponse après {hedge_delay:.1f}s, "
+                      f"requête de secours vers {queue[0].name.capitalize()}...")
+                launch()
+                continue
+
+            for task in done:
+                provider = tasks.pop(task)
+                error = task.exception()
+                if error is None:
+                    provider.breaker.record_success()
+                    return task.result()
+                last_error = error
+                if not isinstance(error, CircuitOpenError):
+                    _report_failure(provider, error, timeout)
+
+            # Un échec déclenche immédiatement le provider suivant
+            if queue and not tasks:
+                launch()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    raise RuntimeError(f"❌ Erreur {providers[-1].name.capitalize()}: {last_error}")
+
+
+async def complete(system_prompt: str, user_prompt: str, temperature: float = 0.7,
+                   max_tokens: int = 500, json_mode: bool = False,
+                   chain: list[str] | None = None, timeout: float | None = None,
+                   hedge_delay: float | None = None) -> AIResult:
+    """
+    Appelle les providers de la chaîne jusqu'au premier succès.
+
+    Les providers dont le disjoncteur est ouvert sont ignorés. Si tous
+    les circuits sont ouverts, la chaîne complète est essayée: mieux vaut
+    tenter un provider suspect que d'échouer d'office.
+
+    Args:
+        system_prompt: Instructions système pour l'IA
+        user_prompt: Message/question de l'utilisateur
+        temperature: Niveau de créativité (0-1)
+        max_tokens: Longueur maximale de la réponse
+        json_mode: Exiger une réponse JSON valide
+        chain: Ordre des providers (défaut: AI_PROVIDER_CHAIN)
+        timeout: Délai maximal par tentative (défaut: AI_TIMEOUT)
+        hedge_delay: Délai avant requête de secours (défaut: AI_HEDGE_DELAY,
+                     None = providers essayés l'un après l'autre)
+
+    Returns:
+        AIResult du premier provider ayant répondu
+
+    Raises:
+        ValueError: Si aucun provider de la chaîne n'est configuré
+        RuntimeError: Si tous les providers échouent
+    """
+    providers = configured_chain(chain)
+    if not providers:
+        raise ValueError(
+            "❌ Aucun provider IA disponible.\n"
+            "💡 Vérifiez vos clés API dans le fichier .env"
+        )
+
+    available = _available(providers)
+    force = not available
+    providers = available or providers
+    timeout = AI_TIMEOUT if timeout is None else timeout
+    hedge_delay = AI_HEDGE_DELAY if hedge_delay is None else hedge_delay
+    args = (system_prompt, user_prompt, temperature, max_tokens, json_mode)
+
+    if hedge_delay is not None and len(providers) > 1:
+        return await _complete_hedged(providers, args, timeout, hedge_delay, force)
+    return await _complete_sequential(providers, args, timeout, force)
+
+
+# =============================================================================
+# PONT SYNCHRONE
+# =============================================================================
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Boucle d'événements persistante (thread dédié) pour les appels synchrones."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="ai-providers", daemon=True).start()
+        return _loop
+
+
+def run_sync(coro):
+    """
+    Exécute une coroutine depuis du code synchrone et retourne son résultat.
+
+    La coroutine tourne sur une boucle persistante: les clients des
+    providers restent ouverts d'un appel synchrone à l'autre.
+    """
+    loop = _background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_sync() ne peut pas être appelé depuis la boucle des providers")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
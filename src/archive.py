@@ -0,0 +1,332 @@
+"""
+CyberDailyWatch - Archive des briefings
+Historique des briefings publiés, en fichiers JSON découpés pour le frontend.
+
+Organisation du dossier (cyber-news/archive/):
+    - index.json: manifeste (nombre d'entrées, taille et nombre de pages,
+      première et dernière date)
+    - days/AAAA/AAAA-MM-JJ.json: briefings complets d'un jour
+    - pages/page-00001.json: résumés des briefings, PAGE_SIZE par page,
+      du plus ancien au plus récent
+
+Les pages vont du plus ancien au plus récent. Un nouveau briefing ne
+réécrit que le fichier de son jour, la dernière page et le manifeste,
+quelle que soit la taille de l'historique. Un jour antérieur au dernier
+jour archivé (backfill) est inséré à sa place: les pages sont réécrites
+à partir de la première concernée, avec le numéro de page des
+briefings décalés dans leurs fichiers de jour. Chaque écriture passe
+par un fichier temporaire renommé ensuite (atomique): le frontend ne
+lit jamais un fichier à moitié écrit.
+
+Configuration modifiable:
+    - ARCHIVE_DIR: Dossier de l'archive
+    - PAGE_SIZE: Nombre de briefings par page
+
+Exemple d'utilisation:
+    >>> archive = NewsArchive()
+    >>> archive.append({"generated_at": "2026-01-22T21:00:00Z", "articles": [...]})
+    >>> archive.read_page(archive.load_index()["pages"])
+    >>> archive.export_articles("articles.ndjson.gz", start="2026-01-01")
+"""
+
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Iterator
+
+from articles import write_ndjson
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Dossier de l'archive (publié avec le site)
+ARCHIVE_DIR = Path(__file__).parent.parent / "cyber-news" / "archive"
+
+# Nombre de briefings par page (ne pas modifier sur une archive existante)
+PAGE_SIZE = 20
+
+# Champs d'un article repris dans les pages (les jours gardent tout);
+# {edition} est le code de l'édition du briefing (title_fr pour "fr")
+PAGE_ARTICLE_FIELDS = ("title", "title_{edition}", "url", "source")
+
+# Édition des briefings archivés sans champ "edition" (archives existantes)
+DEFAULT_EDITION = "fr"
+
+
+def write_json_atomic(path: Path, data) -> None:
+    """Écrit un fichier JSON via un fichier temporaire renommé ensuite."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_json(path: Path, default):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+class NewsArchive:
+    """
+    Archive des briefings, découpée par jour et par page.
+
+    Args:
+        directory: Dossier de l'archive
+        page_size: Nombre de briefings par page
+    """
+
+    def __init__(self, directory: str | Path = ARCHIVE_DIR, page_size: int = PAGE_SIZE):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        index = self.load_index()
+        # Une archive existante garde sa taille de page
+        self.page_size = index.get("page_size") or page_size
+
+    # -------------------------------------------------------------------------
+    # Chemins
+    # -------------------------------------------------------------------------
+
+    @property
+    def _index_path(self) -> Path:
+        return self.directory / "index.json"
+
+    def day_path(self, date: str) -> Path:
+        """Fichier des briefings d'un jour (date au format AAAA-MM-JJ)."""
+        return self.directory / "days" / date[:4] / f"{date}.json"
+
+    def page_path(self, page: int) -> Path:
+        """Fichier d'une page (numérotées à partir de 1, la plus ancienne)."""
+        return self.directory / "pages" / f"page-{page:05d}.json"
+
+    # -------------------------------------------------------------------------
+    # Lecture
+    # -------------------------------------------------------------------------
+
+    def load_index(self) -> dict:
+        """Manifeste de l'archive (vide si l'archive n'existe pas encore)."""
+        return _read_json(self._index_path, {})
+
+    def read_day(self, date: str) -> list[dict]:
+        """Briefings complets publiés un jour donné."""
+        return _read_json(self.day_path(date), {}).get("briefings", [])
+
+    def read_page(self, page: int) -> list[dict]:
+        """Résumés des briefings d'une page."""
+        return _read_json(self.page_path(page), {}).get("entries", [])
+
+    def iter_briefings(self) -> Iterator[dict]:
+        """Parcourt tous les briefings, du plus ancien au plus récent."""
+        for page in range(1, self.load_index().get("pages", 0) + 1):
+            days = []
+            for entry in self.read_page(page):
+                if entry["date"] not in days:
+                    days.append(entry["date"])
+            for date in days:
+                for briefing in self.read_day(date):
+                    if briefing.get("page", page) == page:
+                        yield briefing
+
+    def iter_articles(self, start: str | None = None, end: str | None = None) -> Iterator[dict]:
+        """
+        Parcourt les articles des briefings publiés de start à end (AAAA-MM-JJ, inclus).
+
+        Chaque article porte la date de génération de son briefing
+        (generated_at). Un seul fichier de jour est lu à la fois.
+        """
+        for briefing in self.iter_briefings():
+            date = briefing["generated_at"][:10]
+            if (start and date < start) or (end and date > end):
+                continue
+            for article in briefing.get("articles", []):
+                yield dict(article, generated_at=briefing["generated_at"])
+
+    def export_articles(self, path: str | Path, start: str | None = None, end: str | None = None) -> int:
+        """
+        Exporte les articles de l'archive en NDJSON (gzip si path finit par .gz).
+
+        L'export est écrit au fil de la lecture de l'archive (voir
+        articles.write_ndjson): la mémoire utilisée ne dépend pas de sa taille.
+
+        Returns:
+            Nombre d'articles exportés
+        """
+        return write_ndjson(path, self.iter_articles(start, end))
+
+    # -------------------------------------------------------------------------
+    # Écriture
+    # -------------------------------------------------------------------------
+
+    def _page_entry(self, briefing: dict) -> dict:
+        """Résumé d'un briefing pour sa page (titres dans la langue de son édition)."""
+        date = briefing["generated_at"][:10]
+        edition = briefing.get("edition") or DEFAULT_EDITION
+        fields = [name.format(edition=edition) for name in PAGE_ARTICLE_FIELDS]
+        return {
+            "date": date,
+            "generated_at": briefing["generated_at"],
+            "fingerprint": briefing.get("fingerprint"),
+            "edition": edition,
+            "day": self.day_path(date).relative_to(self.directory).as_posix(),
+            "articles": [
+                {name: article[name] for name in fields if name in article}
+                for article in briefing.get("articles", [])
+            ]
+        }
+
+    def _write_index(self, index: dict, total: int, pages: int, date: str, updated_at: str) -> None:
+        """Manifeste, écrit en dernier: les fichiers qu'il annonce existent déjà."""
+        write_json_atomic(self._index_path, {
+            "version": 1,
+            "page_size": self.page_size,
+            "total": total,
+            "pages": pages,
+            "first_date": min(index.get("first_date") or date, date),
+            "last_date": max(index.get("last_date") or date, date),
+            "updated_at": max(index.get("updated_at") or updated_at, updated_at)
+        })
+
+    def append(self, briefing: dict) -> bool:
+        """
+        Ajoute un briefing à l'archive.
+
+        Le briefing doit contenir generated_at (ISO 8601) et articles,
+        et peut indiquer le code de son édition (edition, défaut:
+        DEFAULT_EDITION): les pages reprennent les titres traduits de
+        cette édition (title_<code>). Un briefing dont l'empreinte (fingerprint) est celle du dernier
+        briefing du même jour n'est pas ajouté une seconde fois. Un
+        briefing antérieur au dernier jour archivé est inséré à sa place
+        dans les pages (voir _insert).
+
+        Returns:
+            True si le briefing a été ajouté
+        """
+        date = briefing["generated_at"][:10]
+        with self._lock:
+            index = self.load_index()
+            total = index.get("total", 0)
+
+            day = _read_json(self.day_path(date), {"date": date, "briefings": []})
+            fingerprint = briefing.get("fingerprint")
+            if fingerprint and day["briefings"] and day["briefings"][-1].get("fingerprint") == fingerprint:
+                return False
+
+            if index.get("last_date") and date < index["last_date"]:
+                self._insert(briefing, day, index)
+                return True
+
+            page = total // self.page_size + 1
+
+            # 1. Fichier du jour (briefing complet)
+            day["briefings"].append(dict(briefing, page=page))
+            write_json_atomic(self.day_path(date), day)
+
+            # 2. Dernière page (résumé)
+            entries = self.read_page(page) if total % self.page_size else []
+            entries.append(self._page_entry(briefing))
+            write_json_atomic(self.page_path(page), {"page": page, "entries": entries})
+
+            # 3. Manifeste
+            self._write_index(index, total + 1, page, date, briefing["generated_at"])
+            return True
+
+    def _insert(self, briefing: dict, day: dict, index: dict) -> None:
+        """
+        Insère le briefing d'un jour passé après les briefings de son jour.
+
+        Seules les pages à partir de celle où il s'insère sont relues et
+        réécrites; les briefings qui changent de page sont mis à jour
+        dans leurs fichiers de jour. Appelé avec le verrou.
+        """
+        date = briefing["generated_at"][:10]
+        first_page = index["pages"]
+        entries = self.read_page(first_page)
+        while first_page > 1 and entries[0]["date"] > date:
+            first_page -= 1
+            entries = self.read_page(first_page) + entries
+
+        # Pages actuelles des entrées relues (toutes les pages sauf la dernière sont pleines)
+        old_pages = [first_page + i // self.page_size for i in range(len(entries))]
+        position = next(i for i, entry in enumerate(entries) if entry["date"] > date)
+        entries.insert(position, self._page_entry(briefing))
+        old_pages.insert(position, first_page + position // self.page_size)
+
+        moved: dict[str, dict[str, int]] = {}
+        for i, (entry, old_page) in enumerate(zip(entries, old_pages)):
+            page = first_page + i // self.page_size
+            if page != old_page:
+                moved.setdefault(entry["date"], {})[entry["generated_at"]] = page
+
+        # 1. Fichiers des jours (nouveau briefing, pages décalées)
+        day["briefings"].append(dict(briefing, page=old_pages[position]))
+        moved.setdefault(date, {})
+        for moved_date, pages in moved.items():
+            moved_day = day if moved_date == date else _read_json(self.day_path(moved_date), None)
+            if not moved_day:
+                continue
+            for archived in moved_day["briefings"]:
+                if archived["generated_at"] in pages:
+                    archived["page"] = pages[archived["generated_at"]]
+            write_json_atomic(self.day_path(moved_date), moved_day)
+
+        # 2. Pages, à partir de la première concernée
+        for start in range(0, len(entries), self.page_size):
+            page = first_page + start // self.page_size
+            write_json_atomic(self.page_path(page),
+                              {"page": page, "entries": entries[start:start + self.page_size]})
+
+        # 3. Manifeste
+        self._write_index(index, index["total"] + 1, first_page + (len(entries) - 1) // self.page_size,
+                          date, briefing["generated_at"])
+
+    def replace_latest(self, briefing: dict) -> bool:
+        """
+        Remplace le dernier briefing d'un jour (nouveau rendu du même jour).
+
+        Le briefing garde sa page et la date de génération d'origine
+        (generated_at); le fichier du jour et le résumé de sa page
+        (titres traduits) sont réécrits. Un jour absent de l'archive est
+        ajouté (append).
+
+        Returns:
+            True si le briefing a été remplacé ou ajouté
+        """
+        date = briefing["generated_at"][:10]
+        with self._lock:
+            day = _read_json(self.day_path(date), None)
+            if day and day["briefings"]:
+                old = day["briefings"][-1]
+                briefing = dict(briefing, generated_at=old["generated_at"], page=old.get("page"))
+                day["briefings"][-1] = briefing
+                write_json_atomic(self.day_path(date), day)
+
+                entries = self.read_page(briefing["page"]) if briefing["page"] else []
+                for i in reversed(range(len(entries))):
+                    if entries[i]["date"] == date and entries[i]["generated_at"] == old["generated_at"]:
+                        entries[i] = self._page_entry(briefing)
+                        write_json_atomic(self.page_path(briefing["page"]),
+                                          {"page": briefing["page"], "entries": entries})
+                        break
+                return True
+        return self.append(briefing)
+
+
+_archive: NewsArchive | None = None
+
+
+def get_archive() -> NewsArchive:
+    """Retourne l'archive partagée."""
+    global _archive
+    if _archive is None:
+        _archive = NewsArchive()
+    return _archive
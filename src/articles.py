@@ -0,0 +1,198 @@
+"""
+CyberDailyWatch - Modèle d'article compact et fichiers NDJSON
+Enregistrement d'article léger pour les runs volumineux (backfill,
+export de l'archive), et lecture/écriture en flux d'un article par ligne.
+
+Article range les champs communs (title, url, summary, source,
+content_hash, teaser et la traduction française title_fr, summary_fr)
+dans des __slots__, sans dictionnaire par instance; les autres champs
+(autres éditions, sources fusionnées...) vont dans un dictionnaire créé
+au premier besoin. Un Article se lit et
+s'écrit comme un dict (article["title"], article.get("title_fr"),
+article["summary_fr"] = ...): les fonctions du pipeline l'acceptent
+telles quelles.
+
+Les fichiers NDJSON (un objet JSON par ligne, .ndjson ou .ndjson.gz)
+sont écrits et relus article par article: la mémoire utilisée ne dépend
+pas du nombre d'articles, contrairement à un json.dump d'une liste.
+
+Configuration modifiable:
+    - NDJSON_GZIP_LEVEL: Niveau de compression des fichiers .gz
+
+Exemple d'utilisation:
+    >>> write_ndjson("articles.ndjson.gz", (Article.from_dict(a) for a in news))
+    >>> for article in read_articles("articles.ndjson.gz"):
+    ...     print(article["title"])
+"""
+
+import gzip
+import io
+import json
+import os
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from dataclasses import dataclass
+from pathlib import Path
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Niveau de compression gzip des fichiers .ndjson.gz (1 = rapide, 9 = compact)
+NDJSON_GZIP_LEVEL = 6
+
+# Champs rangés dans les __slots__ (les autres vont dans Article.extra)
+ARTICLE_FIELDS = ("title", "url", "summary", "source", "content_hash", "teaser", "title_fr", "summary_fr")
+REQUIRED_FIELDS = ("title", "url", "summary")
+
+
+@dataclass(slots=True, eq=False)
+class Article(MutableMapping):
+    """
+    Article compact, utilisable comme un dict.
+
+    Un champ facultatif à None est absent ("teaser" in article est faux
+    tant qu'aucun chapeau n'a été conservé). La comparaison avec == suit
+    celle des dict: un Article est égal au dict de mêmes champs.
+
+    Args:
+        title, url, summary: Champs de l'article source
+        source: Nom de la source (voir sources.py)
+        content_hash: Empreinte du contenu (voir incremental.py)
+        teaser: Chapeau d'origine, quand summary est un résumé du texte complet
+        title_fr, summary_fr: Traduction de l'édition principale (voir main.translate_articles)
+        extra: Autres champs (autres éditions, sources fusionnées...)
+    """
+    title: str
+    url: str
+    summary: str
+    source: str | None = None
+    content_hash: str | None = None
+    teaser: str | None = None
+    title_fr: str | None = None
+    summary_fr: str | None = None
+    extra: dict | None = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Article":
+        """Article à partir d'un dict (les champs inconnus vont dans extra)."""
+        if isinstance(data, Article):
+            return data.copy()
+        extra = {key: value for key, value in data.items() if key not in ARTICLE_FIELDS}
+        return cls(*(data.get(name) for name in ARTICLE_FIELDS), extra or None)
+
+    def to_dict(self) -> dict:
+        """Dict équivalent (pour json.dump)."""
+        data = {name: getattr(self, name) for name in ARTICLE_FIELDS if getattr(self, name) is not None}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def copy(self) -> "Article":
+        """Copie superficielle (comme dict.copy)."""
+        return Article(*self._values(), dict(self.extra) if self.extra else None)
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in ARTICLE_FIELDS)
+
+    def __reduce__(self):
+        # Arguments positionnels: pickle plus compact qu'avec l'état par défaut
+        return Article, (*self._values(), self.extra)
+
+    def __getitem__(self, key: str):
+        if key in ARTICLE_FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        elif self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value) -> None:
+        if key in ARTICLE_FIELDS:
+            setattr(self, key, value)
+        elif self.extra is None:
+            self.extra = {key: value}
+        else:
+            self.extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in REQUIRED_FIELDS:
+            raise KeyError(f"Champ obligatoire: {key}")
+        if key in ARTICLE_FIELDS and getattr(self, key) is not None:
+            setattr(self, key, None)
+        elif self.extra and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for name in ARTICLE_FIELDS:
+            if getattr(self, name) is not None:
+                yield name
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for name in ARTICLE_FIELDS if getattr(self, name) is not None) + len(self.extra or ())
+
+
+def as_dict(article: Mapping) -> dict:
+    """Dict d'un article (Article ou dict, sans copie pour un dict)."""
+    return article.to_dict() if isinstance(article, Article) else article
+
+
+# =============================================================================
+# FICHIERS NDJSON
+# =============================================================================
+
+def _is_gzip(path: Path) -> bool:
+    return path.suffix == ".gz"
+
+
+def write_ndjson(path: str | Path, records: Iterable[Mapping], compresslevel: int = NDJSON_GZIP_LEVEL) -> int:
+    """
+    Écrit des enregistrements en NDJSON, au fil de l'itération.
+
+    Les enregistrements peuvent venir d'un générateur: un seul est en
+    mémoire à la fois. Le fichier est compressé (gzip) si son nom se
+    termine par .gz, et remplacé de façon atomique à la fin de l'écriture.
+
+    Returns:
+        Nombre d'enregistrements écrits
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    count = 0
+    try:
+        if _is_gzip(path):
+            # mtime=0: même contenu, même fichier compressé
+            f = io.TextIOWrapper(gzip.GzipFile(tmp_path, "wb", compresslevel, mtime=0), encoding="utf-8")
+        else:
+            f = open(tmp_path, "w", encoding="utf-8")
+        with f:
+            for record in records:
+                f.write(encode(as_dict(record)))
+                f.write("\n")
+                count += 1
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return count
+
+
+def read_ndjson(path: str | Path) -> Iterator[dict]:
+    """Relit un fichier NDJSON (ou .ndjson.gz), un enregistrement à la fois."""
+    path = Path(path)
+    opener = gzip.open if _is_gzip(path) else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_articles(path: str | Path) -> Iterator[Article]:
+    """Relit un fichier NDJSON d'articles, un Article à la fois."""
+    return map(Article.from_dict, read_ndjson(path))
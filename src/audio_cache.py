@@ -0,0 +1,154 @@
+"""
+CyberDailyWatch - Cache des segments audio
+Cache adressé par contenu des segments MP3 synthétisés.
+
+Chaque segment est stocké sous le hash de (texte, voix, débit, hauteur):
+un segment identique d'un run à l'autre (introduction, conclusion,
+brève répétée) n'est synthétisé qu'une seule fois. Le cache est borné
+en taille; les segments les moins récemment utilisés sont supprimés.
+
+Configuration modifiable:
+    - CACHE_DIR: Dossier du cache
+    - CACHE_MAX_BYTES: Taille maximale du cache (en octets)
+"""
+
+import hashlib
+import os
+import threading
+import uuid
+from pathlib import Path
+
+from metrics import METRICS
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Dossier du cache (dans .cache/, conservé entre deux runs par la CI)
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "audio"
+
+# Taille maximale du cache: les segments les moins récemment utilisés sont supprimés
+CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+
+def segment_key(text: str, voice: str, rate: str = "+0%", pitch: str = "+0Hz") -> str:
+    """Clé d'un segment: hash SHA-256 du texte et des paramètres de voix."""
+    return hashlib.sha256("\0".join((text, voice, rate, pitch)).encode("utf-8")).hexdigest()
+
+
+class AudioSegmentCache:
+    """
+    Cache de segments MP3 sur disque.
+
+    L'heure de modification d'un fichier sert de date de dernier accès
+    (elle est mise à jour à chaque lecture) pour l'éviction LRU.
+
+    Args:
+        directory: Dossier du cache
+        max_bytes: Taille maximale cumulée des segments (en octets)
+    """
+
+    def __init__(self, directory: str | Path = CACHE_DIR, max_bytes: int = CACHE_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.mp3"
+
+    def lookup(self, key: str) -> Path | None:
+        """Retourne le fichier du segment s'il est en cache (et le marque comme utilisé)."""
+        path = self._path(key)
+        with self._lock:
+            try:
+                os.utime(path)
+            except OSError:
+                # Absent, ou supprimé entre-temps
+                self.misses += 1
+                METRICS.incr("cache_lookups_total", cache="audio", result="miss")
+                return None
+            self.hits += 1
+            METRICS.incr("cache_lookups_total", cache="audio", result="hit")
+            return path
+
+    def open_writer(self, key: str):
+        """
+        Ouvre un fichier temporaire pour écrire un nouveau segment.
+
+        Le segment n'est visible qu'après commit(); en cas d'échec,
+        appeler discard().
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return _SegmentWriter(self, key)
+
+    def _commit(self, tmp_path: Path, key: str) -> None:
+        with self._lock:
+            os.replace(tmp_path, self._path(key))
+            self._evict()
+
+    def _evict(self) -> None:
+        """Supprime les segments les moins récemment utilisés jusqu'à respecter max_bytes."""
+        entries = []
+        total = 0
+        for path in self.directory.glob("*.mp3"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def stats(self) -> dict:
+        """Compteurs du run courant."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def reset_stats(self) -> None:
+        """Remet les compteurs à zéro (début d'un nouveau run; le cache est conservé)."""
+        with self._lock:
+            self.hits = self.misses = 0
+
+
+class _SegmentWriter:
+    """Écriture d'un segment dans un fichier temporaire, validée par commit()."""
+
+    def __init__(self, cache: AudioSegmentCache, key: str):
+        self.cache = cache
+        self.key = key
+        self.tmp_path = cache.directory / f"{key}.{uuid.uuid4().hex}.part"
+        self.file = open(self.tmp_path, "wb")
+
+    def write(self, data: bytes) -> None:
+        self.file.write(data)
+
+    def commit(self) -> None:
+        try:
+            self.file.close()
+            self.cache._commit(self.tmp_path, self.key)
+        except BaseException:
+            self.tmp_path.unlink(missing_ok=True)
+            raise
+
+    def discard(self) -> None:
+        try:
+            self.file.close()
+        except OSError:
+            pass
+        self.tmp_path.unlink(missing_ok=True)
+
+
+_cache: AudioSegmentCache | None = None
+
+
+def get_audio_cache() -> AudioSegmentCache:
+    """Retourne le cache de segments partagé."""
+    global _cache
+    if _cache is None:
+        _cache = AudioSegmentCache()
+    return _cache
@@ -5,9 +5,18 @@ Module de synthèse vocale utilisant edge-tts (Microsoft Azure Neural Voices).
 Ce module convertit du texte en fichier audio MP3 en utilisant
 les voix neuronales gratuites de Microsoft Edge.
 
+En mode segmenté, le script est découpé en segments (phrases regroupées)
+synthétisés en parallèle; les trames MP3 sont écrites dans l'ordre au
+fur et à mesure de leur réception, avec des files bornées: la mémoire
+utilisée ne dépend pas de la longueur du script. Les segments déjà
+synthétisés lors d'un run précédent sont relus depuis le cache
+(voir audio_cache.py) et concaténés sans réencodage.
+
 Configuration modifiable:
-    - VOICE: Voix utilisée pour la synthèse (ligne 18)
-    - OUTPUT_DIR: Dossier de sortie par défaut (ligne 21)
+    - VOICE: Voix utilisée pour la synthèse
+    - VOICE_RATE / VOICE_PITCH: Débit et hauteur de la voix
+    - OUTPUT_DIR: Dossier de sortie par défaut
+    - SEGMENTED_TTS / TTS_CONCURRENCY / SEGMENT_MAX_CHARS: Mode segmenté
 
 Voix françaises disponibles:
     - fr-FR-HenriNeural (homme, utilisé par défaut)
@@ -17,8 +26,14 @@ Voix françaises disponibles:
 """
 
 import asyncio
-import edge_tts
+import os
+import re
+import time
 from pathlib import Path
+from typing import AsyncIterator
+
+from audio_cache import get_audio_cache, segment_key
+from metrics import METRICS
 
 # =============================================================================
 # CONFIGURATION - Modifiez ces valeurs selon vos besoins
@@ -28,17 +43,261 @@ from pathlib import Path
 # Changez pour "fr-FR-DeniseNeural" pour une voix féminine
 VOICE = "fr-FR-HenriNeural"
 
+# Débit et hauteur de la voix (format edge-tts, ex: "+10%", "-5Hz")
+VOICE_RATE = "+0%"
+VOICE_PITCH = "+0Hz"
+
 # Dossier de sortie par défaut pour les fichiers audio
 DEFAULT_OUTPUT_DIR = Path(__file__).parent.parent / "public" / "audio"
 
 # Nom du fichier audio par défaut
 DEFAULT_FILENAME = "latest_briefing.mp3"
 
+# Synthèse segmentée et concurrente (False = un seul appel edge-tts)
+SEGMENTED_TTS = True
+
+# Nombre maximal de segments synthétisés simultanément
+TTS_CONCURRENCY = 4
+
+# Taille maximale d'un segment (en caractères, phrases regroupées)
+SEGMENT_MAX_CHARS = 400
+
+# Nombre de blocs audio mis en attente par segment avant de bloquer la synthèse
+SEGMENT_QUEUE_SIZE = 32
+
+# Nombre de tentatives par segment (si aucune donnée n'a encore été reçue)
+SEGMENT_MAX_ATTEMPTS = 2
+
+# Réutiliser les segments déjà synthétisés (voir audio_cache.py)
+USE_AUDIO_CACHE = True
+
+# Taille des blocs lus depuis le cache (en octets)
+CACHE_READ_CHUNK = 64 * 1024
+
+
+# =============================================================================
+# DÉCOUPAGE DU SCRIPT
+# =============================================================================
+
+# Fin de phrase: ponctuation suivie d'un espace
+SENTENCE_END_RE = re.compile(r"(?<=[.!?…])\s+")
+
+
+def split_segments(text: str, max_chars: int = SEGMENT_MAX_CHARS) -> list[str]:
+    """
+    Découpe un texte en segments d'au plus max_chars caractères.
+
+    Les paragraphes ne sont jamais fusionnés; à l'intérieur d'un
+    paragraphe, les phrases sont regroupées tant que la limite n'est pas
+    atteinte. Une phrase trop longue est coupée sur les espaces.
+
+    Exemple:
+        >>> split_segments("Bonjour. Voici le flash.\n\nAu revoir.", 400)
+        ['Bonjour. Voici le flash.', 'Au revoir.']
+    """
+    segments = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = " ".join(paragraph.split())
+        if not paragraph:
+            continue
+        current = ""
+        for sentence in SENTENCE_END_RE.split(paragraph):
+            # Couper les phrases plus longues que la limite
+            while len(sentence) > max_chars:
+                cut = sentence.rfind(" ", 0, max_chars)
+                cut = cut if cut > 0 else max_chars
+                if current:
+                    segments.append(current)
+                    current = ""
+                segments.append(sentence[:cut].strip())
+                sentence = sentence[cut:].strip()
+            if current and len(current) + 1 + len(sentence) > max_chars:
+                segments.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+        if current:
+            segments.append(current)
+    return segments
+
+
+# =============================================================================
+# SYNTHÈSE
+# =============================================================================
+
+async def synthesize_stream(text: str, voice: str = VOICE, rate: str = VOICE_RATE,
+                            pitch: str = VOICE_PITCH) -> AsyncIterator[bytes]:
+    """
+    Synthétise un texte et produit les blocs MP3 au fil de leur réception.
+
+    Point d'extension: les benchmarks remplacent cette fonction par un
+    moteur local pour fonctionner hors ligne.
+    """
+    import edge_tts
+
+    communicate = edge_tts.Communicate(text, voice, rate=rate, pitch=pitch)
+    async for chunk in communicate.stream():
+        if chunk["type"] == "audio":
+            yield chunk["data"]
+
+
+async def _produce_segment(text: str, voice: str, rate: str, pitch: str,
+                           queue: asyncio.Queue) -> None:
+    """
+    Pousse les blocs audio d'un segment dans sa file, puis None (fin).
+
+    Un segment en cache est relu depuis le disque; sinon il est
+    synthétisé et enregistré dans le cache en même temps. Toute erreur
+    est poussée dans la file (le lecteur la relève): le lecteur n'attend
+    jamais un segment dont la tâche est morte.
+    """
+    try:
+        await _stream_segment(text, voice, rate, pitch, queue)
+    except Exception as e:
+        await queue.put(e)
+        return
+    await queue.put(None)
+
+
+async def _stream_segment(text: str, voice: str, rate: str, pitch: str, queue: asyncio.Queue) -> None:
+    cache = get_audio_cache() if USE_AUDIO_CACHE else None
+    key = segment_key(text, voice, rate, pitch)
+    cached = cache.lookup(key) if cache else None
+    if cached is not None:
+        sent = 0
+        try:
+            with open(cached, "rb") as f:
+                while data := f.read(CACHE_READ_CHUNK):
+                    sent += len(data)
+                    await queue.put(data)
+            return
+        except OSError as e:
+            # Segment évincé (autre édition) ou illisible: nouvelle synthèse,
+            # possible tant que rien n'a été transmis
+            if sent:
+                raise
+            print(f"⚠️ Cache audio illisible ({e}), nouvelle synthèse du segment")
+
+    for attempt in range(1, SEGMENT_MAX_ATTEMPTS + 1):
+        received = 0
+        writer = _open_writer(cache, key)
+        started = time.perf_counter()
+        try:
+            async for data in synthesize_stream(text, voice, rate, pitch):
+                received += len(data)
+                if writer and not _write(writer, data):
+                    writer = None
+                await queue.put(data)
+        except BaseException as e:
+            if writer:
+                writer.discard()
+            if not isinstance(e, Exception):
+                raise
+            METRICS.record_span("tts_segment", started, time.perf_counter() - started, "error")
+            # Relancer uniquement si rien n'a encore été transmis
+            if received or attempt == SEGMENT_MAX_ATTEMPTS:
+                raise
+            METRICS.incr("tts_retries_total")
+            continue
+        # Durée de synthèse (inclut l'attente de l'écriture du fichier)
+        METRICS.record_span("tts_segment", started, time.perf_counter() - started)
+        METRICS.observe("tts_segment_bytes", received)
+        if writer:
+            try:
+                writer.commit()
+            except OSError as e:
+                # Le segment est déjà transmis: seule l'entrée du cache est perdue
+                print(f"⚠️ Segment audio non mis en cache: {e}")
+        return
+
+
+def _open_writer(cache, key: str):
+    """Fichier d'écriture d'un segment dans le cache (None sans cache ou en cas d'erreur disque)."""
+    if cache is None:
+        return None
+    try:
+        return cache.open_writer(key)
+    except OSError as e:
+        print(f"⚠️ Segment audio non mis en cache: {e}")
+        return None
+
+
+def _write(writer, data: bytes) -> bool:
+    """Écrit un bloc dans le cache; en cas d'erreur disque, abandonne l'entrée (l'audio continue)."""
+    try:
+        writer.write(data)
+        return True
+    except OSError as e:
+        print(f"⚠️ Segment audio non mis en cache: {e}")
+        writer.discard()
+        return False
+
+
+async def generate_audio_segmented(
+    text: str,
+    output_path: Path,
+    voice: str = VOICE,
+    concurrency: int = TTS_CONCURRENCY,
+    rate: str = VOICE_RATE,
+    pitch: str = VOICE_PITCH
+) -> Path:
+    """
+    Génère le MP3 segment par segment, avec une synthèse concurrente.
+
+    Une fenêtre glissante de `concurrency` segments est synthétisée en
+    parallèle; le segment le plus ancien de la fenêtre est écrit dans le
+    fichier au fur et à mesure, puis le segment suivant est lancé. Les
+    files bornées limitent la mémoire utilisée quelle que soit la
+    longueur du script.
+
+    Le fichier est écrit sous un nom temporaire puis renommé: une
+    version incomplète n'est jamais visible.
+    """
+    segments = split_segments(text) or [text]
+    queues = [asyncio.Queue(maxsize=SEGMENT_QUEUE_SIZE) for _ in segments]
+    tasks: dict[int, asyncio.Task] = {}
+
+    def launch(index: int) -> None:
+        if index < len(segments) and index not in tasks:
+            tasks[index] = asyncio.create_task(
+                _produce_segment(segments[index], voice, rate, pitch, queues[index])
+            )
+
+    tmp_path = output_path.with_name(output_path.name + ".part")
+    try:
+        for index in range(min(concurrency, len(segments))):
+            launch(index)
+
+        with open(tmp_path, "wb") as f:
+            for index in range(len(segments)):
+                launch(index)
+                while True:
+                    data = await queues[index].get()
+                    if data is None:
+                        break
+                    if isinstance(data, Exception):
+                        raise data
+                    f.write(data)
+                # Segment terminé: faire entrer le suivant dans la fenêtre
+                launch(index + concurrency)
+
+        os.replace(tmp_path, output_path)
+    finally:
+        for task in tasks.values():
+            task.cancel()
+        tmp_path.unlink(missing_ok=True)
+
+    return output_path
+
 
 async def generate_audio(
     text: str,
     output_path: str | Path | None = None,
-    voice: str = VOICE
+    voice: str = VOICE,
+    segmented: bool = SEGMENTED_TTS,
+    rate: str = VOICE_RATE,
+    pitch: str = VOICE_PITCH,
+    concurrency: int = TTS_CONCURRENCY
 ) -> Path:
     """
     Génère un fichier audio MP3 à partir d'un texte.
@@ -53,6 +312,11 @@ async def generate_audio(
                      Si non spécifié, utilise le dossier par défaut
         voice: Identifiant de la voix à utiliser (optionnel)
                Défaut: fr-FR-HenriNeural (voix masculine française)
+        segmented: Synthèse segmentée et concurrente, avec cache des
+                   segments (défaut: SEGMENTED_TTS)
+        rate: Débit de la voix (ex: "+10%")
+        pitch: Hauteur de la voix (ex: "-5Hz")
+        concurrency: Segments synthétisés simultanément (mode segmenté)
     
     Returns:
         Path: Chemin absolu vers le fichier audio généré
@@ -74,8 +338,14 @@ async def generate_audio(
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Créer l'objet de communication avec edge-tts
-    communicate = edge_tts.Communicate(text, voice)
+    if segmented:
+        return await generate_audio_segmented(text, output_path, voice, concurrency, rate, pitch)
+    
+    # Créer l'objet de communication avec edge-tts (chargé à la demande:
+    # son import, avec aiohttp, est le plus coûteux du pipeline)
+    import edge_tts
+
+    communicate = edge_tts.Communicate(text, voice, rate=rate, pitch=pitch)
     
     # Sauvegarder l'audio
     await communicate.save(str(output_path))
@@ -86,7 +356,11 @@ async def generate_audio(
 def generate_audio_sync(
     text: str,
     output_path: str | Path | None = None,
-    voice: str = VOICE
+    voice: str = VOICE,
+    segmented: bool = SEGMENTED_TTS,
+    rate: str = VOICE_RATE,
+    pitch: str = VOICE_PITCH,
+    concurrency: int = TTS_CONCURRENCY
 ) -> Path:
     """
     Version synchrone de generate_audio.
@@ -98,6 +372,10 @@ def generate_audio_sync(
         text: Le texte à convertir en audio
         output_path: Chemin du fichier MP3 de sortie (optionnel)
         voice: Identifiant de la voix à utiliser (optionnel)
+        segmented: Synthèse segmentée et concurrente (optionnel)
+        rate: Débit de la voix (optionnel)
+        pitch: Hauteur de la voix (optionnel)
+        concurrency: Segments synthétisés simultanément (optionnel)
     
     Returns:
         Path: Chemin absolu vers le fichier audio généré
@@ -106,7 +384,7 @@ def generate_audio_sync(
         >>> path = generate_audio_sync("Bonjour le monde!")
         >>> print(f"Audio sauvegardé: {path}")
     """
-    return asyncio.run(generate_audio(text, output_path, voice))
+    return asyncio.run(generate_audio(text, output_path, voice, segmented, rate, pitch, concurrency))
 
 
 # =============================================================================
@@ -0,0 +1,325 @@
+"""
+CyberDailyWatch - Génération en lot (backfill)
+Produit les briefings de plusieurs jours en parallèle.
+
+Deux modes:
+    - --snapshots DOSSIER: un briefing par page d'accueil enregistrée
+      (fichiers AAAA-MM-JJ.html, ou AAAA-MM-JJ_source.html pour une
+      autre source de sources.py), ajouté à l'archive (un jour
+      antérieur au dernier jour archivé y est inséré à sa place)
+    - --from/--to: nouveau rendu des jours déjà archivés (après une
+      modification du prompt ou de la voix), à partir de leurs articles:
+      fichier du jour, résumé de sa page et index de recherche
+
+Le parsing HTML tourne dans un pool de processus; la traduction, le
+script et la synthèse vocale tournent sur asyncio, avec au plus
+--concurrency jours en cours. Les appels IA respectent les limites de
+débit globales de ai_providers.py (AI_MAX_CONCURRENCY,
+AI_REQUESTS_PER_MINUTE), communes à tous les jours.
+
+Les articles sont des articles.Article compacts, et au plus
+PARSE_AHEAD jours parsés attendent leur tour: la mémoire reste bornée
+quel que soit le nombre de jours.
+
+Chaque jour terminé est noté dans un fichier d'état: un backfill
+interrompu reprend là où il s'était arrêté (--restart pour tout refaire).
+
+Usage:
+    python backfill.py --snapshots ../snapshots
+    python backfill.py --from 2026-01-01 --to 2026-01-31 --no-audio
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date as Date, datetime, timedelta
+from pathlib import Path
+
+import main as daily
+from archive import DEFAULT_EDITION, get_archive, write_json_atomic
+from articles import Article, as_dict
+from audio_gen import VOICE, generate_audio
+from dedup import deduplicate
+from incremental import articles_fingerprint
+from scraper import merge_articles
+from search_index import get_search_index
+from sources import get_source
+from token_budget import USAGE, get_usage
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Fichier d'état (jours terminés), dans .cache/
+STATE_PATH = Path(__file__).parent.parent / ".cache" / "backfill_state.json"
+
+# Dossier des fichiers audio par jour (relatif au dossier audio du site)
+DAYS_AUDIO_DIR = daily.AUDIO_DIR / "days"
+
+# Nombre de jours traités simultanément (IA et synthèse vocale)
+DAY_CONCURRENCY = 4
+
+# Nombre de processus pour le parsing des pages enregistrées
+PARSE_WORKERS = 4
+
+# Jours parsés en attente de traitement, par jour traité simultanément
+PARSE_AHEAD = 2
+
+SNAPSHOT_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})(?:_([\w-]+))?\.html?$")
+
+
+# =============================================================================
+# SOURCES DES JOURS
+# =============================================================================
+
+def find_snapshots(directory: str | Path) -> dict[str, list[tuple[Path, str]]]:
+    """
+    Liste les pages enregistrées d'un dossier, regroupées par jour.
+
+    Returns:
+        {date: [(chemin, nom de la source), ...]}
+    """
+    days: dict[str, list[tuple[Path, str]]] = {}
+    for path in sorted(Path(directory).iterdir()):
+        match = SNAPSHOT_RE.match(path.name)
+        if match:
+            days.setdefault(match.group(1), []).append((path, match.group(2) or "thehackernews"))
+    return days
+
+
+def parse_snapshot(path: str, source_name: str, num_articles: int) -> list[Article]:
+    """Parse une page enregistrée (exécuté dans un processus du pool)."""
+    source = get_source(source_name)
+    content = Path(path).read_text(encoding="utf-8", errors="replace")
+    articles = [Article.from_dict(article) for article in source.parser(content, num_articles)]
+    for article in articles:
+        article.source = source.name
+    return articles
+
+
+def archived_articles(day: str) -> tuple[list[Article] | None, str | None]:
+    """Articles du dernier briefing archivé d'un jour, sans leurs traductions, et sa date de génération."""
+    briefings = get_archive().read_day(day)
+    if not briefings:
+        return None, None
+    edition = briefings[-1].get("edition") or DEFAULT_EDITION
+    articles = [Article.from_dict(article) for article in briefings[-1]["articles"]]
+    for article in articles:
+        article.pop(f"title_{edition}", None)
+        article.pop(f"summary_{edition}", None)
+    return articles, briefings[-1]["generated_at"]
+
+
+def date_range(start: str, end: str) -> list[str]:
+    """Dates AAAA-MM-JJ de start à end inclus."""
+    first, last = Date.fromisoformat(start), Date.fromisoformat(end)
+    return [(first + timedelta(days=i)).isoformat() for i in range((last - first).days + 1)]
+
+
+# =============================================================================
+# ÉTAT (REPRISE)
+# =============================================================================
+
+def job_key(mode: str, days: list[str], audio: bool) -> str:
+    """Identifiant d'un backfill: change avec les jours, le prompt et la voix."""
+    parts = [mode, ",".join(days), daily.TRANSLATION_PROMPT_VERSION, VOICE if audio else "-"]
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def load_done(key: str) -> set:
+    try:
+        state = json.loads(STATE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return set()
+    return set(state.get("done", [])) if state.get("job") == key else set()
+
+
+def save_done(key: str, done: set) -> None:
+    write_json_atomic(STATE_PATH, {"job": key, "done": sorted(done), "updated_at": time.time()})
+
+
+# =============================================================================
+# TRAITEMENT D'UN JOUR
+# =============================================================================
+
+async def render_day(day: str, news: list[Article], audio: bool,
+                     tts_semaphore: asyncio.Semaphore, generated_at: str | None = None) -> dict:
+    """Traduit, rédige et synthétise le briefing d'un jour en français (generated_at: date d'un briefing archivé)."""
+    # Les fonctions IA synchrones passent par la boucle des providers
+    # (ai_providers.run_sync), où s'appliquent les limites de débit
+    news = await asyncio.to_thread(daily.translate_articles_to_french, news)
+    script = await asyncio.to_thread(daily.generate_radio_script, news)
+
+    audio_file = None
+    if audio:
+        async with tts_semaphore:
+            path = await generate_audio(script, DAYS_AUDIO_DIR / f"{day}.mp3")
+        audio_file = path.relative_to(daily.PUBLIC_DIR).as_posix()
+
+    briefing = {
+        "generated_at": generated_at or f"{day}T00:00:00Z",
+        "edition": "fr",
+        "rendered_at": datetime.utcnow().isoformat() + "Z",
+        "fingerprint": articles_fingerprint(news),
+        "articles": [as_dict(article) for article in news],
+        "script": script,
+        "audio_file": audio_file,
+        "ai_provider": daily.AI_PROVIDER
+    }
+    return briefing
+
+
+def save_day(briefing: dict, replace: bool) -> None:
+    """Écrit le briefing dans l'archive et l'index de recherche (nouvelles traductions pour replace)."""
+    index = get_search_index()
+    date, edition = briefing["generated_at"][:10], briefing.get("edition") or DEFAULT_EDITION
+    if replace:
+        get_archive().replace_latest(briefing)
+        index.reindex_articles(briefing["articles"], date, edition)
+    else:
+        get_archive().append(briefing)
+        index.add_articles(briefing["articles"], date, edition)
+    index.save()
+
+
+async def run_backfill(days: dict, mode: str, audio: bool = True, restart: bool = False,
+                       concurrency: int = DAY_CONCURRENCY, workers: int = PARSE_WORKERS) -> dict:
+    """
+    Génère les briefings des jours donnés.
+
+    Args:
+        days: {date: [(chemin, source), ...]} (mode "snapshots")
+              ou {date: None} (mode "rerender")
+        mode: "snapshots" ou "rerender"
+        audio: Générer un MP3 par jour
+        restart: Ignorer l'état d'un backfill précédent
+        concurrency: Nombre de jours traités simultanément
+        workers: Nombre de processus de parsing
+
+    Returns:
+        {"done": n, "skipped": n, "failed": {date: erreur}}
+    """
+    key = job_key(mode, sorted(days), audio)
+    done = set() if restart else load_done(key)
+    todo = [day for day in sorted(days) if day not in done]
+    report = {"done": 0, "skipped": len(days) - len(todo), "failed": {}}
+    if report["skipped"]:
+        print(f"♻️ {report['skipped']} jours déjà traités (reprise)")
+
+    day_semaphore = asyncio.Semaphore(concurrency)
+    # Jours parsés et pas encore écrits (les jours prennent leur place dans l'ordre des dates)
+    parse_semaphore = asyncio.Semaphore(concurrency * PARSE_AHEAD)
+    tts_semaphore = asyncio.Semaphore(max(1, concurrency // 2))
+    state_lock = asyncio.Lock()
+    loop = asyncio.get_running_loop()
+
+    # Les jours sont écrits dans l'ordre des dates, chacun après le
+    # précédent: chacun s'ajoute à la fin de l'archive, ou s'insère
+    # juste après le jour écrit avant lui
+    written = {day: asyncio.Event() for day in todo}
+    previous = dict(zip(todo[1:], todo))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        async def process(day: str) -> None:
+            try:
+                async with parse_semaphore:
+                    await render_and_save(day)
+            finally:
+                written[day].set()
+
+        def fail(day: str, error: Exception) -> None:
+            # Un jour en échec n'arrête pas les autres (il sera repris au prochain lancement)
+            report["failed"][day] = str(error)
+            print(f"   ❌ {day}: {error}")
+
+        async def render_and_save(day: str) -> None:
+            # Le parsing (CPU) avance sans attendre les places IA/TTS,
+            # dans la limite de parse_semaphore
+            generated_at = None
+            try:
+                if mode == "snapshots":
+                    parsed = await asyncio.gather(*(
+                        loop.run_in_executor(pool, parse_snapshot, str(path), source,
+                                             daily.SCRAPE_CANDIDATES)
+                        for path, source in days[day]
+                    ))
+                    news = deduplicate(merge_articles(parsed))[:daily.NUM_ARTICLES]
+                else:
+                    news, generated_at = await asyncio.to_thread(archived_articles, day)
+            except Exception as e:
+                fail(day, e)
+                return
+            if not news:
+                print(f"   ⏭️ {day}: aucun article")
+                return
+
+            async with day_semaphore:
+                started = time.perf_counter()
+                try:
+                    briefing = await render_day(day, news, audio, tts_semaphore, generated_at)
+                except Exception as e:
+                    fail(day, e)
+                    return
+
+            if day in previous:
+                await written[previous[day]].wait()
+            try:
+                await asyncio.to_thread(save_day, briefing, mode == "rerender")
+            except Exception as e:
+                fail(day, e)
+                return
+            print(f"   ✓ {day} ({len(news)} articles, {time.perf_counter() - started:.1f}s)")
+
+            async with state_lock:
+                done.add(day)
+                report["done"] += 1
+                await asyncio.to_thread(save_done, key, done)
+
+        await asyncio.gather(*(process(day) for day in todo))
+
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Génère les briefings de plusieurs jours en parallèle.")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--snapshots", help="Dossier de pages d'accueil enregistrées (AAAA-MM-JJ.html)")
+    group.add_argument("--from", dest="start", help="Premier jour archivé à régénérer (AAAA-MM-JJ)")
+    parser.add_argument("--to", dest="end", help="Dernier jour à régénérer (défaut: --from)")
+    parser.add_argument("--concurrency", type=int, default=DAY_CONCURRENCY, help="Jours traités simultanément")
+    parser.add_argument("--workers", type=int, default=PARSE_WORKERS, help="Processus de parsing")
+    parser.add_argument("--no-audio", action="store_true", help="Ne pas générer les MP3")
+    parser.add_argument("--restart", action="store_true", help="Ignorer l'état d'un backfill interrompu")
+    args = parser.parse_args(argv)
+
+    try:
+        print(f"🤖 Provider IA configuré: {daily.get_ai_provider().upper()}")
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+    if args.snapshots:
+        mode, days = "snapshots", find_snapshots(args.snapshots)
+    else:
+        mode, days = "rerender", dict.fromkeys(date_range(args.start, args.end or args.start))
+    print(f"📅 {len(days)} jours à traiter ({mode})")
+
+    started = time.perf_counter()
+    report = asyncio.run(run_backfill(days, mode, audio=not args.no_audio, restart=args.restart,
+                                      concurrency=args.concurrency, workers=args.workers))
+    USAGE.save()
+    usage = get_usage()
+    print()
+    print(f"✅ {report['done']} jours générés, {report['skipped']} déjà faits, "
+          f"{len(report['failed'])} en échec ({time.perf_counter() - started:.1f}s)")
+    print(f"🪙 Tokens IA: {usage['prompt_tokens']} envoyés, {usage['completion_tokens']} reçus "
+          f"en {usage['requests']} requêtes (~{usage['cost']:.4f} $)")
+    if report["failed"]:
+        print("💡 Relancez la même commande pour reprendre les jours en échec")
+
+
+if __name__ == "__main__":
+    main()
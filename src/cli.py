@@ -0,0 +1,180 @@
+"""
+CyberDailyWatch - Interface en ligne de commande
+Point d'entrée unique, avec une sous-commande par étape du pipeline.
+
+Chaque sous-commande n'importe que les modules dont elle a besoin
+(COMMAND_MODULES), au moment de son exécution: `scrape` ne charge ni
+les SDK IA ni edge-tts, `speak` ne charge ni le scraper ni les SDK IA.
+Les SDK des providers IA ne sont eux-mêmes importés qu'au premier appel,
+puis leurs clients sont conservés (voir ai_providers.py).
+
+Sous-commandes:
+    - scrape: récupère et affiche les articles des sources
+    - translate: traduit des articles JSON (fichier ou entrée standard)
+    - speak: synthétise un texte en MP3
+    - run: pipeline complet (équivalent de python main.py)
+    - backfill: génération en lot de plusieurs jours (voir backfill.py)
+    - export: exporte les articles de l'archive en NDJSON (voir archive.py)
+    - serve: mode service, rafraîchissements et API HTTP (voir service.py)
+
+Usage:
+    python cli.py scrape --dry-run
+    python cli.py scrape -n 5 --json > articles.json
+    python cli.py translate articles.json
+    python cli.py translate articles.json --edition es
+    python cli.py speak script.txt -o briefing.mp3
+    python cli.py run
+    python cli.py run --editions fr,en,es
+    python cli.py backfill --from 2026-01-01 --to 2026-01-31
+    python cli.py export articles.ndjson.gz --from 2026-01-01
+    python cli.py serve --port 8080 --interval 3600
+"""
+
+import argparse
+import importlib
+import json
+import sys
+from pathlib import Path
+
+# Modules chargés par chaque sous-commande (vérifié par benchmarks/bench_startup.py)
+COMMAND_MODULES = {
+    "scrape": ["scraper"],
+    "translate": ["main"],
+    "speak": ["audio_gen"],
+    "run": ["main"],
+    "backfill": ["backfill"],
+    "export": ["archive"],
+    "serve": ["service"],
+}
+
+
+def load(command: str) -> list:
+    """Importe les modules d'une sous-commande."""
+    return [importlib.import_module(name) for name in COMMAND_MODULES[command]]
+
+
+def _read_input(path: str | None) -> str:
+    if path in (None, "-"):
+        return sys.stdin.read()
+    return Path(path).read_text(encoding="utf-8")
+
+
+# =============================================================================
+# SOUS-COMMANDES
+# =============================================================================
+
+def cmd_scrape(args: argparse.Namespace) -> None:
+    (scraper,) = load("scrape")
+    # Les pages ne sont jamais marquées comme traitées: le prochain run
+    # du pipeline les traitera normalement
+    if args.dry_run:
+        # Aucune écriture: cache HTTP désactivé
+        scraper.USE_HTTP_CACHE = False
+    news = scraper.scrape_sources(args.sources or None, args.num_articles)
+    if args.json:
+        json.dump(news, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return
+    for article in news:
+        print(f"- [{article.get('source')}] {article['title']}")
+        print(f"  {article['url']}")
+
+
+def cmd_translate(args: argparse.Namespace) -> None:
+    (main,) = load("translate")
+    data = json.loads(_read_input(args.input))
+    # Accepte une liste d'articles ou un data.json complet
+    articles = data["articles"] if isinstance(data, dict) else data
+    edition = main.get_edition(args.edition)
+    main.get_ai_provider()
+    json.dump(main.translate_articles(articles, edition), sys.stdout, ensure_ascii=False, indent=2)
+    print()
+
+
+def cmd_speak(args: argparse.Namespace) -> None:
+    (audio_gen,) = load("speak")
+    text = _read_input(args.input).strip()
+    if not text:
+        raise SystemExit("❌ Texte vide")
+    output = audio_gen.generate_audio_sync(text, args.output, voice=args.voice or audio_gen.VOICE)
+    print(f"✅ Audio généré: {output}")
+
+
+def cmd_run(args: argparse.Namespace) -> None:
+    (main,) = load("run")
+    if args.editions:
+        main.EDITIONS = [main.get_edition(code).code for code in args.editions.split(",")]
+    main.main()
+
+
+def cmd_backfill(args: argparse.Namespace) -> None:
+    (backfill,) = load("backfill")
+    backfill.main(args.backfill_args)
+
+
+def cmd_export(args: argparse.Namespace) -> None:
+    (archive,) = load("export")
+    count = archive.get_archive().export_articles(args.output, args.start, args.end)
+    print(f"✅ {count} articles exportés: {args.output}")
+
+
+def cmd_serve(args: argparse.Namespace) -> None:
+    (service,) = load("serve")
+    service.main(args.serve_args)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cli.py", description="CyberDailyWatch - Flash Info Cyber")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scrape = commands.add_parser("scrape", help="Récupère les articles des sources")
+    scrape.add_argument("sources", nargs="*", help="Sources (défaut: sources.DEFAULT_SOURCES)")
+    scrape.add_argument("-n", "--num-articles", type=int, default=3, help="Articles par source")
+    scrape.add_argument("--json", action="store_true", help="Sortie JSON")
+    scrape.add_argument("--dry-run", action="store_true", help="Ne rien écrire (cache HTTP désactivé)")
+    scrape.set_defaults(func=cmd_scrape)
+
+    translate = commands.add_parser("translate", help="Traduit des articles JSON en français")
+    translate.add_argument("input", nargs="?", help="Fichier JSON (défaut: entrée standard)")
+    translate.add_argument("--edition", default="fr", help="Langue cible (voir editions.py)")
+    translate.set_defaults(func=cmd_translate)
+
+    speak = commands.add_parser("speak", help="Synthétise un texte en MP3")
+    speak.add_argument("input", nargs="?", help="Fichier texte (défaut: entrée standard)")
+    speak.add_argument("-o", "--output", help="Fichier MP3 de sortie")
+    speak.add_argument("--voice", help="Voix edge-tts (défaut: audio_gen.VOICE)")
+    speak.set_defaults(func=cmd_speak)
+
+    run = commands.add_parser("run", help="Pipeline complet")
+    run.add_argument("--editions", help="Éditions produites, ex: fr,en,es (défaut: main.EDITIONS)")
+    run.set_defaults(func=cmd_run)
+
+    backfill = commands.add_parser("backfill", help="Génération en lot (options: voir backfill.py)",
+                                   add_help=False)
+    backfill.set_defaults(func=cmd_backfill, forward="backfill_args")
+
+    export = commands.add_parser("export", help="Exporte les articles de l'archive en NDJSON")
+    export.add_argument("output", help="Fichier de sortie (.ndjson, ou .ndjson.gz compressé)")
+    export.add_argument("--from", dest="start", help="Premier jour exporté (AAAA-MM-JJ)")
+    export.add_argument("--to", dest="end", help="Dernier jour exporté (AAAA-MM-JJ)")
+    export.set_defaults(func=cmd_export)
+
+    serve = commands.add_parser("serve", help="Mode service: rafraîchissements et API HTTP (options: voir service.py)",
+                                add_help=False)
+    serve.set_defaults(func=cmd_serve, forward="serve_args")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    # backfill et serve transmettent leurs options au module correspondant
+    if getattr(args, "forward", None):
+        setattr(args, args.forward, extra)
+    elif extra:
+        parser.error(f"arguments non reconnus: {' '.join(extra)}")
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""
+CyberDailyWatch - Détection des doublons
+Regroupe les articles qui racontent la même histoire (MinHash + LSH).
+
+Plusieurs médias couvrent souvent la même fuite ou la même campagne avec
+des titres différents: la déduplication par URL ou titre exact de
+merge_articles() ne les repère pas. Chaque article reçoit une signature
+MinHash calculée sur les paires de mots (shingles) de son titre et de
+son résumé; deux signatures proches indiquent des textes proches
+(similarité de Jaccard).
+
+Pour éviter de comparer tous les articles deux à deux, les signatures
+sont découpées en bandes (LSH): seuls les articles partageant au moins
+une bande sont comparés. L'historique des articles publiés les jours
+précédents est conservé dans SQLite, avec un index sur les bandes: la
+recherche reste rapide avec des dizaines de milliers d'articles.
+
+Configuration modifiable:
+    - NUM_PERM / NUM_BANDS: Taille des signatures et découpage LSH
+    - SIMILARITY_THRESHOLD: Similarité minimale pour un doublon
+    - HISTORY_PATH / HISTORY_DAYS: Historique des articles publiés
+
+Exemple d'utilisation:
+    >>> stories = deduplicate(articles, history=get_history())
+"""
+
+import hashlib
+import random
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from search_index import normalize
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Taille des signatures MinHash et nombre de bandes LSH
+# (NUM_PERM doit être un multiple de NUM_BANDS; 16 bandes de 4 lignes
+# détectent très probablement les paires de similarité > 0.5)
+NUM_PERM = 64
+NUM_BANDS = 16
+
+# Similarité de Jaccard estimée au-delà de laquelle deux articles sont des doublons
+SIMILARITY_THRESHOLD = 0.5
+
+# Historique des articles publiés (dans .cache/, conservé entre deux runs par la CI)
+HISTORY_PATH = Path(__file__).parent.parent / ".cache" / "dedup_history.sqlite3"
+
+# Durée pendant laquelle un article publié sert de référence (en jours)
+HISTORY_DAYS = 3
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+MERSENNE_PRIME = (1 << 61) - 1
+
+
+def shingles(text: str) -> set:
+    """Paires de mots consécutifs du texte normalisé (mots seuls si le texte est court)."""
+    words = WORD_RE.findall(normalize(text))
+    if len(words) < 2:
+        return set(words)
+    return {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+class MinHasher:
+    """
+    Calcule des signatures MinHash de NUM_PERM valeurs.
+
+    Les permutations sont des fonctions (a*x + b) mod p tirées d'un
+    générateur initialisé par `seed`: les signatures restent comparables
+    d'un run à l'autre.
+    """
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.coefficients = [(rng.randrange(1, MERSENNE_PRIME), rng.randrange(MERSENNE_PRIME))
+                             for _ in range(num_perm)]
+
+    def signature(self, text: str) -> tuple:
+        """Signature MinHash du texte (None si le texte est vide)."""
+        values = [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+                  for s in shingles(text)]
+        if not values:
+            return None
+        return tuple(min((a * x + b) % MERSENNE_PRIME for x in values) for a, b in self.coefficients)
+
+
+def similarity(sig1: tuple, sig2: tuple) -> float:
+    """Similarité de Jaccard estimée entre deux signatures."""
+    return sum(1 for a, b in zip(sig1, sig2) if a == b) / len(sig1)
+
+
+def band_keys(signature: tuple, num_bands: int = NUM_BANDS) -> List[str]:
+    """Clés LSH d'une signature: un hash court par bande."""
+    rows = len(signature) // num_bands
+    return [
+        f"{band}:" + hashlib.blake2b(repr(signature[band * rows:(band + 1) * rows]).encode(),
+                                     digest_size=8).hexdigest()
+        for band in range(num_bands)
+    ]
+
+
+def article_text(article: Dict[str, str]) -> str:
+    """
+    Texte comparé: titre et chapeau d'origine.
+
+    Un article résumé depuis sa page complète garde son chapeau dans
+    'teaser': c'est lui qui est comparé, comme lors de la déduplication
+    (faite avant le résumé), pour que l'historique reste comparable.
+    """
+    return f"{article.get('title', '')} {article.get('teaser') or article.get('summary', '')}"
+
+
+# =============================================================================
+# HISTORIQUE
+# =============================================================================
+
+class DedupHistory:
+    """
+    Signatures des articles publiés les jours précédents (SQLite).
+
+    Args:
+        path: Fichier SQLite (":memory:" pour un historique temporaire)
+        num_bands: Nombre de bandes LSH
+    """
+
+    def __init__(self, path: str | Path = HISTORY_PATH, num_bands: int = NUM_BANDS):
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.num_bands = num_bands
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript(
+            """CREATE TABLE IF NOT EXISTS items (
+                id INTEGER PRIMARY KEY,
+                url TEXT NOT NULL UNIQUE,
+                title TEXT NOT NULL,
+                signature TEXT NOT NULL,
+                seen_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS bands (
+                key TEXT NOT NULL,
+                item_id INTEGER NOT NULL REFERENCES items(id) ON DELETE CASCADE
+            );
+            CREATE INDEX IF NOT EXISTS bands_key ON bands (key);
+            CREATE INDEX IF NOT EXISTS bands_item ON bands (item_id);"""
+        )
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.commit()
+
+    def find(self, signature: tuple, threshold: float = SIMILARITY_THRESHOLD,
+             max_age: float = HISTORY_DAYS * 86400) -> dict | None:
+        """
+        Cherche un article récent proche de la signature.
+
+        Seuls les articles partageant une bande LSH sont comparés.
+
+        Returns:
+            {"url": ..., "title": ..., "similarity": ...} ou None
+        """
+        keys = band_keys(signature, self.num_bands)
+        with self._lock:
+            rows = self._conn.execute(
+                f"""SELECT DISTINCT items.url, items.title, items.signature FROM bands
+                    JOIN items ON items.id = bands.item_id
+                    WHERE bands.key IN ({", ".join("?" * len(keys))}) AND items.seen_at >= ?""",
+                (*keys, time.time() - max_age)
+            ).fetchall()
+        best = None
+        for url, title, stored in rows:
+            score = similarity(signature, tuple(int(v) for v in stored.split(",")))
+            if score >= threshold and (best is None or score > best["similarity"]):
+                best = {"url": url, "title": title, "similarity": score}
+        return best
+
+    def add(self, url: str, title: str, signature: tuple) -> None:
+        """Enregistre (ou rafraîchit) un article publié."""
+        with self._lock:
+            self._conn.execute("DELETE FROM items WHERE url = ?", (url,))
+            cursor = self._conn.execute(
+                "INSERT INTO items (url, title, signature, seen_at) VALUES (?, ?, ?, ?)",
+                (url, title, ",".join(map(str, signature)), time.time())
+            )
+            self._conn.executemany(
+                "INSERT INTO bands VALUES (?, ?)",
+                [(key, cursor.lastrowid) for key in band_keys(signature, self.num_bands)]
+            )
+            self._conn.commit()
+
+    def prune(self, max_age: float = HISTORY_DAYS * 86400) -> int:
+        """Supprime les articles trop anciens; retourne leur nombre."""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM items WHERE seen_at < ?", (time.time() - max_age,))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# =============================================================================
+# DÉDUPLICATION
+# =============================================================================
+
+_hasher = MinHasher()
+
+
+def deduplicate(articles: Iterable[Dict[str, str]], history: DedupHistory | None = None,
+                threshold: float = SIMILARITY_THRESHOLD) -> List[Dict[str, str]]:
+    """
+    Fusionne les articles qui racontent la même histoire.
+
+    Dans le lot courant, un doublon est fusionné avec le premier article
+    de son histoire (le mieux classé): le champ "sources" liste alors
+    toutes les sources et URLs. Un article proche d'un article déjà
+    publié récemment sous une autre URL (historique) est écarté.
+
+    Args:
+        articles: Articles (title, url, summary, source), dans l'ordre de priorité
+        history: Historique des jours précédents (None = lot courant seulement)
+        threshold: Similarité minimale pour un doublon
+
+    Returns:
+        Articles uniques, dans l'ordre d'origine
+    """
+    stories: List[Dict[str, str]] = []
+    signatures: List[tuple] = []
+    buckets: Dict[str, List[int]] = {}
+
+    for article in articles:
+        signature = _hasher.signature(article_text(article))
+        if signature is None:
+            stories.append(article.copy())
+            signatures.append(None)
+            continue
+
+        if history is not None:
+            published = history.find(signature, threshold)
+            if published and published["url"] != article["url"]:
+                print(f"   ♊ Déjà couvert: « {article['title'][:50]}... » "
+                      f"(proche de « {published['title'][:40]}... »)")
+                continue
+
+        keys = band_keys(signature)
+        candidates = {i for key in keys for i in buckets.get(key, [])}
+        match = max(candidates, key=lambda i: similarity(signature, signatures[i]), default=None)
+        if match is not None and similarity(signature, signatures[match]) >= threshold:
+            story = stories[match]
+            story.setdefault("sources", [{"source": story.get("source"), "url": story["url"]}])
+            story["sources"].append({"source": article.get("source"), "url": article["url"]})
+            continue
+
+        for key in keys:
+            buckets.setdefault(key, []).append(len(stories))
+        stories.append(article.copy())
+        signatures.append(signature)
+
+    return stories
+
+
+def record_published(articles: Iterable[Dict[str, str]], history: DedupHistory) -> None:
+    """Ajoute les articles publiés à l'historique (et purge les plus anciens)."""
+    for article in articles:
+        signature = _hasher.signature(article_text(article))
+        if signature is not None:
+            history.add(article["url"], article.get("title", ""), signature)
+    history.prune()
+
+
+_history: DedupHistory | None = None
+
+
+def get_history() -> DedupHistory:
+    """Retourne l'historique partagé, ouvert au premier appel."""
+    global _history
+    if _history is None:
+        _history = DedupHistory()
+    return _history
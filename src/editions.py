@@ -0,0 +1,89 @@
+"""
+CyberDailyWatch - Éditions du Flash Info
+Registre des éditions produites à partir d'un même scraping.
+
+Une édition définit la langue du briefing (traduction et script), la
+voix utilisée pour l'audio et la longueur du script. L'édition
+principale (la première de main.EDITIONS) écrit ses fichiers à la racine
+du dossier public (data.json, audio/latest_briefing.mp3); les autres
+éditions écrivent les leurs dans un sous-dossier editions/<code>/.
+
+En mode multi-éditions (main.EDITIONS), les articles sont récupérés et
+dédupliqués une seule fois, puis traduction, script et audio de chaque
+édition s'exécutent en parallèle (voir main.build_pipeline).
+
+Exemple d'utilisation:
+    >>> edition = get_edition("en")
+    >>> edition.directory(PUBLIC_DIR)
+    PosixPath('.../cyber-news/editions/en')
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from audio_gen import VOICE
+
+# Sous-dossier des éditions secondaires (dans le dossier public)
+EDITIONS_DIR = "editions"
+
+
+@dataclass(frozen=True)
+class Edition:
+    """
+    Édition du Flash Info.
+
+    Args:
+        code: Code de langue (ex: "fr"), utilisé dans les noms de champs
+              (title_fr, summary_fr) et dans la mémoire de traduction
+        language: Nom de la langue dans les prompts (ex: "français")
+        journalist: Qualificatif du journaliste radio (ex: "français")
+        voice: Voix edge-tts de l'audio
+        script_max_words: Longueur visée du script radio en mots
+                          (None = main.SCRIPT_MAX_WORDS)
+        translate: Traduire les articles (False si les sources sont
+                   déjà dans la langue de l'édition)
+    """
+    code: str
+    language: str
+    journalist: str
+    voice: str
+    script_max_words: int | None = None
+    translate: bool = True
+
+    def directory(self, public_dir: Path) -> Path:
+        """Dossier des fichiers d'une édition secondaire."""
+        return public_dir / EDITIONS_DIR / self.code
+
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Éditions disponibles (les sources sont en anglais)
+EDITIONS = {
+    edition.code: edition for edition in [
+        Edition("fr", "français", "français", VOICE),
+        Edition("en", "anglais", "anglophone", "en-US-GuyNeural", translate=False),
+        Edition("es", "espagnol", "hispanophone", "es-ES-AlvaroNeural"),
+        Edition("de", "allemand", "germanophone", "de-DE-ConradNeural"),
+    ]
+}
+
+
+def register_edition(edition: Edition) -> Edition:
+    """Ajoute (ou remplace) une édition du registre."""
+    EDITIONS[edition.code] = edition
+    return edition
+
+
+def get_edition(code: str) -> Edition:
+    """
+    Retourne une édition du registre.
+
+    Raises:
+        ValueError: Si l'édition est inconnue
+    """
+    try:
+        return EDITIONS[code]
+    except KeyError:
+        raise ValueError(f"Édition inconnue: {code} (disponibles: {', '.join(EDITIONS)})") from None
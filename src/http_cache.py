@@ -0,0 +1,184 @@
+"""
+CyberDailyWatch - Cache HTTP sur disque
+Mémorise les réponses HTTP (corps + validateurs ETag/Last-Modified)
+pour effectuer des requêtes conditionnelles.
+
+Quand le serveur répond 304 Not Modified, le corps est relu depuis le
+cache: aucune donnée n'est retéléchargée. Le cache est borné en taille
+(éviction LRU) et chaque entrée expire après CACHE_TTL secondes.
+
+Configuration modifiable:
+    - CACHE_DIR: Dossier du cache
+    - CACHE_TTL: Durée de vie d'une entrée (en secondes)
+    - CACHE_MAX_BYTES: Taille maximale du cache (en octets)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Dossier du cache (ignoré par git, conservé entre deux runs par la CI)
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "http"
+
+# Durée de vie d'une entrée: au-delà, la page est retéléchargée entièrement
+CACHE_TTL = 7 * 24 * 3600
+
+# Taille maximale du cache: les entrées les moins récemment utilisées sont supprimées
+CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+
+class HTTPCache:
+    """
+    Cache de réponses HTTP indexé par URL.
+
+    L'index (index.json) contient pour chaque URL les validateurs HTTP,
+    la taille du corps et les dates de stockage/dernier accès. Les corps
+    sont stockés dans des fichiers nommés d'après le hash de l'URL.
+
+    Args:
+        directory: Dossier du cache
+        ttl: Durée de vie d'une entrée (en secondes)
+        max_bytes: Taille maximale cumulée des corps (en octets)
+    """
+
+    def __init__(self, directory: str | Path = CACHE_DIR, ttl: float = CACHE_TTL,
+                 max_bytes: int = CACHE_MAX_BYTES):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+
+    # -------------------------------------------------------------------------
+    # Index
+    # -------------------------------------------------------------------------
+
+    @property
+    def _index_path(self) -> Path:
+        return self.directory / "index.json"
+
+    def _load_index(self) -> dict:
+        try:
+            return json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._index_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self._index, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self._index_path)
+
+    def _body_path(self, url: str) -> Path:
+        return self.directory / (hashlib.sha256(url.encode("utf-8")).hexdigest() + ".body")
+
+    def _remove(self, url: str) -> None:
+        self._index.pop(url, None)
+        self._body_path(url).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """Supprime les entrées les moins récemment utilisées jusqu'à respecter max_bytes."""
+        total = sum(entry["size"] for entry in self._index.values())
+        for url in sorted(self._index, key=lambda u: self._index[u]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            total -= self._index[url]["size"]
+            self._remove(url)
+
+    # -------------------------------------------------------------------------
+    # API publique
+    # -------------------------------------------------------------------------
+
+    def lookup(self, url: str) -> dict | None:
+        """
+        Retourne l'entrée valide associée à l'URL, ou None.
+
+        Les entrées expirées ou dont le corps a disparu sont supprimées.
+        """
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is None:
+                return None
+            if time.time() - entry["stored_at"] > self.ttl or not self._body_path(url).exists():
+                self._remove(url)
+                self._save_index()
+                return None
+            return dict(entry)
+
+    def conditional_headers(self, url: str) -> dict:
+        """En-têtes If-None-Match / If-Modified-Since à envoyer pour cette URL."""
+        entry = self.lookup(url)
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def read(self, url: str) -> bytes | None:
+        """Relit le corps mis en cache et met à jour la date de dernier accès."""
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is None:
+                return None
+            try:
+                body = self._body_path(url).read_bytes()
+            except OSError:
+                self._remove(url)
+                self._save_index()
+                return None
+            entry["last_access"] = time.time()
+            self._save_index()
+            return body
+
+    def store(self, url: str, body: bytes, etag: str | None = None,
+              last_modified: str | None = None, encoding: str | None = None) -> None:
+        """Enregistre (ou remplace) la réponse associée à l'URL."""
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            body_path = self._body_path(url)
+            tmp_path = body_path.with_suffix(".tmp")
+            tmp_path.write_bytes(body)
+            os.replace(tmp_path, body_path)
+
+            now = time.time()
+            self._index[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "encoding": encoding,
+                "size": len(body),
+                "stored_at": now,
+                "last_access": now,
+                "processed": False
+            }
+            self._evict()
+            self._save_index()
+
+    def is_processed(self, url: str) -> bool:
+        """Indique si le contenu en cache a déjà été traité par un run réussi."""
+        with self._lock:
+            entry = self._index.get(url)
+            return bool(entry and entry.get("processed"))
+
+    def mark_processed(self, urls) -> None:
+        """Marque les contenus en cache comme traités par le pipeline."""
+        with self._lock:
+            for url in urls:
+                if url in self._index:
+                    self._index[url]["processed"] = True
+            self._save_index()
+
+    def clear(self) -> None:
+        """Vide entièrement le cache."""
+        with self._lock:
+            for url in list(self._index):
+                self._remove(url)
+            self._save_index()
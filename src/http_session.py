@@ -0,0 +1,224 @@
+"""
+CyberDailyWatch - Session HTTP partagée
+Fournit une session requests unique pour tout le pipeline.
+
+La session garde les connexions ouvertes (keep-alive) dans un pool par
+hôte, relance automatiquement les requêtes en erreur 429/5xx avec un
+délai exponentiel aléatoire (backoff + jitter) et espace les requêtes
+successives vers un même hôte.
+
+Configuration modifiable:
+    - POOL_CONNECTIONS / POOL_MAXSIZE: Taille des pools de connexions
+    - MAX_RETRIES / BACKOFF_FACTOR / BACKOFF_JITTER: Politique de relance
+    - MIN_HOST_INTERVAL: Délai minimal entre deux requêtes vers un même hôte
+
+Exemple d'utilisation:
+    >>> from http_session import get_session, get_stats
+    >>> response = get_session().get("https://thehackernews.com", timeout=15)
+    >>> print(get_stats())
+"""
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from metrics import METRICS
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Nombre d'hôtes dont le pool de connexions est conservé
+POOL_CONNECTIONS = 10
+
+# Nombre maximal de connexions conservées par hôte
+# (doit couvrir le nombre de requêtes simultanées vers un même hôte)
+POOL_MAXSIZE = 10
+
+# Nombre maximal de relances d'une requête
+MAX_RETRIES = 3
+
+# Délai de relance: BACKOFF_FACTOR * 2^(n-1) secondes + aléa dans [0, BACKOFF_JITTER]
+BACKOFF_FACTOR = 0.5
+BACKOFF_JITTER = 0.5
+
+# Codes HTTP déclenchant une relance
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Délai minimal entre deux requêtes vers un même hôte (en secondes, 0 = désactivé)
+MIN_HOST_INTERVAL = 0.2
+
+
+# =============================================================================
+# COMPTEURS
+# =============================================================================
+
+class SessionStats:
+    """Compteurs d'activité de la session (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Remet les compteurs à zéro (début d'un nouveau run)."""
+        with self._lock:
+            self.requests = 0
+            self.retries = 0
+            self.rate_limit_waits = 0
+            self.rate_limit_wait_time = 0.0
+
+    def incr(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + value)
+
+
+STATS = SessionStats()
+
+
+class CountingRetry(Retry):
+    """Politique de relance urllib3 qui comptabilise chaque nouvelle tentative."""
+
+    def increment(self, *args, **kwargs):
+        new_retry = super().increment(*args, **kwargs)
+        # Les redirections passent aussi par increment(): ne pas les compter
+        if new_retry.history and new_retry.history[-1].redirect_location is None:
+            STATS.incr("retries")
+            METRICS.incr("http_retries_total")
+        return new_retry
+
+
+# =============================================================================
+# LIMITATION DE DÉBIT PAR HÔTE
+# =============================================================================
+
+class HostRateLimiter:
+    """
+    Espace les requêtes vers un même hôte d'au moins `min_interval` secondes.
+
+    Les requêtes vers des hôtes différents ne se bloquent pas entre elles.
+    """
+
+    def __init__(self, min_interval: float = MIN_HOST_INTERVAL):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot: dict[str, float] = {}
+
+    def wait(self, url: str) -> None:
+        if self.min_interval <= 0:
+            return
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        delay = slot - now
+        if delay > 0:
+            STATS.incr("rate_limit_waits")
+            STATS.incr("rate_limit_wait_time", delay)
+            time.sleep(delay)
+
+
+# =============================================================================
+# SESSION
+# =============================================================================
+
+class PooledSession(requests.Session):
+    """
+    Session requests avec pool de connexions, relances et limitation par hôte.
+
+    Args:
+        pool_connections: Nombre d'hôtes dont le pool est conservé
+        pool_maxsize: Nombre de connexions conservées par hôte
+        max_retries: Nombre maximal de relances (429/5xx, erreurs réseau)
+        min_host_interval: Délai minimal entre deux requêtes vers un même hôte
+    """
+
+    def __init__(self, pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE,
+                 max_retries: int = MAX_RETRIES, min_host_interval: float = MIN_HOST_INTERVAL):
+        super().__init__()
+        retry = CountingRetry(
+            total=max_retries,
+            backoff_factor=BACKOFF_FACTOR,
+            backoff_jitter=BACKOFF_JITTER,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+            pool_block=False
+        )
+        self.mount("https://", self.adapter)
+        self.mount("http://", self.adapter)
+        self.rate_limiter = HostRateLimiter(min_host_interval)
+
+    def request(self, method, url, *args, **kwargs):
+        self.rate_limiter.wait(url)
+        STATS.incr("requests")
+        host = urlsplit(url).netloc.lower()
+        with METRICS.span("http_request", host=host):
+            response = super().request(method, url, *args, **kwargs)
+        METRICS.incr("http_responses_total", host=host, status=response.status_code)
+        if not kwargs.get("stream"):
+            METRICS.observe("http_response_bytes", len(response.content), host=host)
+        return response
+
+    def connection_stats(self) -> dict:
+        """
+        Statistiques des pools de connexions encore ouverts.
+
+        Une requête servie sans ouvrir de nouvelle connexion (keep-alive)
+        compte comme une réutilisation.
+        """
+        opened = 0
+        served = 0
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                opened += pool.num_connections
+                served += pool.num_requests
+        return {
+            "connections_opened": opened,
+            "requests_served": served,
+            "connections_reused": max(0, served - opened)
+        }
+
+
+_session: PooledSession | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> PooledSession:
+    """
+    Retourne la session HTTP partagée, créée au premier appel.
+
+    Tous les modules qui font des requêtes HTTP (scraper, récupération
+    des articles complets, ...) doivent passer par cette session pour
+    bénéficier du pool de connexions et des relances.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = PooledSession()
+        return _session
+
+
+def get_stats() -> dict:
+    """Compteurs de la session partagée: requêtes, relances, réutilisation des connexions."""
+    stats = {
+        "requests": STATS.requests,
+        "retries": STATS.retries,
+        "rate_limit_waits": STATS.rate_limit_waits,
+        "rate_limit_wait_time": round(STATS.rate_limit_wait_time, 3)
+    }
+    if _session is not None:
+        stats.update(_session.connection_stats())
+    return stats
@@ -0,0 +1,80 @@
+"""
+CyberDailyWatch - Runs incrémentaux
+Comparaison des articles du run courant avec le dernier data.json publié.
+
+Chaque article reçoit une empreinte (hash de son URL, de son titre et de
+son résumé d'origine). L'empreinte de l'ensemble des articles permet de
+détecter un run sans changement: le pipeline s'arrête alors sans rien
+réécrire, donc sans commit. Sinon, les traductions des articles déjà
+publiés sont reprises telles quelles et seuls les nouveaux articles
+sont envoyés à l'IA.
+
+Exemple d'utilisation:
+    >>> previous = load_previous_run(DATA_FILE)
+    >>> if is_unchanged(news, previous):
+    ...     print("Rien à régénérer")
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List
+
+
+def article_hash(article: Dict[str, str]) -> str:
+    """Empreinte d'un article: hash SHA-256 de l'URL, du titre et du résumé d'origine."""
+    fields = (article.get("url", ""), article.get("title", ""), article.get("summary", ""))
+    return hashlib.sha256("\0".join(fields).encode("utf-8")).hexdigest()
+
+
+def articles_fingerprint(news: List[Dict[str, str]]) -> str:
+    """Empreinte de l'ensemble des articles (indépendante de leur ordre)."""
+    hashes = sorted(article.get("content_hash") or article_hash(article) for article in news)
+    return hashlib.sha256("\n".join(hashes).encode("utf-8")).hexdigest()
+
+
+def load_previous_run(path: str | Path) -> dict | None:
+    """Relit le data.json du run précédent (None s'il est absent ou illisible)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def is_unchanged(news: List[Dict[str, str]], previous: dict | None) -> bool:
+    """Indique si les articles sont ceux déjà publiés lors du run précédent."""
+    if not previous or not previous.get("fingerprint"):
+        return False
+    return articles_fingerprint(news) == previous["fingerprint"]
+
+
+def reuse_translations(news: List[Dict[str, str]], previous: dict | None,
+                       language: str = "fr") -> List[Dict[str, str]]:
+    """
+    Annote les articles avec leur empreinte et reprend les traductions publiées.
+
+    Un article dont l'empreinte figure dans le run précédent récupère
+    title_<language> et summary_<language>; les autres restent à traduire.
+
+    Returns:
+        Copie des articles, chacun avec un champ content_hash
+    """
+    title_key, summary_key = f"title_{language}", f"summary_{language}"
+    published = {}
+    for article in (previous or {}).get("articles", []):
+        # Un article resté en anglais (traduction échouée) sera retraduit
+        if article.get(title_key) and article.get(summary_key) and article[title_key] != article.get("title"):
+            published[article.get("content_hash") or article_hash(article)] = article
+
+    result = []
+    for article in news:
+        # Empreinte déjà calculée avant le remplacement du résumé (voir main._stage_summarize)
+        article = dict(article, content_hash=article.get("content_hash") or article_hash(article))
+        match = published.get(article["content_hash"])
+        if match:
+            article[title_key] = match[title_key]
+            article[summary_key] = match[summary_key]
+        result.append(article)
+    return result
@@ -10,6 +10,14 @@ Il orchestre les différentes étapes du pipeline:
 4. Création de l'audio
 5. Sauvegarde des données
 
+Plusieurs éditions (langue, voix, longueur du script) peuvent être
+produites à partir d'un même scraping (EDITIONS, voir editions.py):
+leurs étapes 2 à 5 s'exécutent en parallèle.
+
+Les étapes forment un graphe exécuté par pipeline.py: chaque étape
+démarre dès que ses entrées sont prêtes, avec reprise après la dernière
+étape terminée en cas d'échec et un rapport des durées par étape.
+
 Providers IA supportés:
     - OpenAI (GPT-4o-mini) - prioritaire
     - Google Gemini (gemini-1.5-flash) - fallback automatique
@@ -17,11 +25,15 @@ Providers IA supportés:
 Configuration via fichier .env:
     - OPENAI_API_KEY: Clé API OpenAI
     - GEMINI_API_KEY: Clé API Google Gemini
+    - AI_PROVIDER_CHAIN: Ordre de basculement (défaut: "openai,gemini")
+    - AI_TIMEOUT: Délai maximal d'une tentative IA (en secondes)
 """
 
-import os
+import asyncio
 import json
+import os
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 # =============================================================================
@@ -33,8 +45,25 @@ from dotenv import load_dotenv
 env_path = Path(__file__).parent.parent / ".env"
 load_dotenv(env_path)
 
-from scraper import scrape_hackernews
+from scraper import fetch_article_bodies, mark_sources_processed, scrape_sources
+from http_session import STATS as HTTP_STATS, get_stats as get_http_stats
+from translation_cache import get_translation_cache
 from audio_gen import generate_audio_sync
+from audio_cache import get_audio_cache
+from audio_gen import TTS_CONCURRENCY
+from editions import Edition, get_edition
+from pipeline import Pipeline, PipelineStop, Stage
+from archive import get_archive
+from search_index import get_search_index
+from dedup import deduplicate, get_history, record_published
+from incremental import article_hash, articles_fingerprint, is_unchanged, load_previous_run, reuse_translations
+from summarizer import summarize
+from metrics import METRICS
+from outputs import segment_audio, write_json_outputs
+from token_budget import USAGE, compact_text, count_tokens, get_usage, model_limits, pack
+from ai_providers import (
+    GEMINI_MODEL, OPENAI_MODEL, complete, configured_chain, run_sync
+)
 
 # =============================================================================
 # CONFIGURATION - Modifiez ces valeurs selon vos besoins
@@ -46,16 +75,105 @@ PUBLIC_DIR = PROJECT_ROOT / "cyber-news"
 AUDIO_DIR = PUBLIC_DIR / "audio"
 DATA_FILE = PUBLIC_DIR / "data.json"
 
-# Nombre d'articles à récupérer
+# Nombre d'articles du briefing
 NUM_ARTICLES = 3
 
-# Modèles IA utilisés
-OPENAI_MODEL = "gpt-4o-mini"
-GEMINI_MODEL = "gemini-1.5-flash"
+# Nombre d'articles récupérés par source avant déduplication
+# (les doublons écartés laissent la place aux suivants)
+SCRAPE_CANDIDATES = 6
+
+# Sources interrogées (voir sources.py pour la liste disponible)
+# Ex: ["thehackernews", "bleepingcomputer", "cert-fr"]
+NEWS_SOURCES = ["thehackernews"]
+
+# Arrêter le pipeline si les sources n'ont pas changé depuis le dernier run
+# (réponse HTTP 304 sur toutes les sources, voir http_cache.py)
+SKIP_UNCHANGED = True
+
+# Modèles IA, ordre de basculement et délais: voir ai_providers.py
 
 # Provider IA actif (déterminé automatiquement)
 AI_PROVIDER = None
 
+# Mémoire de traduction persistante (voir translation_cache.py)
+# Incrémentez TRANSLATION_PROMPT_VERSION à chaque modification du prompt
+# de traduction pour ne pas réutiliser les anciennes traductions
+USE_TRANSLATION_CACHE = True
+TRANSLATION_PROMPT_VERSION = "v1"
+
+# Mode de traduction:
+# - "parallel": une requête JSON par article, envoyées en parallèle
+# - "batch": tous les articles dans un seul prompt (mode historique)
+TRANSLATION_MODE = "parallel"
+
+# Nombre maximal de requêtes de traduction simultanées (mode "parallel")
+TRANSLATION_CONCURRENCY = 5
+
+# Nombre de tentatives par article avant de garder le texte original
+TRANSLATION_MAX_ATTEMPTS = 3
+
+# Mode incrémental: comparer les articles au dernier data.json publié,
+# arrêter le run s'ils n'ont pas changé et ne retraiter que les nouveaux
+# (voir incremental.py)
+INCREMENTAL = True
+
+# Fusionner les articles qui racontent la même histoire et écarter
+# ceux déjà couverts les jours précédents (voir dedup.py)
+DEDUPLICATE = True
+
+# Ajouter chaque briefing à l'archive historique (voir archive.py)
+USE_ARCHIVE = True
+
+# Indexer les articles pour la recherche plein texte (voir search_index.py)
+USE_SEARCH_INDEX = True
+
+# Éditions produites à partir d'un même scraping (voir editions.py)
+# La première est l'édition principale (data.json et audio à la racine
+# de PUBLIC_DIR), les autres écrivent dans PUBLIC_DIR/editions/<code>/
+# Ex: ["fr", "en", "es"]
+EDITIONS = ["fr"]
+
+# Nombre maximal de segments audio synthétisés simultanément, toutes
+# éditions confondues (réparti entre les éditions, au plus
+# audio_gen.TTS_CONCURRENCY par édition)
+TTS_MAX_CONCURRENCY = 8
+
+# Nombre maximal d'étapes du pipeline exécutées simultanément, par édition
+# (voir pipeline.py)
+PIPELINE_CONCURRENCY = 4
+
+# Reprendre après la dernière étape terminée si le run précédent a échoué
+RESUME_PIPELINE = True
+
+# Écrire les mesures du run (metrics.json, metrics.prom) à côté de data.json
+# (voir metrics.py)
+WRITE_METRICS = True
+
+# Récupérer le texte complet des nouveaux articles et le réduire à quelques
+# phrases clés (résumé extractif local, voir summarizer.py) avant la
+# traduction et le script: briefings plus riches que le seul chapeau de
+# la page d'accueil, pour des prompts de taille bornée
+SUMMARIZE_ARTICLES = True
+
+# Écrire, à côté de data.json et du MP3, les sorties optimisées pour le
+# frontend: data.min.json précompressé (gzip/brotli), headlines.json pour
+# le premier affichage et rendu HLS segmenté de l'audio (voir outputs.py)
+OPTIMIZED_OUTPUTS = True
+
+# Budget de tokens des requêtes IA (voir token_budget.py)
+# Taille maximale d'un résumé dans les prompts (au-delà, il est raccourci)
+SUMMARY_MAX_TOKENS = 250
+
+# Taille maximale de la réponse d'une requête de traduction groupée
+# (mode "batch"; les articles sont répartis en autant de requêtes que nécessaire)
+TRANSLATION_BATCH_MAX_TOKENS = 3000
+
+# Une traduction française compte environ 30% de tokens de plus que l'anglais
+TRANSLATION_OUTPUT_RATIO = 1.3
+
+# Longueur visée du script radio (en mots, sauf valeur propre à l'édition)
+SCRIPT_MAX_WORDS = 180
+
 
 # =============================================================================
 # FONCTIONS IA - Gestion des providers
@@ -65,9 +183,9 @@ def get_ai_provider() -> str:
     """
     Détermine quel provider IA utiliser selon les clés disponibles.
     
-    Ordre de priorité:
-    1. OpenAI si OPENAI_API_KEY est définie
-    2. Gemini si GEMINI_API_KEY ou GOOGLE_API_KEY est définie
+    Le premier provider configuré de la chaîne AI_PROVIDER_CHAIN est
+    retenu (par défaut: OpenAI si OPENAI_API_KEY est définie, sinon
+    Gemini si GEMINI_API_KEY ou GOOGLE_API_KEY est définie).
     
     Returns:
         str: Nom du provider ("openai" ou "gemini")
@@ -77,25 +195,25 @@ def get_ai_provider() -> str:
     """
     global AI_PROVIDER
     
-    if os.environ.get("OPENAI_API_KEY"):
-        AI_PROVIDER = "openai"
-        return "openai"
-    elif os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY"):
-        AI_PROVIDER = "gemini"
-        return "gemini"
-    else:
+    providers = configured_chain()
+    if not providers:
         raise ValueError(
             "❌ Aucune clé API trouvée!\n"
             "💡 Ajoutez OPENAI_API_KEY ou GEMINI_API_KEY dans le fichier .env"
         )
+    AI_PROVIDER = providers[0].name
+    return AI_PROVIDER
 
 
-def call_ai(system_prompt: str, user_prompt: str, temperature: float = 0.7, max_tokens: int = 500) -> str:
+async def call_ai_async(system_prompt: str, user_prompt: str, temperature: float = 0.7,
+                        max_tokens: int = 500, json_mode: bool = False) -> str:
     """
-    Appelle le provider IA avec basculement automatique.
+    Appelle le provider IA avec basculement automatique (version asynchrone).
     
-    Essaie d'abord OpenAI, puis bascule vers Gemini en cas d'erreur
-    (quota dépassé, erreur réseau, etc.).
+    Les providers de AI_PROVIDER_CHAIN sont essayés dans l'ordre (OpenAI
+    puis Gemini par défaut) en cas d'erreur ou de délai dépassé
+    (quota dépassé, erreur réseau, etc.). Les clients des providers sont
+    créés une seule fois puis réutilisés (voir ai_providers.py).
     
     Args:
         system_prompt: Instructions système pour l'IA
@@ -104,133 +222,135 @@ def call_ai(system_prompt: str, user_prompt: str, temperature: float = 0.7, max_
                      0 = réponses déterministes
                      1 = réponses créatives
         max_tokens: Longueur maximale de la réponse
+        json_mode: Exiger une réponse JSON valide (mode JSON du provider)
     
     Returns:
         str: Réponse générée par l'IA
     
     Raises:
+        ValueError: Si aucun provider n'est configuré
         RuntimeError: Si tous les providers échouent
     """
     global AI_PROVIDER
     
-    # ==========================================================================
-    # TENTATIVE OPENAI
-    # ==========================================================================
-    if os.environ.get("OPENAI_API_KEY"):
-        try:
-            from openai import OpenAI
-            client = OpenAI()
-            
-            response = client.chat.completions.create(
-                model=OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
-            AI_PROVIDER = "openai"
-            return response.choices[0].message.content.strip()
-            
-        except Exception as e:
-            error_msg = str(e).lower()
-            if "quota" in error_msg or "rate" in error_msg or "insufficient" in error_msg:
-                print(f"   ⚠️ OpenAI: quota dépassé, basculement vers Gemini...")
-            else:
-                print(f"   ⚠️ Erreur OpenAI: {e}")
-                print(f"   🔄 Basculement vers Gemini...")
-    
-    # ==========================================================================
-    # FALLBACK GEMINI
-    # ==========================================================================
-    gemini_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
-    if gemini_key:
-        try:
-            import google.generativeai as genai
-            
-            genai.configure(api_key=gemini_key)
-            model = genai.GenerativeModel(GEMINI_MODEL)
-            
-            # Gemini n'a pas de "system prompt" séparé, on combine
-            full_prompt = f"{system_prompt}\n\n{user_prompt}"
-            
-            response = model.generate_content(
-                full_prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=temperature,
-                    max_output_tokens=max_tokens
-                )
-            )
-            AI_PROVIDER = "gemini"
-            return response.text.strip()
-            
-        except Exception as e:
-            raise RuntimeError(f"❌ Erreur Gemini: {e}")
+    result = await complete(system_prompt, user_prompt, temperature, max_tokens, json_mode)
+    AI_PROVIDER = result.provider
+    return result.text
+
+
+def call_ai(system_prompt: str, user_prompt: str, temperature: float = 0.7, max_tokens: int = 500,
+            json_mode: bool = False) -> str:
+    """
+    Appelle le provider IA avec basculement automatique.
+    
+    Version synchrone de call_ai_async: la requête est exécutée sur la
+    boucle persistante des providers (voir ai_providers.run_sync).
+    
+    Args:
+        system_prompt: Instructions système pour l'IA
+        user_prompt: Message/question de l'utilisateur
+        temperature: Niveau de créativité (0-1, défaut: 0.7)
+        max_tokens: Longueur maximale de la réponse
+        json_mode: Exiger une réponse JSON valide (mode JSON du provider)
+    
+    Returns:
+        str: Réponse générée par l'IA
     
-    raise ValueError(
-        "❌ Aucun provider IA disponible.\n"
-        "💡 Vérifiez vos clés API dans le fichier .env"
-    )
+    Raises:
+        ValueError: Si aucun provider n'est configuré
+        RuntimeError: Si tous les providers échouent
+    """
+    return run_sync(call_ai_async(system_prompt, user_prompt, temperature, max_tokens, json_mode))
 
 
 # =============================================================================
 # FONCTIONS DE TRAITEMENT
 # =============================================================================
 
-def translate_articles_to_french(news: list[dict]) -> list[dict]:
+TRANSLATION_SYSTEM_PROMPT = "Tu es un traducteur professionnel anglais-{language} spécialisé en cybersécurité."
+
+
+def _edition(edition: Edition | None) -> Edition:
+    """Édition demandée (par défaut: l'édition française)."""
+    return edition or get_edition("fr")
+
+
+def _chain_limits() -> tuple[str | None, int, int]:
     """
-    Traduit les articles en français via l'IA.
-    
-    Ajoute les champs 'title_fr' et 'summary_fr' à chaque article
-    tout en conservant les versions originales.
-    
-    Args:
-        news: Liste d'articles avec title, url, summary (en anglais)
+    Limites communes aux providers configurés: le modèle le plus
+    contraint est retenu, la requête restant valable après un basculement.
+
+    Returns:
+        Tuple (modèle servant au comptage des tokens, contexte, sortie maximale)
+    """
+    models = [provider.model for provider in configured_chain()] or [OPENAI_MODEL]
+    context = min(model_limits(model)["context"] for model in models)
+    output = min(model_limits(model)["output"] for model in models)
+    return models[0], context, output
+
+
+def _compact_summary(text: str, max_tokens: int = SUMMARY_MAX_TOKENS) -> str:
+    """Résumé raccourci pour les prompts (texte inchangé s'il tient dans le budget)."""
+    return compact_text(text, max_tokens, _chain_limits()[0])
+
+
+def _translation_tokens(article: dict, model: str | None) -> tuple[int, int]:
+    """Tokens d'un article dans le prompt de traduction et tokens attendus en réponse."""
+    size = count_tokens(article["title"], model) + count_tokens(_compact_summary(article["summary"]), model)
+    return size + 10, int(size * TRANSLATION_OUTPUT_RATIO) + 20
+
+
+def _translate_batch(articles: list[dict], edition: Edition) -> list[tuple | None]:
+    """
+    Traduit tous les articles en un seul prompt (mode "batch").
     
     Returns:
-        Liste d'articles enrichie avec title_fr et summary_fr
+        Pour chaque article, (titre, résumé, modèle) ou None si la
+        traduction n'a pas pu être extraite de la réponse
     """
-    # Préparer le contenu à traduire
     articles_text = "\n\n".join([
-        f"[ARTICLE {i+1}]\nTITLE: {article['title']}\nSUMMARY: {article['summary']}"
-        for i, article in enumerate(news)
+        f"[ARTICLE {i+1}]\nTITLE: {article['title']}\nSUMMARY: {_compact_summary(article['summary'])}"
+        for i, article in enumerate(articles)
     ])
     
-    system_prompt = "Tu es un traducteur professionnel anglais-français spécialisé en cybersécurité."
-    
-    user_prompt = f"""Traduis les titres et résumés suivants en français.
+    user_prompt = f"""Traduis les titres et résumés suivants en {edition.language}.
 Garde le même format de réponse avec les numéros d'articles.
 
 {articles_text}
 
 Réponds uniquement avec le format suivant pour chaque article:
 [ARTICLE 1]
-TITRE: <titre en français>
-RESUME: <résumé en français>
+TITRE: <titre en {edition.language}>
+RESUME: <résumé en {edition.language}>
 
 [ARTICLE 2]
 ...etc"""
 
-    translated_text = call_ai(system_prompt, user_prompt, temperature=0.3, max_tokens=1500)
+    model, _, output_limit = _chain_limits()
+    expected = sum(_translation_tokens(article, model)[1] for article in articles)
+    max_tokens = min(output_limit, max(256, int(expected * 1.2)))
+    system_prompt = TRANSLATION_SYSTEM_PROMPT.format(language=edition.language)
+    global AI_PROVIDER
+    # Le modèle noté avec chaque traduction est celui qui a répondu (après un éventuel basculement)
+    result = run_sync(complete(system_prompt, user_prompt, temperature=0.3, max_tokens=max_tokens))
+    AI_PROVIDER = result.provider
+    translated_text, model = result.text, result.model
     
     # Parser les traductions
-    translated_articles = []
-    for i, article in enumerate(news):
-        article_copy = article.copy()
+    results = []
+    for i in range(len(articles)):
+        title_fr = None
+        summary_fr = None
         
         try:
             # Extraire la section de l'article
             article_section = translated_text.split(f"[ARTICLE {i+1}]")[1]
-            if i + 2 <= len(news):
+            if i + 2 <= len(articles):
                 article_section = article_section.split(f"[ARTICLE {i+2}]")[0]
             
             # Extraire le titre traduit
             if "TITRE:" in article_section:
-                title_line = article_section.split("TITRE:")[1].split("\n")[0].strip()
-                article_copy["title_fr"] = title_line
-            else:
-                article_copy["title_fr"] = article["title"]
+                title_fr = article_section.split("TITRE:")[1].split("\n")[0].strip()
             
             # Extraire le résumé traduit
             if "RESUME:" in article_section or "RÉSUMÉ:" in article_section:
@@ -238,48 +358,255 @@ RESUME: <résumé en français>
                     summary_text = article_section.split("RESUME:")[1].strip()
                 else:
                     summary_text = article_section.split("RÉSUMÉ:")[1].strip()
-                summary_text = summary_text.split("[ARTICLE")[0].strip()
-                article_copy["summary_fr"] = summary_text
-            else:
-                article_copy["summary_fr"] = article["summary"]
+                summary_fr = summary_text.split("[ARTICLE")[0].strip()
                 
         except (IndexError, KeyError):
             # En cas d'erreur de parsing, garder l'original
-            article_copy["title_fr"] = article["title"]
-            article_copy["summary_fr"] = article["summary"]
+            pass
+        
+        results.append((title_fr, summary_fr, model) if title_fr and summary_fr else None)
+    
+    return results
+
+
+def _translate_batches(articles: list[dict], edition: Edition) -> list[tuple | None]:
+    """
+    Répartit les articles en requêtes groupées (mode "batch").
+
+    Chaque requête reçoit autant d'articles que possible sans dépasser
+    le contexte du modèle ni TRANSLATION_BATCH_MAX_TOKENS en réponse:
+    la traduction n'est pas tronquée quand NUM_ARTICLES augmente.
+    """
+    model, context, output_limit = _chain_limits()
+    max_output = min(output_limit, TRANSLATION_BATCH_MAX_TOKENS)
+    fixed = count_tokens(TRANSLATION_SYSTEM_PROMPT.format(language=edition.language), model) + 150
+    batches = pack(articles,
+                   size=lambda article: _translation_tokens(article, model)[0],
+                   max_input=context - max_output - fixed,
+                   max_output=int(max_output / 1.2),
+                   output_size=lambda article: _translation_tokens(article, model)[1])
+    if len(batches) > 1:
+        print(f"   📦 {len(articles)} articles répartis en {len(batches)} requêtes")
+    return [result for batch in batches for result in _translate_batch(batch, edition)]
+
+
+def parse_json_translation(text: str) -> tuple[str, str]:
+    """
+    Valide la réponse JSON d'une traduction d'article.
+    
+    Accepte une réponse entourée d'un bloc ```json ... ```.
+    
+    Returns:
+        Tuple (titre, résumé)
+    
+    Raises:
+        ValueError: Si la réponse n'est pas un objet JSON avec des champs
+                    "titre" et "resume" non vides
+    """
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.strip("`").removeprefix("json").strip()
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"JSON invalide: {e}") from None
+    if not isinstance(data, dict):
+        raise ValueError("La réponse n'est pas un objet JSON")
+    
+    title_fr = data.get("titre")
+    summary_fr = data.get("resume", data.get("résumé"))
+    if not isinstance(title_fr, str) or not title_fr.strip():
+        raise ValueError("Champ 'titre' manquant ou vide")
+    if not isinstance(summary_fr, str) or not summary_fr.strip():
+        raise ValueError("Champ 'resume' manquant ou vide")
+    return title_fr.strip(), summary_fr.strip()
+
+
+async def translate_article(article: dict, edition: Edition | None = None) -> tuple[str, str, str]:
+    """
+    Traduit un article seul avec une réponse JSON structurée.
+    
+    Une réponse invalide est redemandée (jusqu'à TRANSLATION_MAX_ATTEMPTS
+    tentatives) sans toucher aux autres articles.
+    
+    Args:
+        article: Article avec title et summary (en anglais)
+        edition: Édition cible (défaut: français)
+    
+    Returns:
+        Tuple (titre, résumé, modèle utilisé)
+    
+    Raises:
+        ValueError: Si aucune tentative n'a produit une réponse valide
+    """
+    edition = _edition(edition)
+    user_prompt = f"""Traduis en {edition.language} le titre et le résumé de cet article.
+
+TITLE: {article['title']}
+SUMMARY: {_compact_summary(article['summary'])}
+
+Réponds uniquement avec un objet JSON de la forme:
+{{"titre": "<titre en {edition.language}>", "resume": "<résumé en {edition.language}>"}}"""
+
+    model, _, output_limit = _chain_limits()
+    max_tokens = min(output_limit, int(_translation_tokens(article, model)[1] * 1.2) + 30)
+    global AI_PROVIDER
+    
+    last_error = None
+    for attempt in range(1, TRANSLATION_MAX_ATTEMPTS + 1):
+        try:
+            result = await complete(TRANSLATION_SYSTEM_PROMPT.format(language=edition.language), user_prompt,
+                                    temperature=0.3, max_tokens=max_tokens, json_mode=True)
+            AI_PROVIDER = result.provider
+            title_fr, summary_fr = parse_json_translation(result.text)
+            return title_fr, summary_fr, result.model
+        except (ValueError, RuntimeError) as e:
+            last_error = e
+            print(f"   ⚠️ Traduction de « {article['title'][:40]}... » "
+                  f"(tentative {attempt}/{TRANSLATION_MAX_ATTEMPTS}): {e}")
+    raise ValueError(f"Traduction impossible: {last_error}")
+
+
+async def _translate_parallel(articles: list[dict], edition: Edition) -> list[tuple | None]:
+    """
+    Traduit les articles un par un, en parallèle (mode "parallel").
+    
+    Au plus TRANSLATION_CONCURRENCY requêtes sont en cours simultanément;
+    la durée totale reste proche de celle de la requête la plus lente.
+    """
+    semaphore = asyncio.Semaphore(TRANSLATION_CONCURRENCY)
+    
+    async def worker(article: dict) -> tuple | None:
+        async with semaphore:
+            try:
+                return await translate_article(article, edition)
+            except ValueError:
+                return None
+    
+    return await asyncio.gather(*(worker(article) for article in articles))
+
+
+def translate_articles(news: list[dict], edition: Edition | None = None) -> list[dict]:
+    """
+    Traduit les articles dans la langue d'une édition via l'IA.
+    
+    Ajoute les champs 'title_<code>' et 'summary_<code>' à chaque article
+    (ex: title_fr, summary_fr) tout en conservant les versions originales.
+    
+    Les articles qui ont déjà ces champs (repris du run précédent, voir
+    incremental.py) sont conservés tels quels. Les autres articles déjà
+    traduits sont relus depuis la mémoire de traduction (voir
+    translation_cache.py): seuls les articles absents du cache sont
+    envoyés à l'IA, selon TRANSLATION_MODE.
+    Un article dont la traduction échoue garde son texte original.
+    
+    Args:
+        news: Liste d'articles avec title, url, summary (en anglais)
+        edition: Édition cible (défaut: français)
+    
+    Returns:
+        Liste d'articles enrichie avec title_<code> et summary_<code>
+    """
+    edition = _edition(edition)
+    title_key, summary_key = f"title_{edition.code}", f"summary_{edition.code}"
+    cache = get_translation_cache() if USE_TRANSLATION_CACHE else None
+    models = [OPENAI_MODEL, GEMINI_MODEL]
+    
+    translated_articles = [article.copy() for article in news]
+    misses = []
+    for article in translated_articles:
+        if article.get(title_key) and article.get(summary_key):
+            continue
+        if not edition.translate:
+            # Sources déjà dans la langue de l'édition
+            article[title_key] = article["title"]
+            article[summary_key] = article["summary"]
+            continue
+        cached = cache.get(article["title"], article["summary"], models,
+                           TRANSLATION_PROMPT_VERSION, edition.code) if cache else None
+        if cached:
+            article[title_key] = cached["title"]
+            article[summary_key] = cached["summary"]
+        else:
+            misses.append(article)
+    
+    if not misses:
+        return translated_articles
+    
+    if TRANSLATION_MODE == "parallel":
+        results = run_sync(_translate_parallel(misses, edition))
+    else:
+        results = _translate_batches(misses, edition)
+    
+    for article_copy, result in zip(misses, results):
+        if result is None:
+            # En cas d'échec, garder l'original
+            article_copy[title_key] = article_copy["title"]
+            article_copy[summary_key] = article_copy["summary"]
+            continue
         
-        translated_articles.append(article_copy)
+        title_tr, summary_tr, model = result
+        article_copy[title_key] = title_tr
+        article_copy[summary_key] = summary_tr
+        
+        # Seules les traductions complètes sont mémorisées
+        if cache and model:
+            cache.put(article_copy["title"], article_copy["summary"], model,
+                      TRANSLATION_PROMPT_VERSION, title_tr, summary_tr, edition.code)
     
     return translated_articles
 
 
-def generate_radio_script(news: list[dict]) -> str:
+def translate_articles_to_french(news: list[dict]) -> list[dict]:
     """
-    Génère un script radio "Flash Info Cyber" en français.
+    Traduit les articles en français via l'IA (voir translate_articles).
     
-    Le script est optimisé pour une lecture audio d'environ 1 minute.
+    Args:
+        news: Liste d'articles avec title, url, summary (en anglais)
+    
+    Returns:
+        Liste d'articles enrichie avec title_fr et summary_fr
+    """
+    return translate_articles(news, get_edition("fr"))
+
+
+def generate_radio_script(news: list[dict], edition: Edition | None = None) -> str:
+    """
+    Génère un script radio "Flash Info Cyber" dans la langue d'une édition.
+    
+    Le script est optimisé pour une lecture audio d'environ 1 minute
+    (SCRIPT_MAX_WORDS, ou la longueur propre à l'édition).
     
     Args:
-        news: Liste d'articles avec title_fr et summary_fr
+        news: Liste d'articles avec title_<code> et summary_<code>
+        edition: Édition cible (défaut: français)
     
     Returns:
         Script radio prêt à être converti en audio
     """
-    # Utiliser les traductions françaises
+    edition = _edition(edition)
+    max_words = edition.script_max_words or SCRIPT_MAX_WORDS
+    model, context, output_limit = _chain_limits()
+    # Environ 2 tokens par mot en français, avec une marge
+    max_tokens = min(output_limit, max_words * 2 + 150)
+    
+    # Utiliser les traductions de l'édition, résumés raccourcis si le
+    # contexte ne peut pas tous les contenir
+    summary_budget = max(50, min(SUMMARY_MAX_TOKENS, (context - max_tokens - 500) // max(1, len(news))))
     news_content = "\n\n".join([
-        f"**{i+1}. {article.get('title_fr', article['title'])}**\n"
-        f"{article.get('summary_fr', article['summary'])}"
+        f"**{i+1}. {article.get(f'title_{edition.code}', article['title'])}**\n"
+        f"{_compact_summary(article.get(f'summary_{edition.code}', article['summary']), summary_budget)}"
         for i, article in enumerate(news)
     ])
     
-    system_prompt = "Tu es un journaliste radio français spécialisé en cybersécurité."
+    system_prompt = f"Tu es un journaliste radio {edition.journalist} spécialisé en cybersécurité."
     
-    user_prompt = f"""Rédige un script de "Flash Info Cyber" en français.
+    user_prompt = f"""Rédige un script de "Flash Info Cyber" en {edition.language}.
 
 CONTRAINTES:
-- Durée de lecture: environ 1 minute (150-180 mots)
+- Durée de lecture: environ 1 minute ({max_words - 30}-{max_words} mots)
 - Ton: professionnel mais accessible
-- Structure: introduction accrocheuse, 3 brèves actualités, conclusion
+- Structure: introduction accrocheuse, {len(news)} brèves actualités, conclusion
 - Style: phrases courtes et dynamiques pour la radio
 - Ne pas inclure les URLs
 - Commencer par une formule d'introduction engageante
@@ -289,55 +616,341 @@ ACTUALITÉS DU JOUR:
 
 Rédige uniquement le script, sans indication technique."""
 
-    return call_ai(system_prompt, user_prompt, temperature=0.7, max_tokens=500)
+    return call_ai(system_prompt, user_prompt, temperature=0.7, max_tokens=max_tokens)
+
+
+def _edition_files(edition: Edition) -> tuple[Path, Path]:
+    """
+    Fichiers data.json et MP3 d'une édition.
+
+    L'édition principale (la première de EDITIONS) écrit DATA_FILE et
+    AUDIO_DIR; les autres écrivent dans PUBLIC_DIR/editions/<code>/.
+    """
+    if edition.code == EDITIONS[0]:
+        return DATA_FILE, AUDIO_DIR / "latest_briefing.mp3"
+    directory = edition.directory(PUBLIC_DIR)
+    return directory / "data.json", directory / "audio" / "latest_briefing.mp3"
 
 
-def save_data_json(news: list[dict], script: str) -> None:
+def save_data_json(news: list[dict], script: str, edition: Edition | None = None) -> None:
     """
     Sauvegarde les données générées en JSON pour le frontend.
     
     Le fichier data.json contient:
     - Date de génération
+    - Empreinte des articles (voir incremental.py)
     - Liste des articles (avec traductions)
     - Script radio
-    - Chemin du fichier audio
+    - Chemin du fichier audio (et de sa playlist HLS, voir outputs.py)
+    - Chemin du manifeste de l'archive (voir archive.py)
+    - Chemin du manifeste de l'index de recherche (voir search_index.py)
     - Provider IA utilisé
+    - Édition, et pour l'édition principale les data.json des autres éditions
+    
+    Les chemins sont relatifs au dossier du data.json. Avec
+    OPTIMIZED_OUTPUTS, data.min.json et headlines.json (et leurs versions
+    compressées) sont écrits à côté.
     
     Args:
         news: Liste des articles enrichis
         script: Script radio généré
+        edition: Édition sauvegardée (défaut: français)
     """
+    edition = _edition(edition)
+    data_file, audio_path = _edition_files(edition)
+    directory = data_file.parent
+    
+    def relative(path: Path) -> str:
+        return Path(os.path.relpath(path, directory)).as_posix()
+    
+    playlist = audio_path.with_suffix(".m3u8")
     data = {
         "generated_at": datetime.utcnow().isoformat() + "Z",
+        "fingerprint": articles_fingerprint(news),
+        "edition": edition.code,
         "articles": news,
         "script": script,
-        "audio_file": "audio/latest_briefing.mp3",
+        "audio_file": relative(audio_path),
+        "audio_playlist": relative(playlist) if OPTIMIZED_OUTPUTS and playlist.exists() else None,
+        "archive_index": relative(PUBLIC_DIR / "archive" / "index.json") if USE_ARCHIVE else None,
+        "search_index": relative(PUBLIC_DIR / "archive" / "search" / "index.json") if USE_SEARCH_INDEX else None,
         "ai_provider": AI_PROVIDER
     }
+    if edition.code == EDITIONS[0] and len(EDITIONS) > 1:
+        data["editions"] = {
+            code: relative(_edition_files(get_edition(code))[0]) for code in EDITIONS[1:]
+        }
     
-    PUBLIC_DIR.mkdir(parents=True, exist_ok=True)
+    directory.mkdir(parents=True, exist_ok=True)
     
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
+    # Écriture atomique: le fichier reste lisible pendant la sauvegarde (voir service.py)
+    tmp_file = data_file.with_name(data_file.name + ".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, data_file)
     
-    print(f"✅ Données sauvegardées: {DATA_FILE}")
+    print(f"✅ Données sauvegardées: {data_file}")
+    if OPTIMIZED_OUTPUTS:
+        outputs = write_json_outputs(data_file, data)
+        print(f"   ✓ Sorties optimisées: {', '.join(path.name for path in outputs)}")
 
 
 # =============================================================================
 # FONCTION PRINCIPALE
 # =============================================================================
 
+def _tag(edition: Edition) -> str:
+    """Préfixe des messages d'une édition (seulement en mode multi-éditions)."""
+    return f"[{edition.code}] " if len(EDITIONS) > 1 else ""
+
+
+def _stage_scrape() -> list[dict]:
+    """Étape 1: récupération des actualités."""
+    print("📰 Étape 1: Récupération des actualités...")
+    news = scrape_sources(NEWS_SOURCES, SCRAPE_CANDIDATES, skip_unchanged=SKIP_UNCHANGED)
+    
+    if news is None:
+        raise PipelineStop("ℹ️ Sources inchangées depuis le dernier run. Rien à régénérer.")
+    
+    if not news:
+        raise PipelineStop("❌ Aucune actualité trouvée. Arrêt du processus.")
+    
+    print(f"   ✓ {len(news)} articles récupérés")
+    METRICS.set_gauge("articles", len(news), step="scraped")
+    return news
+
+
+def _stage_dedup(news: list[dict]) -> list[dict]:
+    """Fusion des doublons entre sources et avec les jours précédents."""
+    if DEDUPLICATE:
+        unique = deduplicate(news, history=get_history())
+        merged = sum(len(article.get("sources", [])) - 1 for article in unique if "sources" in article)
+        if len(unique) < len(news):
+            print(f"   ✓ {len(news) - len(unique)} doublons écartés ({merged} fusionnés)")
+        news = unique
+    news = news[:NUM_ARTICLES]
+    if not news:
+        raise PipelineStop("❌ Aucune actualité nouvelle. Arrêt du processus.")
+    for article in news:
+        print(f"     - {article['title'][:60]}...")
+    return news
+
+
+def _stage_load_previous() -> dict:
+    """Relit le data.json publié par le run précédent, pour chaque édition (mode incrémental)."""
+    if not INCREMENTAL:
+        return {}
+    return {code: load_previous_run(_edition_files(get_edition(code))[0]) for code in EDITIONS}
+
+
+def _stage_compare(news: list[dict], previous: dict) -> list[dict]:
+    """Arrête le run si toutes les éditions ont déjà publié ces articles."""
+    if previous and all(
+        is_unchanged(news, previous.get(code)) and _edition_files(get_edition(code))[1].exists()
+        for code in EDITIONS
+    ):
+        mark_sources_processed()
+        raise PipelineStop("ℹ️ Articles identiques au dernier run. Rien à régénérer.")
+    return news
+
+
+def _stage_summarize(news: list[dict]) -> list[dict]:
+    """
+    Remplace le chapeau de chaque article par un résumé de son texte complet.
+
+    L'empreinte de l'article (content_hash) est calculée avant, sur le
+    chapeau: la comparaison avec le run précédent n'en dépend pas. Le
+    chapeau est conservé dans le champ 'teaser'; un article dont la page
+    est inaccessible, ou dont le résumé serait plus court, le garde.
+    """
+    if not SUMMARIZE_ARTICLES:
+        return news
+    print("✂️ Résumé des articles complets...")
+    bodies = fetch_article_bodies(news)
+    model = _chain_limits()[0]
+    result = []
+    tokens = []
+    for article, body in zip(news, bodies):
+        article = dict(article, content_hash=article.get("content_hash") or article_hash(article))
+        summary = summarize(body) if body else ""
+        if len(summary) > len(article["summary"]):
+            tokens.append((count_tokens(body, model), count_tokens(summary, model)))
+            METRICS.observe("article_body_tokens", tokens[-1][0])
+            METRICS.observe("article_summary_tokens", tokens[-1][1])
+            article["teaser"] = article["summary"]
+            article["summary"] = summary
+        result.append(article)
+    if tokens:
+        print(f"   ✓ {len(tokens)}/{len(news)} articles résumés "
+              f"({sum(t[0] for t in tokens)} → {sum(t[1] for t in tokens)} tokens)")
+    return result
+
+
+def _stage_translate(edition: Edition, news: list[dict], previous: dict) -> list[dict]:
+    """Étape 2: traduction (les traductions du run précédent sont reprises)."""
+    print(f"🌍 {_tag(edition)}Étape 2: Traduction des articles en {edition.language}...")
+    news = reuse_translations(news, previous.get(edition.code), edition.code)
+    reused = sum(1 for article in news if f"title_{edition.code}" in article)
+    if reused:
+        print(f"   ♻️ {_tag(edition)}{reused}/{len(news)} articles déjà publiés au run précédent")
+    news = translate_articles(news, edition)
+    print(f"   ✓ {_tag(edition)}Articles traduits (via {AI_PROVIDER})")
+    for article in news:
+        print(f"     - {_tag(edition)}{article.get(f'title_{edition.code}', article['title'])[:60]}...")
+    return news
+
+
+def _stage_script(edition: Edition, news: list[dict]) -> str:
+    """Étape 3: génération du script radio."""
+    print(f"🤖 {_tag(edition)}Étape 3: Génération du script radio...")
+    script = generate_radio_script(news, edition)
+    print(f"   ✓ {_tag(edition)}Script généré ({len(script.split())} mots) via {AI_PROVIDER}")
+    METRICS.set_gauge("script_words", len(script.split()), edition=edition.code)
+    return script
+
+
+def _stage_audio(edition: Edition, script: str, previous: dict) -> str:
+    """Étape 4: génération de l'audio (sautée si le script n'a pas changé)."""
+    print(f"🎙️ {_tag(edition)}Étape 4: Génération de l'audio...")
+    audio_path = _edition_files(edition)[1]
+    published = previous.get(edition.code)
+    if published and published.get("script") == script and audio_path.exists():
+        print(f"   ✓ {_tag(edition)}Script inchangé, audio conservé: {audio_path}")
+    else:
+        audio_path.parent.mkdir(parents=True, exist_ok=True)
+        # Les éditions se partagent TTS_MAX_CONCURRENCY segments simultanés
+        concurrency = max(1, min(TTS_CONCURRENCY, TTS_MAX_CONCURRENCY // len(EDITIONS)))
+        audio_path = Path(generate_audio_sync(script, audio_path, voice=edition.voice, concurrency=concurrency))
+        METRICS.set_gauge("audio_bytes", audio_path.stat().st_size, edition=edition.code)
+        print(f"   ✓ {_tag(edition)}Audio sauvegardé: {audio_path}")
+    # Rendu HLS (recalculé seulement si le MP3 a changé)
+    if OPTIMIZED_OUTPUTS and segment_audio(audio_path):
+        print(f"   ✓ {_tag(edition)}Playlist HLS: {audio_path.with_suffix('.m3u8')}")
+    return str(audio_path)
+
+
+def _stage_archive(news: list[dict], script: str) -> bool:
+    """Ajout du briefing de l'édition principale à l'archive historique (en parallèle de l'audio)."""
+    if not USE_ARCHIVE:
+        return False
+    added = get_archive().append({
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "edition": EDITIONS[0],
+        "fingerprint": articles_fingerprint(news),
+        "articles": news,
+        "script": script,
+        "ai_provider": AI_PROVIDER
+    })
+    if added:
+        print(f"   🗄️ Briefing ajouté à l'archive ({get_archive().load_index()['total']} au total)")
+    return added
+
+
+def _stage_search_index(news: list[dict]) -> int:
+    """Ajout des nouveaux articles à l'index de recherche."""
+    if not USE_SEARCH_INDEX:
+        return 0
+    index = get_search_index()
+    added = index.add_articles(news, datetime.utcnow().strftime("%Y-%m-%d"), EDITIONS[0])
+    index.save()
+    if added:
+        print(f"   🔎 {added} articles indexés ({index.stats()['docs']} au total)")
+    return added
+
+
+def _stage_save(edition: Edition, news: list[dict], script: str, audio_path: str, *done) -> bool:
+    """Étape 5: sauvegarde des métadonnées d'une édition."""
+    print(f"💾 {_tag(edition)}Étape 5: Sauvegarde des métadonnées...")
+    save_data_json(news, script, edition)
+    METRICS.set_gauge("data_json_bytes", _edition_files(edition)[0].stat().st_size, edition=edition.code)
+    return True
+
+
+def _stage_publish(news: list[dict], *saved: bool) -> None:
+    """Fin du run, une fois toutes les éditions sauvegardées."""
+    METRICS.set_gauge("articles", len(news), step="published")
+    if DEDUPLICATE:
+        record_published(news, get_history())
+    mark_sources_processed()
+
+
+def _edition_stages(edition: Edition, primary: bool) -> list[Stage]:
+    """
+    Étapes 2 à 5 d'une édition: traduction, script, audio et sauvegarde.
+
+    Leurs valeurs sont suffixées par le code de l'édition (news_fr,
+    script_fr...). Le data.json de l'édition principale n'est écrit
+    qu'après l'ajout à l'archive et à l'index de recherche.
+    """
+    code = edition.code
+    done = ("archived", "indexed") if primary else ()
+    return [
+        Stage(f"translate_{code}", partial(_stage_translate, edition), inputs=("news_todo", "previous"),
+              outputs=(f"news_{code}",)),
+        Stage(f"script_{code}", partial(_stage_script, edition), inputs=(f"news_{code}",),
+              outputs=(f"script_{code}",)),
+        Stage(f"audio_{code}", partial(_stage_audio, edition), inputs=(f"script_{code}", "previous"),
+              outputs=(f"audio_{code}",)),
+        Stage(f"save_{code}", partial(_stage_save, edition),
+              inputs=(f"news_{code}", f"script_{code}", f"audio_{code}", *done),
+              outputs=(f"saved_{code}",), checkpoint=False),
+    ]
+
+
+def build_pipeline() -> Pipeline:
+    """
+    Construit le graphe des étapes du pipeline (voir pipeline.py).
+    
+    Chaque étape déclare ses entrées et ses sorties: une étape démarre
+    dès que ses entrées sont prêtes, et les étapes indépendantes
+    s'exécutent en parallèle. Le scraping, la déduplication, l'archive
+    et l'index de recherche sont communs; traduction, script, audio et
+    sauvegarde sont répétés pour chaque édition de EDITIONS, qui
+    avancent en parallèle (les limites de débit des providers IA sont
+    partagées, voir ai_providers.RateLimiter).
+    """
+    editions = [get_edition(code) for code in EDITIONS]
+    primary = editions[0].code
+    stages = [
+        Stage("scrape", _stage_scrape, outputs=("news",)),
+        Stage("previous", _stage_load_previous, outputs=("previous",), checkpoint=False),
+        Stage("dedup", _stage_dedup, inputs=("news",), outputs=("news_unique",)),
+        Stage("compare", _stage_compare, inputs=("news_unique", "previous"), outputs=("news_new",),
+              checkpoint=False),
+        Stage("summarize", _stage_summarize, inputs=("news_new",), outputs=("news_todo",)),
+        Stage("archive", _stage_archive, inputs=(f"news_{primary}", f"script_{primary}"), outputs=("archived",)),
+        Stage("search_index", _stage_search_index, inputs=(f"news_{primary}",), outputs=("indexed",)),
+        Stage("publish", _stage_publish,
+              inputs=(f"news_{primary}", *(f"saved_{edition.code}" for edition in editions)),
+              checkpoint=False),
+    ]
+    for i, edition in enumerate(editions):
+        stages += _edition_stages(edition, primary=i == 0)
+    run_key = f"{','.join(NEWS_SOURCES)}|{NUM_ARTICLES}|{TRANSLATION_PROMPT_VERSION}|{','.join(EDITIONS)}"
+    return Pipeline(stages, max_concurrency=PIPELINE_CONCURRENCY * len(editions), run_key=run_key)
+
+
 def main():
     """
     Fonction principale d'orchestration.
     
-    Pipeline complet:
+    Pipeline complet (voir build_pipeline):
     1. Vérification du provider IA
-    2. Scraping des actualités
+    2. Scraping des actualités (déduplication, comparaison avec le run
+       précédent, résumé du texte complet des articles)
     3. Traduction en français
     4. Génération du script radio
-    5. Création de l'audio MP3
+    5. Création de l'audio MP3 (en parallèle: ajout à l'archive)
     6. Sauvegarde des métadonnées
+    
+    Les étapes 3 à 6 sont répétées pour chaque édition de EDITIONS, en
+    parallèle.
+    
+    Si un run précédent a échoué, le pipeline reprend après la dernière
+    étape terminée (RESUME_PIPELINE).
+    
+    Returns:
+        Pipeline exécuté (durées des étapes, message d'arrêt éventuel)
     """
     print("=" * 60)
     print("🛡️  CyberDailyWatch - Générateur de Flash Info")
@@ -350,6 +963,8 @@ def main():
     try:
         provider = get_ai_provider()
         print(f"🤖 Provider IA configuré: {provider.upper()}")
+        if len(EDITIONS) > 1:
+            print(f"🌐 Éditions: {', '.join(EDITIONS)}")
     except ValueError as e:
         print(e)
         import sys
@@ -357,53 +972,32 @@ def main():
     print()
     
     # -------------------------------------------------------------------------
-    # Étape 1: Récupération des actualités
-    # -------------------------------------------------------------------------
-    print("📰 Étape 1: Récupération des actualités...")
-    news = scrape_hackernews(NUM_ARTICLES)
-    
-    if not news:
-        print("❌ Aucune actualité trouvée. Arrêt du processus.")
-        return
-    
-    print(f"   ✓ {len(news)} articles récupérés")
-    for article in news:
-        print(f"     - {article['title'][:60]}...")
-    print()
-    
-    # -------------------------------------------------------------------------
-    # Étape 2: Traduction en français
+    # Étapes 1 à 5: exécution du graphe
     # -------------------------------------------------------------------------
-    print("🌍 Étape 2: Traduction des articles en français...")
-    news = translate_articles_to_french(news)
-    print(f"   ✓ Articles traduits (via {AI_PROVIDER})")
-    for article in news:
-        print(f"     - {article.get('title_fr', article['title'])[:60]}...")
-    print()
-    
-    # -------------------------------------------------------------------------
-    # Étape 3: Génération du script radio
-    # -------------------------------------------------------------------------
-    print("🤖 Étape 3: Génération du script radio...")
-    script = generate_radio_script(news)
-    print(f"   ✓ Script généré ({len(script.split())} mots) via {AI_PROVIDER}")
-    print()
-    
-    # -------------------------------------------------------------------------
-    # Étape 4: Génération de l'audio
-    # -------------------------------------------------------------------------
-    print("🎙️ Étape 4: Génération de l'audio...")
-    AUDIO_DIR.mkdir(parents=True, exist_ok=True)
-    audio_path = generate_audio_sync(script, AUDIO_DIR / "latest_briefing.mp3")
-    print(f"   ✓ Audio sauvegardé: {audio_path}")
-    print()
+    pipeline = build_pipeline()
+    # Compteurs du run (le mode service enchaîne les runs dans un même processus)
+    USAGE.reset()
+    METRICS.reset()
+    HTTP_STATS.reset()
+    get_audio_cache().reset_stats()
+    if USE_TRANSLATION_CACHE:
+        get_translation_cache().reset_stats()
+    try:
+        pipeline.run_sync(resume=RESUME_PIPELINE)
+    finally:
+        USAGE.save()
+        METRICS.set_gauge("ai_cost_dollars", get_usage()["cost"])
+        if WRITE_METRICS:
+            METRICS.write_reports(PUBLIC_DIR)
+        print()
+        print("⏱️ Durée des étapes:")
+        print(pipeline.report())
+        print()
     
-    # -------------------------------------------------------------------------
-    # Étape 5: Sauvegarde des données
-    # -------------------------------------------------------------------------
-    print("💾 Étape 5: Sauvegarde des métadonnées...")
-    save_data_json(news, script)
-    print()
+    if pipeline.stopped:
+        print(pipeline.stopped)
+        return pipeline
+    pipeline.clear_checkpoint()
     
     # -------------------------------------------------------------------------
     # Terminé!
@@ -411,7 +1005,21 @@ def main():
     print("=" * 60)
     print(f"✅ Flash info généré avec succès!")
     print(f"🤖 Provider utilisé: {AI_PROVIDER}")
+    if USE_TRANSLATION_CACHE:
+        cache_stats = get_translation_cache().stats()
+        print(f"💾 Mémoire de traduction: {cache_stats['hits']} hits, "
+              f"{cache_stats['misses']} misses, {cache_stats['stores']} nouvelles entrées")
+    http_stats = get_http_stats()
+    print(f"🌐 HTTP: {http_stats['requests']} requêtes, {http_stats['retries']} relances, "
+          f"{http_stats.get('connections_reused', 0)} connexions réutilisées")
+    audio_stats = get_audio_cache().stats()
+    print(f"🔊 Cache audio: {audio_stats['hits']} segments réutilisés, "
+          f"{audio_stats['misses']} synthétisés")
+    usage = get_usage()
+    print(f"🪙 Tokens IA: {usage['prompt_tokens']} envoyés, {usage['completion_tokens']} reçus "
+          f"en {usage['requests']} requêtes (~{usage['cost']:.4f} $)")
     print("=" * 60)
+    return pipeline
 
 
 # =============================================================================
@@ -0,0 +1,302 @@
+"""
+CyberDailyWatch - Instrumentation
+Mesures du pipeline: durées, compteurs et tailles, exportées à chaque run.
+
+Les modules enregistrent leurs mesures dans le registre partagé METRICS:
+    - span(): durée d'une opération (étape du pipeline, requête HTTP,
+      appel à un provider IA, segment TTS), avec son statut ok/error
+      (ou cancelled pour une tâche annulée, ex: requête hedged perdante)
+    - incr(): compteurs (relances, basculements, hits/misses des caches)
+    - observe(): tailles (octets reçus, tokens) agrégées en nombre,
+      somme, minimum et maximum
+    - set_gauge(): valeurs ponctuelles (taille du MP3, de data.json)
+
+Chaque mesure porte des étiquettes (provider, hôte, étape...). À la fin
+du run, write_reports() écrit à côté de data.json:
+    - metrics.json: rapport complet, avec la chronologie des spans
+    - metrics.prom: format texte Prometheus (node_exporter textfile)
+et ajoute les totaux du run à METRICS_HISTORY (les MAX_HISTORY_RUNS
+derniers runs), pour suivre les performances d'un run à l'autre.
+
+Configuration modifiable:
+    - METRICS_PREFIX: Préfixe des noms Prometheus
+    - MAX_EVENTS: Nombre maximal de spans conservés dans la chronologie
+    - METRICS_HISTORY: Historique des runs (une ligne JSON par run)
+    - MAX_HISTORY_RUNS: Nombre de runs conservés dans l'historique
+
+Usage (résumé Markdown pour la CI):
+    python metrics.py ../cyber-news/metrics.json
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Préfixe des métriques au format Prometheus
+METRICS_PREFIX = "cyberdailywatch"
+
+# Nombre maximal de spans conservés individuellement (les agrégats sont complets)
+MAX_EVENTS = 2000
+
+# Historique des runs (dans .cache/, conservé entre deux runs par la CI)
+METRICS_HISTORY = Path(__file__).parent.parent / ".cache" / "metrics_history.jsonl"
+
+# Nombre de runs conservés dans l'historique (les plus anciens sont retirés)
+MAX_HISTORY_RUNS = 500
+
+
+def _key(name: str, labels: dict) -> tuple:
+    return (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+
+
+class Metrics:
+    """Registre des mesures d'un run (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Remet le registre à zéro (début d'un nouveau run)."""
+        with self._lock:
+            self.started_at = time.time()
+            self._origin = time.perf_counter()
+            self._counters: dict[tuple, float] = {}
+            self._gauges: dict[tuple, float] = {}
+            self._summaries: dict[tuple, list] = {}
+            self._events: list[dict] = []
+            self.dropped_events = 0
+
+    # -------------------------------------------------------------------------
+    # Enregistrement
+    # -------------------------------------------------------------------------
+
+    def incr(self, name: str, value: float = 1, **labels) -> None:
+        """Incrémente un compteur."""
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        """Fixe la valeur d'une jauge."""
+        with self._lock:
+            self._gauges[_key(name, labels)] = value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """Ajoute une observation (agrégée en nombre, somme, minimum, maximum)."""
+        key = _key(name, labels)
+        with self._lock:
+            summary = self._summaries.get(key)
+            if summary is None:
+                self._summaries[key] = [1, value, value, value]
+            else:
+                summary[0] += 1
+                summary[1] += value
+                summary[2] = min(summary[2], value)
+                summary[3] = max(summary[3], value)
+
+    def record_span(self, name: str, started: float, duration: float, status: str = "ok", **labels) -> None:
+        """
+        Enregistre une opération terminée.
+
+        Args:
+            name: Nom de l'opération (ex: "http_request")
+            started: Début (time.perf_counter())
+            duration: Durée (en secondes)
+            status: "ok", "error" (comptée dans {name}_errors_total),
+                    "cancelled" (tâche annulée, pas une erreur) ou "stopped"
+        """
+        self.observe(f"{name}_seconds", duration, **labels)
+        if status == "error":
+            self.incr(f"{name}_errors_total", **labels)
+        with self._lock:
+            if len(self._events) < MAX_EVENTS:
+                self._events.append({
+                    "name": name,
+                    "labels": {k: str(v) for k, v in labels.items()},
+                    "start": round(started - self._origin, 4),
+                    "duration": round(duration, 4),
+                    "status": status
+                })
+            else:
+                self.dropped_events += 1
+
+    @contextmanager
+    def span(self, name: str, **labels):
+        """
+        Mesure la durée du bloc (utilisable autour d'un await).
+
+        Exemple:
+            >>> with METRICS.span("http_request", host="thehackernews.com"):
+            ...     response = session.get(url)
+        """
+        started = time.perf_counter()
+        status = "ok"
+        try:
+            yield
+        except BaseException as error:
+            status = "cancelled" if _is_cancellation(error) else "error"
+            raise
+        finally:
+            self.record_span(name, started, time.perf_counter() - started, status, **labels)
+
+    # -------------------------------------------------------------------------
+    # Export
+    # -------------------------------------------------------------------------
+
+    def snapshot(self) -> dict:
+        """Rapport complet du run (sérialisable en JSON)."""
+        def entries(values: dict, convert) -> list:
+            return [dict(name=name, labels=dict(labels), **convert(value))
+                    for (name, labels), value in sorted(values.items())]
+
+        with self._lock:
+            return {
+                "version": 1,
+                "started_at": self.started_at,
+                "duration": round(time.perf_counter() - self._origin, 4),
+                "counters": entries(self._counters, lambda v: {"value": v}),
+                "gauges": entries(self._gauges, lambda v: {"value": v}),
+                "summaries": entries(self._summaries, lambda s: {
+                    "count": s[0], "sum": round(s[1], 6), "min": round(s[2], 6), "max": round(s[3], 6)
+                }),
+                "events": list(self._events),
+                "dropped_events": self.dropped_events
+            }
+
+    def to_prometheus(self) -> str:
+        """
+        Mesures au format texte d'exposition Prometheus.
+
+        Les observations deviennent des summaries (_count, _sum), avec
+        leur maximum dans une jauge séparée (_max).
+        """
+        families: dict[str, tuple[str, list]] = {}
+
+        def add(name: str, kind: str, labels: tuple, value: float) -> None:
+            families.setdefault(name, (kind, []))[1].append((labels, value))
+
+        with self._lock:
+            for (name, labels), value in self._counters.items():
+                add(name, "counter", labels, value)
+            for (name, labels), value in self._gauges.items():
+                add(name, "gauge", labels, value)
+            for (name, labels), (count, total, _, maximum) in self._summaries.items():
+                add(name, "summary", labels, (count, total))
+                add(f"{name}_max", "gauge", labels, maximum)
+
+        lines = []
+        for name, (kind, samples) in sorted(families.items()):
+            metric = f"{METRICS_PREFIX}_{name}"
+            lines.append(f"# TYPE {metric} {kind}")
+            for labels, value in sorted(samples):
+                if kind == "summary":
+                    lines.append(f"{metric}_count{_labels_text(labels)} {value[0]:g}")
+                    lines.append(f"{metric}_sum{_labels_text(labels)} {value[1]:g}")
+                else:
+                    lines.append(f"{metric}{_labels_text(labels)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+    def write_reports(self, directory: str | Path, history: str | Path | None = None) -> None:
+        """
+        Écrit metrics.json et metrics.prom dans le dossier, et ajoute
+        les totaux du run à l'historique (défaut: METRICS_HISTORY).
+        """
+        directory = Path(directory)
+        report = self.snapshot()
+        _write_atomic(directory / "metrics.json", json.dumps(report, ensure_ascii=False, indent=1))
+        _write_atomic(directory / "metrics.prom", self.to_prometheus())
+
+        history = Path(history or METRICS_HISTORY)
+        history.parent.mkdir(parents=True, exist_ok=True)
+        summary = {
+            "started_at": report["started_at"],
+            "duration": report["duration"],
+            "stages": {e["labels"]["stage"]: e["duration"] for e in report["events"]
+                       if e["name"] == "pipeline_stage"},
+            "counters": {_flat_name(c): c["value"] for c in report["counters"]}
+        }
+        try:
+            lines = history.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            lines = []
+        lines = (lines + [json.dumps(summary, ensure_ascii=False)])[-MAX_HISTORY_RUNS:]
+        _write_atomic(history, "\n".join(lines) + "\n")
+
+
+def _is_cancellation(error: BaseException) -> bool:
+    """Annulation d'une tâche asyncio (asyncio n'est pas importé s'il n'est pas déjà utilisé)."""
+    asyncio = sys.modules.get("asyncio")
+    return asyncio is not None and isinstance(error, asyncio.CancelledError)
+
+
+def _labels_text(labels: tuple) -> str:
+    """Étiquettes au format Prometheus ({k="v",...}), valeurs échappées."""
+    if not labels:
+        return ""
+    escaped = (
+        (k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in labels
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+def _flat_name(entry: dict) -> str:
+    labels = ",".join(f"{k}={v}" for k, v in entry["labels"].items())
+    return f"{entry['name']}{{{labels}}}" if labels else entry["name"]
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+METRICS = Metrics()
+
+
+# =============================================================================
+# RÉSUMÉ MARKDOWN
+# =============================================================================
+
+def markdown_summary(report: dict) -> str:
+    """Résumé d'un rapport metrics.json (durées des étapes et des appels externes)."""
+    lines = [f"### ⏱️ Durées du run ({report['duration']:.1f}s)", "",
+             "| Étape | Durée | Statut |", "|-------|-------|--------|"]
+    for event in report["events"]:
+        if event["name"] == "pipeline_stage":
+            lines.append(f"| {event['labels']['stage']} | {event['duration']:.2f}s | {event['status']} |")
+
+    lines += ["", "| Appel | Nombre | Moyenne | Max |", "|-------|--------|---------|-----|"]
+    for summary in report["summaries"]:
+        if summary["name"].endswith("_seconds") and summary["name"] != "pipeline_stage_seconds":
+            labels = ", ".join(summary["labels"].values())
+            name = summary["name"].removesuffix("_seconds") + (f" ({labels})" if labels else "")
+            lines.append(f"| {name} | {summary['count']} | {summary['sum'] / summary['count']:.2f}s "
+                         f"| {summary['max']:.2f}s |")
+
+    if report["counters"]:
+        lines += ["", "| Compteur | Valeur |", "|----------|--------|"]
+        lines += [f"| `{_flat_name(c)}` | {c['value']:g} |" for c in report["counters"]]
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        raise SystemExit("Usage: python metrics.py <metrics.json>")
+    with open(sys.argv[1], encoding="utf-8") as f:
+        print(markdown_summary(json.load(f)))
@@ -0,0 +1,356 @@
+"""
+CyberDailyWatch - Sorties optimisées pour le frontend
+Fichiers dérivés de data.json et du MP3 d'une édition, pour un premier
+affichage et une lecture audio plus rapides:
+
+    - data.min.json: data.json minifié, avec ses versions précompressées
+      data.min.json.gz et data.min.json.br (brotli: pip install brotli)
+    - headlines.json: titres et début des résumés du briefing, quelques
+      centaines d'octets à afficher avant le chargement du reste
+    - latest_briefing.m3u8 et latest_briefing/*.mp3: rendu HLS de l'audio
+      ("packed audio" MPEG, RFC 8216), découpé sur les trames MP3 sans
+      réencodage: la lecture démarre dès le premier segment téléchargé
+      (lecture HLS native de Safari, ou MediaSource dans script.js pour
+      les autres navigateurs; à défaut, le MP3 complet est téléchargé)
+
+Les versions précompressées sont servies par service.py (selon
+Accept-Encoding), comme par tout serveur qui sait les utiliser (nginx
+gzip_static/brotli_static).
+
+Génération incrémentale: un fichier n'est réécrit que si son contenu
+change (même date de modification, même ETag, pas de diff git), et les
+sorties dérivées d'une source inchangée (compression, segments) ne sont
+pas recalculées: l'empreinte de chaque source est conservée dans
+OUTPUTS_MANIFEST, sous son chemin relatif à OUTPUTS_ROOT (les entrées
+des fichiers disparus sont retirées). Les segments sont nommés par leur
+contenu.
+
+Configuration modifiable:
+    - PRECOMPRESS: Encodages précalculés ("gzip", "br")
+    - HEADLINES_SUMMARY_CHARS: Longueur des résumés de headlines.json
+    - HLS_SEGMENT_SECONDS: Durée visée des segments audio
+
+Exemple d'utilisation:
+    >>> write_json_outputs(DATA_FILE, data)
+    >>> segment_audio(AUDIO_DIR / "latest_briefing.mp3")
+"""
+
+import gzip
+import hashlib
+import json
+import math
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Encodages précalculés pour les fichiers JSON ("br" nécessite pip install brotli)
+PRECOMPRESS = ("gzip", "br")
+
+# Niveaux de compression (hors ligne: les plus élevés)
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+# En dessous de cette taille, la compression ne fait rien gagner (en octets)
+MIN_COMPRESS_BYTES = 512
+
+# Fichier des titres pour le premier affichage (à côté du data.json)
+HEADLINES_FILE = "headlines.json"
+
+# Longueur maximale des résumés de headlines.json (en caractères)
+HEADLINES_SUMMARY_CHARS = 160
+
+# Durée visée des segments audio HLS (en secondes)
+HLS_SEGMENT_SECONDS = 6
+
+# Empreintes des sources déjà traitées
+OUTPUTS_MANIFEST = Path(__file__).parent.parent / ".cache" / "outputs_manifest.json"
+
+# Dossier publié: les chemins du manifeste lui sont relatifs
+OUTPUTS_ROOT = Path(__file__).parent.parent / "cyber-news"
+
+ENCODING_SUFFIXES = {"gzip": ".gz", "br": ".br"}
+
+# Trames MPEG Layer III: débits (kbit/s) et fréquences par version
+# (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5)
+MP3_BITRATES = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+MP3_BITRATES[0] = MP3_BITRATES[2]
+MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+# Horodatage des segments "packed audio" (RFC 8216, section 3.4)
+HLS_TIMESTAMP_OWNER = b"com.apple.streaming.transportStreamTimestamp\x00"
+
+_manifest_lock = threading.Lock()
+
+
+# =============================================================================
+# ÉCRITURE INCRÉMENTALE
+# =============================================================================
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """
+    Écrit un fichier (de façon atomique) seulement si son contenu change.
+
+    Returns:
+        True si le fichier a été écrit
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def _read_manifest() -> dict:
+    try:
+        return json.loads(OUTPUTS_MANIFEST.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _manifest_key(source: Path) -> str:
+    return Path(os.path.relpath(source.resolve(), OUTPUTS_ROOT.resolve())).as_posix()
+
+
+def _is_current(source: Path, digest: str, outputs: list[Path]) -> bool:
+    """Sorties déjà produites pour ce contenu de la source (et toujours présentes)."""
+    with _manifest_lock:
+        entry = _read_manifest().get(_manifest_key(source))
+    return entry == digest and all(path.exists() for path in outputs)
+
+
+def _record(source: Path, digest: str) -> None:
+    """Note l'empreinte d'une source traitée (et retire les entrées des fichiers disparus)."""
+    with _manifest_lock:
+        manifest = {
+            key: value for key, value in _read_manifest().items()
+            if not os.path.isabs(key) and (OUTPUTS_ROOT / key).exists()
+        }
+        manifest[_manifest_key(source)] = digest
+        write_if_changed(OUTPUTS_MANIFEST, json.dumps(manifest, indent=1, sort_keys=True).encode("utf-8"))
+
+
+# =============================================================================
+# JSON MINIFIÉ ET PRÉCOMPRESSÉ
+# =============================================================================
+
+@lru_cache(maxsize=1)
+def _brotli():
+    """Module brotli, importé au premier besoin (None s'il n'est pas installé)."""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def _compress(encoding: str, data: bytes) -> bytes | None:
+    if encoding == "gzip":
+        # mtime=0: même contenu, même fichier compressé
+        return gzip.compress(data, GZIP_LEVEL, mtime=0)
+    if encoding == "br" and _brotli() is not None:
+        return _brotli().compress(data, quality=BROTLI_QUALITY, mode=_brotli().MODE_TEXT)
+    return None
+
+
+def precompress(path: Path, data: bytes) -> list[Path]:
+    """
+    Écrit les versions précompressées d'un fichier (path.gz, path.br).
+
+    Une version qui ne peut plus être produite (brotli absent, fichier
+    trop petit) est supprimée: elle ne serait plus à jour.
+
+    Returns:
+        Fichiers compressés présents
+    """
+    written = []
+    for encoding, suffix in ENCODING_SUFFIXES.items():
+        sibling = path.with_name(path.name + suffix)
+        compressed = _compress(encoding, data) if encoding in PRECOMPRESS and len(data) >= MIN_COMPRESS_BYTES else None
+        if compressed is None or len(compressed) >= len(data):
+            sibling.unlink(missing_ok=True)
+            continue
+        write_if_changed(sibling, compressed)
+        written.append(sibling)
+    return written
+
+
+def minify(data) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _shorten(text: str, limit: int) -> str:
+    text = " ".join((text or "").split())
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(" ", 1)[0].rstrip(",;:.") + "…"
+
+
+def headlines(data: dict, data_url: str) -> dict:
+    """
+    Résumé du briefing pour le premier affichage (titres, liens, début des résumés).
+
+    Les titres et résumés sont ceux de l'édition (title_fr, summary_fr
+    pour l'édition française), ou l'original à défaut.
+    """
+    code = data.get("edition", "fr")
+    return {
+        "generated_at": data.get("generated_at"),
+        "edition": code,
+        "data": data_url,
+        "articles": [
+            {
+                "title": article.get(f"title_{code}") or article.get("title", ""),
+                "summary": _shorten(article.get(f"summary_{code}") or article.get("summary", ""),
+                                    HEADLINES_SUMMARY_CHARS),
+                "url": article.get("url"),
+            }
+            for article in data.get("articles", [])
+        ],
+    }
+
+
+def write_json_outputs(data_file: Path, data: dict) -> list[Path]:
+    """
+    Écrit data.min.json, headlines.json et leurs versions précompressées.
+
+    Returns:
+        Fichiers produits (y compris ceux qui n'ont pas changé)
+    """
+    minified_file = data_file.with_name(data_file.stem + ".min.json")
+    headlines_file = data_file.with_name(HEADLINES_FILE)
+    outputs = []
+    for path, content in (
+        (minified_file, minify(data)),
+        (headlines_file, minify(headlines(data, minified_file.name))),
+    ):
+        digest = _digest(content)
+        if _is_current(path, digest, [path]):
+            # Versions compressées déjà produites pour ce contenu
+            outputs += [path, *(sibling for suffix in ENCODING_SUFFIXES.values()
+                                if (sibling := path.with_name(path.name + suffix)).exists())]
+            continue
+        write_if_changed(path, content)
+        outputs += [path, *precompress(path, content)]
+        _record(path, digest)
+    return outputs
+
+
+# =============================================================================
+# AUDIO SEGMENTÉ (HLS)
+# =============================================================================
+
+def iter_mp3_frames(data: bytes) -> Iterator[tuple[int, int, int, int]]:
+    """
+    Parcourt les trames MPEG Layer III d'un MP3 (les balises ID3 sont ignorées).
+
+    Yields:
+        Tuples (position, longueur, échantillons, fréquence d'échantillonnage)
+    """
+    position, size = 0, len(data)
+    while position + 4 <= size:
+        if data[position:position + 3] == b"ID3" and position + 10 <= size:
+            tag_size = sum((data[position + 6 + i] & 0x7F) << (7 * (3 - i)) for i in range(4))
+            footer = 10 if data[position + 5] & 0x10 else 0
+            position += 10 + tag_size + footer
+            continue
+        header = data[position:position + 4]
+        version, layer = (header[1] >> 3) & 3, (header[1] >> 1) & 3
+        bitrate_index, rate_index = header[2] >> 4, (header[2] >> 2) & 3
+        if (header[0] != 0xFF or header[1] & 0xE0 != 0xE0 or version == 1 or layer != 1
+                or bitrate_index in (0, 15) or rate_index == 3):
+            # Octets hors trame: recherche de la synchronisation suivante
+            position += 1
+            continue
+        bitrate = MP3_BITRATES[version][bitrate_index] * 1000
+        sample_rate = MP3_SAMPLE_RATES[version][rate_index]
+        samples = 1152 if version == 3 else 576
+        length = samples // 8 * bitrate // sample_rate + ((header[2] >> 1) & 1)
+        if position + length > size:
+            return
+        yield position, length, samples, sample_rate
+        position += length
+
+
+def _syncsafe(value: int) -> bytes:
+    return bytes((value >> shift) & 0x7F for shift in (21, 14, 7, 0))
+
+
+def _timestamp_tag(pts: int) -> bytes:
+    """Balise ID3 d'un segment: son instant de début (horloge 90 kHz)."""
+    payload = HLS_TIMESTAMP_OWNER + (pts & 0x1FFFFFFFF).to_bytes(8, "big")
+    frame = b"PRIV" + _syncsafe(len(payload)) + b"\x00\x00" + payload
+    return b"ID3\x04\x00\x00" + _syncsafe(len(frame)) + frame
+
+
+def segment_audio(audio_path: Path, segment_seconds: float = HLS_SEGMENT_SECONDS) -> Path | None:
+    """
+    Produit le rendu HLS d'un MP3: playlist (.m3u8) et segments.
+
+    Les segments sont écrits dans un dossier du nom du MP3 (ex:
+    audio/latest_briefing/), nommés par leur contenu; ceux qui ne sont
+    plus référencés par la playlist sont supprimés.
+
+    Returns:
+        Chemin de la playlist, ou None si le fichier ne contient pas de trames MP3
+    """
+    playlist_path = audio_path.with_suffix(".m3u8")
+    segments_dir = audio_path.with_suffix("")
+    data = audio_path.read_bytes()
+    digest = _digest(data)
+    if _is_current(audio_path, digest, [playlist_path]):
+        return playlist_path
+
+    # Segments: (début, fin) dans le MP3, instant de début et durée (en secondes)
+    segments = []
+    first = end = None
+    started = elapsed = 0.0
+    for position, length, samples, sample_rate in iter_mp3_frames(data):
+        if first is None:
+            first, started = position, elapsed
+        elapsed += samples / sample_rate
+        end = position + length
+        if elapsed - started >= segment_seconds - 1e-6:
+            segments.append((first, end, started, elapsed - started))
+            first = None
+    if first is not None:
+        segments.append((first, end, started, elapsed - started))
+    if not segments:
+        playlist_path.unlink(missing_ok=True)
+        return None
+
+    lines = ["#EXTM3U", "#EXT-X-VERSION:3",
+             f"#EXT-X-TARGETDURATION:{math.ceil(max(duration for *_, duration in segments))}",
+             "#EXT-X-MEDIA-SEQUENCE:0", "#EXT-X-PLAYLIST-TYPE:VOD"]
+    names = set()
+    for begin, end, started, duration in segments:
+        content = _timestamp_tag(round(started * 90000)) + data[begin:end]
+        name = f"{_digest(content)[:16]}.mp3"
+        write_if_changed(segments_dir / name, content)
+        names.add(name)
+        lines += [f"#EXTINF:{duration:.3f},", f"{segments_dir.name}/{name}"]
+    lines.append("#EXT-X-ENDLIST")
+    write_if_changed(playlist_path, ("\n".join(lines) + "\n").encode("utf-8"))
+
+    for stale in segments_dir.glob("*.mp3"):
+        if stale.name not in names:
+            stale.unlink(missing_ok=True)
+    _record(audio_path, digest)
+    return playlist_path
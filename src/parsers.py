@@ -0,0 +1,426 @@
+"""
+CyberDailyWatch - Parsers HTML
+Extraction des articles de la page d'accueil de TheHackerNews avec
+plusieurs moteurs interchangeables.
+
+Moteurs disponibles (du plus rapide au plus lent):
+    - selectolax: sélecteurs CSS sur le parser lexbor (pip install selectolax)
+    - lxml: XPath sur l'arbre lxml (pip install lxml)
+    - stream: parser incrémental de la bibliothèque standard, qui s'arrête
+      dès que num_articles articles ont été extraits
+    - bs4: BeautifulSoup html.parser (moteur historique, toujours disponible)
+
+Le texte complet d'une page d'article est extrait par
+parse_article_body (bibliothèque standard, tous sites).
+
+Configuration modifiable:
+    - PARSER_BACKEND: Moteur utilisé ("auto" = le plus rapide installé)
+    - STREAM_CHUNK_SIZE: Taille des blocs lus par le moteur "stream"
+    - BODY_CONTAINERS / BODY_MIN_PARAGRAPH_CHARS: Extraction du corps des articles
+"""
+
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import Callable, Dict, List
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Moteur de parsing: "auto", "selectolax", "lxml", "stream" ou "bs4"
+PARSER_BACKEND = "auto"
+
+# Ordre de préférence du mode "auto"
+AUTO_ORDER = ["selectolax", "lxml", "bs4"]
+
+# Taille des blocs de HTML fournis au moteur "stream" (en caractères)
+STREAM_CHUNK_SIZE = 8192
+
+# Conteneurs du corps d'un article (id ou classe CSS, itemprop)
+BODY_CONTAINERS = frozenset({
+    "articlebody", "article-body", "articleBody", "entry-content", "post-body", "post-content"
+})
+
+# Paragraphes plus courts ignorés (légendes, mentions, boutons de partage)
+BODY_MIN_PARAGRAPH_CHARS = 40
+
+
+def _clean(text: str) -> str:
+    """Normalise les espaces d'un texte extrait."""
+    return " ".join(text.split())
+
+
+def _has_class(classes: str | None, name: str) -> bool:
+    return name in (classes or "").split()
+
+
+# =============================================================================
+# MOTEURS
+# =============================================================================
+
+def parse_with_bs4(content: str, num_articles: int) -> List[Dict[str, str]]:
+    """Moteur historique: arbre BeautifulSoup complet puis find_all/find_parent."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, "html.parser")
+    articles = []
+
+    # Structure HTML de TheHackerNews: <a class="story-link"> contient le lien et titre
+    for link in soup.find_all("a", class_="story-link"):
+        if len(articles) >= num_articles:
+            break
+        try:
+            article_url = link.get("href", "")
+
+            title_element = link.find("h2", class_="home-title")
+            if not title_element:
+                continue
+            title = _clean(title_element.get_text(" ", strip=True))
+
+            # Extraire le résumé depuis le parent (div.body-post)
+            parent = link.find_parent("div", class_="body-post")
+            summary = ""
+            if parent:
+                excerpt_element = parent.find("div", class_="home-desc")
+                summary = _clean(excerpt_element.get_text(" ", strip=True)) if excerpt_element else ""
+
+            if title and article_url:
+                articles.append({"title": title, "url": article_url, "summary": summary})
+
+        except Exception as e:
+            # Continuer avec les autres articles en cas d'erreur
+            print(f"⚠️ Erreur lors du parsing d'un article: {e}")
+            continue
+
+    return articles
+
+
+def parse_with_lxml(content: str, num_articles: int) -> List[Dict[str, str]]:
+    """Moteur lxml: parsing en C et requêtes XPath."""
+    import lxml.html
+
+    def class_xpath(tag: str, name: str) -> str:
+        return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]"
+
+    tree = lxml.html.fromstring(content)
+    articles = []
+
+    for link in tree.xpath("//" + class_xpath("a", "story-link")):
+        if len(articles) >= num_articles:
+            break
+        titles = link.xpath(".//" + class_xpath("h2", "home-title"))
+        if not titles:
+            continue
+        title = _clean(" ".join(titles[0].itertext()))
+
+        summary = ""
+        parents = link.xpath("ancestor::" + class_xpath("div", "body-post") + "[1]")
+        if parents:
+            excerpts = parents[0].xpath(".//" + class_xpath("div", "home-desc"))
+            if excerpts:
+                summary = _clean(" ".join(excerpts[0].itertext()))
+
+        article_url = link.get("href", "")
+        if title and article_url:
+            articles.append({"title": title, "url": article_url, "summary": summary})
+
+    return articles
+
+
+def parse_with_selectolax(content: str, num_articles: int) -> List[Dict[str, str]]:
+    """Moteur selectolax: parser lexbor et sélecteurs CSS."""
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(content)
+    articles = []
+
+    for link in tree.css("a.story-link"):
+        if len(articles) >= num_articles:
+            break
+        title_element = link.css_first("h2.home-title")
+        if title_element is None:
+            continue
+        title = _clean(title_element.text(separator=" "))
+
+        summary = ""
+        parent = link.parent
+        while parent is not None and not (parent.tag == "div" and _has_class(parent.attributes.get("class"), "body-post")):
+            parent = parent.parent
+        if parent is not None:
+            excerpt_element = parent.css_first("div.home-desc")
+            if excerpt_element is not None:
+                summary = _clean(excerpt_element.text(separator=" "))
+
+        article_url = link.attributes.get("href") or ""
+        if title and article_url:
+            articles.append({"title": title, "url": article_url, "summary": summary})
+
+    return articles
+
+
+class _StoryStreamParser(HTMLParser):
+    """
+    Parser SAX-like qui reconnaît les blocs div.body-post au fil de l'eau.
+
+    Un article est émis à la fermeture de son bloc div.body-post (ou du
+    lien a.story-link s'il n'est pas dans un tel bloc).
+    """
+
+    def __init__(self, num_articles: int):
+        super().__init__(convert_charrefs=True)
+        self.num_articles = num_articles
+        self.articles: List[Dict[str, str]] = []
+        self.div_stack: List[str] = []   # rôle de chaque <div> ouvert
+        self.post_depth: int | None = None
+        self.in_link = False
+        self.capture: str | None = None   # "title" ou "summary"
+        self.capture_depth = 0
+        self._reset_story()
+
+    @property
+    def done(self) -> bool:
+        return len(self.articles) >= self.num_articles
+
+    def _reset_story(self) -> None:
+        self.url = ""
+        self.title_parts: List[str] = []
+        self.summary_parts: List[str] = []
+        self.has_title = False
+        self.has_summary = False
+
+    def _emit(self) -> None:
+        title = _clean("".join(self.title_parts))
+        if self.has_title and title and self.url and not self.done:
+            self.articles.append({
+                "title": title,
+                "url": self.url,
+                "summary": _clean("".join(self.summary_parts))
+            })
+        self._reset_story()
+
+    def _separate(self) -> None:
+        """Une balise sépare deux mots (comme get_text(" ") des autres moteurs)."""
+        if self.capture == "title":
+            self.title_parts.append(" ")
+        elif self.capture == "summary":
+            self.summary_parts.append(" ")
+
+    def handle_starttag(self, tag, attrs):
+        self._separate()
+        classes = dict(attrs).get("class")
+        if tag == "div":
+            if self.post_depth is None and _has_class(classes, "body-post"):
+                self.post_depth = len(self.div_stack)
+                self._reset_story()
+            elif self.capture == "summary":
+                self.capture_depth += 1
+            elif self.post_depth is not None and not self.has_summary and _has_class(classes, "home-desc"):
+                self.capture, self.capture_depth, self.has_summary = "summary", 0, True
+            self.div_stack.append(tag)
+        elif tag == "a" and _has_class(classes, "story-link"):
+            if not self.url:
+                self.url = dict(attrs).get("href") or ""
+            self.in_link = True
+        elif tag == "h2" and self.in_link and not self.has_title and _has_class(classes, "home-title"):
+            self.capture, self.has_title = "title", True
+
+    def handle_endtag(self, tag):
+        self._separate()
+        if tag == "div" and self.div_stack:
+            self.div_stack.pop()
+            if self.capture == "summary":
+                if self.capture_depth == 0:
+                    self.capture = None
+                else:
+                    self.capture_depth -= 1
+            if self.post_depth is not None and len(self.div_stack) == self.post_depth:
+                self.post_depth = None
+                self._emit()
+        elif tag == "h2" and self.capture == "title":
+            self.capture = None
+        elif tag == "a" and self.in_link:
+            self.in_link = False
+            if self.post_depth is None:
+                self._emit()
+
+    def handle_data(self, data):
+        if self.capture == "title":
+            self.title_parts.append(data)
+        elif self.capture == "summary":
+            self.summary_parts.append(data)
+
+
+def parse_with_stream(content: str, num_articles: int) -> List[Dict[str, str]]:
+    """
+    Moteur incrémental: le HTML est lu par blocs et le parsing s'arrête
+    dès que num_articles articles ont été extraits.
+    """
+    parser = _StoryStreamParser(num_articles)
+    for start in range(0, len(content), STREAM_CHUNK_SIZE):
+        parser.feed(content[start:start + STREAM_CHUNK_SIZE])
+        if parser.done:
+            break
+    else:
+        parser.close()
+    return parser.articles
+
+
+# =============================================================================
+# CORPS DES ARTICLES
+# =============================================================================
+
+class _ArticleBodyParser(HTMLParser):
+    """
+    Collecte les paragraphes d'une page d'article.
+
+    Chaque paragraphe est classé selon son emplacement: dans un conteneur
+    de BODY_CONTAINERS (2), dans un <article> (1) ou ailleurs (0); seul le
+    meilleur niveau trouvé est retenu. Les blocs de navigation, scripts
+    et encadrés sont ignorés.
+    """
+
+    SKIPPED = frozenset({"script", "style", "noscript", "nav", "header", "footer", "aside", "figure", "form"})
+    BLOCKS = frozenset({"p", "li", "blockquote"})
+    VOID = frozenset({"area", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"})
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.paragraphs: List[tuple] = []
+        self.container: List = []     # [balise, profondeur] du conteneur ouvert
+        self.article_depth = 0
+        self.skip_depth = 0
+        self.parts: List[str] | None = None
+
+    def _level(self) -> int:
+        return 2 if self.container else 1 if self.article_depth else 0
+
+    def _flush(self) -> None:
+        if self.parts is not None:
+            text = _clean("".join(self.parts))
+            if len(text) >= BODY_MIN_PARAGRAPH_CHARS:
+                self.paragraphs.append((self._level(), text))
+            self.parts = None
+
+    def handle_starttag(self, tag, attrs):
+        if self.skip_depth or tag in self.SKIPPED:
+            self.skip_depth += tag not in self.VOID
+            return
+        if self.container and tag == self.container[0]:
+            self.container[1] += 1
+        elif not self.container:
+            values = dict(attrs)
+            names = {values.get("id"), values.get("itemprop"), *(values.get("class") or "").split()}
+            if names & BODY_CONTAINERS:
+                self.container = [tag, 1]
+        if tag == "article":
+            self.article_depth += 1
+        if tag in self.BLOCKS:
+            self._flush()
+            self.parts = []
+        elif self.parts is not None:
+            self.parts.append(" ")
+
+    def handle_endtag(self, tag):
+        if self.skip_depth:
+            self.skip_depth -= tag not in self.VOID
+            return
+        if tag in self.BLOCKS:
+            self._flush()
+        elif self.parts is not None:
+            self.parts.append(" ")
+        if tag == "article" and self.article_depth:
+            self.article_depth -= 1
+        if self.container and tag == self.container[0]:
+            self.container[1] -= 1
+            if not self.container[1]:
+                self._flush()
+                self.container = []
+
+    def handle_data(self, data):
+        if self.parts is not None and not self.skip_depth:
+            self.parts.append(data)
+
+
+def parse_article_body(content: str) -> str:
+    """
+    Extrait le texte du corps d'une page d'article.
+
+    Returns:
+        Paragraphes séparés par une ligne vide ("" si aucun paragraphe)
+    """
+    parser = _ArticleBodyParser()
+    parser.feed(content)
+    parser.close()
+    parser._flush()
+    if not parser.paragraphs:
+        return ""
+    best = max(level for level, _ in parser.paragraphs)
+    return "\n\n".join(text for level, text in parser.paragraphs if level == best)
+
+
+# =============================================================================
+# SÉLECTION DU MOTEUR
+# =============================================================================
+
+BACKENDS: Dict[str, Callable[[str, int], List[Dict[str, str]]]] = {
+    "selectolax": parse_with_selectolax,
+    "lxml": parse_with_lxml,
+    "stream": parse_with_stream,
+    "bs4": parse_with_bs4,
+}
+
+# Module à importer pour vérifier qu'un moteur est installé
+_BACKEND_MODULES = {"selectolax": "selectolax.lexbor", "lxml": "lxml.html"}
+
+
+@lru_cache(maxsize=1)
+def available_backends() -> tuple:
+    """Liste des moteurs utilisables dans l'environnement courant."""
+    import importlib.util
+
+    available = []
+    for name in BACKENDS:
+        module = _BACKEND_MODULES.get(name)
+        if module is None:
+            available.append(name)
+            continue
+        try:
+            if importlib.util.find_spec(module) is not None:
+                available.append(name)
+        except ImportError:
+            pass
+    return tuple(available)
+
+
+def resolve_backend(backend: str | None = None) -> str:
+    """
+    Résout le nom du moteur à utiliser.
+
+    "auto" choisit le premier moteur installé de AUTO_ORDER; un moteur
+    explicitement demandé mais absent retombe sur bs4.
+    """
+    backend = backend or PARSER_BACKEND
+    available = available_backends()
+    if backend == "auto":
+        return next(name for name in AUTO_ORDER if name in available)
+    if backend not in BACKENDS:
+        raise ValueError(f"Moteur de parsing inconnu: {backend} (disponibles: {', '.join(BACKENDS)})")
+    if backend not in available:
+        print(f"⚠️ Moteur {backend} non installé, utilisation de bs4")
+        return "bs4"
+    return backend
+
+
+def parse_hackernews_html(content: str, num_articles: int, backend: str | None = None) -> List[Dict[str, str]]:
+    """
+    Extrait les articles de la page d'accueil de TheHackerNews.
+
+    Args:
+        content: HTML de la page d'accueil
+        num_articles: Nombre maximal d'articles à extraire
+        backend: Moteur de parsing (défaut: PARSER_BACKEND)
+
+    Returns:
+        Liste d'articles (title, url, summary)
+    """
+    return BACKENDS[resolve_backend(backend)](content, num_articles)
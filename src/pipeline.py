@@ -0,0 +1,289 @@
+"""
+CyberDailyWatch - Exécuteur du pipeline
+Petit exécuteur de graphe (DAG) d'étapes sur asyncio.
+
+Chaque étape déclare les valeurs qu'elle consomme (inputs) et celles
+qu'elle produit (outputs). Une étape démarre dès que toutes ses entrées
+sont disponibles: les étapes indépendantes s'exécutent en parallèle,
+dans la limite de `max_concurrency`. Les fonctions synchrones tournent
+dans un thread (asyncio.to_thread), les coroutines sont attendues
+directement.
+
+Les sorties des étapes terminées sont enregistrées dans un point de
+reprise (checkpoint JSON): si un run échoue, le run suivant reprend
+après la dernière étape terminée au lieu de tout recommencer. Un run
+arrêté par PipelineStop est terminé: son point de reprise est supprimé.
+L'âge d'un point de reprise est celui de ses premières sorties (une
+reprise ne le rajeunit pas).
+
+Configuration modifiable:
+    - CHECKPOINT_PATH: Fichier du point de reprise
+    - CHECKPOINT_MAX_AGE: Âge maximal d'un point de reprise réutilisable
+
+Exemple d'utilisation:
+    >>> pipeline = Pipeline([
+    ...     Stage("scrape", scrape, outputs=("news",)),
+    ...     Stage("translate", translate, inputs=("news",), outputs=("news_fr",)),
+    ... ])
+    >>> values = pipeline.run_sync()
+    >>> print(pipeline.report())
+"""
+
+import asyncio
+import inspect
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from metrics import METRICS
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Point de reprise (dans .cache/, conservé entre deux runs par la CI)
+CHECKPOINT_PATH = Path(__file__).parent.parent / ".cache" / "pipeline_checkpoint.json"
+
+# Un point de reprise plus ancien est ignoré (les actualités ont changé)
+CHECKPOINT_MAX_AGE = 6 * 3600
+
+# Nombre maximal d'étapes exécutées simultanément
+MAX_CONCURRENCY = 4
+
+
+class PipelineStop(Exception):
+    """Levée par une étape pour arrêter proprement le pipeline (rien à faire)."""
+
+
+@dataclass
+class Stage:
+    """
+    Étape du pipeline.
+
+    Args:
+        name: Nom unique de l'étape
+        func: Fonction (synchrone ou coroutine) appelée avec les entrées,
+              dans l'ordre de `inputs`
+        inputs: Noms des valeurs consommées
+        outputs: Noms des valeurs produites; avec plusieurs sorties, la
+                 fonction retourne un tuple dans le même ordre
+        checkpoint: Enregistrer les sorties dans le point de reprise
+                    (elles doivent alors être sérialisables en JSON)
+    """
+    name: str
+    func: Callable[..., Any]
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    checkpoint: bool = True
+
+
+@dataclass
+class StageTiming:
+    """Durée d'une étape et son statut ("ok", "resumed", "stopped", "failed", "cancelled", "skipped")."""
+    name: str
+    status: str
+    duration: float = 0.0
+    started: float = field(default=0.0, repr=False)
+
+
+class Pipeline:
+    """
+    Graphe d'étapes exécuté sur asyncio.
+
+    Args:
+        stages: Étapes du pipeline (l'ordre n'a pas d'importance)
+        max_concurrency: Nombre maximal d'étapes simultanées
+        checkpoint_path: Fichier du point de reprise (None = pas de reprise)
+        run_key: Identifiant du run: un point de reprise n'est réutilisé
+                 que pour le même identifiant (ex: la liste des sources)
+
+    Raises:
+        ValueError: Si une entrée n'est produite par aucune étape, si une
+                    sortie est produite deux fois ou si le graphe a un cycle
+    """
+
+    def __init__(self, stages: list[Stage], max_concurrency: int = MAX_CONCURRENCY,
+                 checkpoint_path: str | Path | None = CHECKPOINT_PATH, run_key: str = ""):
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Noms d'étapes en double")
+        self.max_concurrency = max_concurrency
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.run_key = run_key
+        self.timings: dict[str, StageTiming] = {}
+        self.stopped: str | None = None
+        self._checkpoint_time = 0.0
+        self._producers = self._check_graph()
+
+    def _check_graph(self) -> dict[str, str]:
+        """Vérifie le graphe et retourne, pour chaque valeur, l'étape qui la produit."""
+        producers = {}
+        for stage in self.stages.values():
+            for output in stage.outputs:
+                if output in producers:
+                    raise ValueError(f"Sortie '{output}' produite par '{producers[output]}' et '{stage.name}'")
+                producers[output] = stage.name
+        for stage in self.stages.values():
+            for name in stage.inputs:
+                if name not in producers:
+                    raise ValueError(f"Entrée '{name}' de l'étape '{stage.name}' produite par aucune étape")
+
+        # Tri topologique: un cycle laisse des étapes non visitées
+        remaining = {name: {producers[i] for i in stage.inputs} for name, stage in self.stages.items()}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps & remaining.keys()]
+            if not ready:
+                raise ValueError(f"Cycle entre les étapes: {', '.join(sorted(remaining))}")
+            for name in ready:
+                del remaining[name]
+        return producers
+
+    # -------------------------------------------------------------------------
+    # Point de reprise
+    # -------------------------------------------------------------------------
+
+    def _load_checkpoint(self) -> dict[str, Any]:
+        """Valeurs des étapes terminées lors d'un run précédent interrompu."""
+        if not self.checkpoint_path:
+            return {}
+        try:
+            with open(self.checkpoint_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if state.get("run_key") != self.run_key or time.time() - state.get("saved_at", 0) > CHECKPOINT_MAX_AGE:
+            return {}
+        self._checkpoint_time = state["saved_at"]
+        return state.get("values", {})
+
+    def _save_checkpoint(self, values: dict[str, Any]) -> None:
+        if not self.checkpoint_path:
+            return
+        saved = {}
+        for stage in self.stages.values():
+            if stage.checkpoint and stage.name in self.timings and self.timings[stage.name].status in ("ok", "resumed"):
+                saved.update({name: values[name] for name in stage.outputs})
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"run_key": self.run_key, "saved_at": self._checkpoint_time, "values": saved},
+                      f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def clear_checkpoint(self) -> None:
+        """Supprime le point de reprise (à appeler après un run complet)."""
+        if self.checkpoint_path:
+            self.checkpoint_path.unlink(missing_ok=True)
+
+    # -------------------------------------------------------------------------
+    # Exécution
+    # -------------------------------------------------------------------------
+
+    async def _run_stage(self, stage: Stage, values: dict[str, Any], semaphore: asyncio.Semaphore) -> None:
+        args = [values[name] for name in stage.inputs]
+        async with semaphore:
+            timing = self.timings[stage.name] = StageTiming(stage.name, "running", started=time.perf_counter())
+            try:
+                if inspect.iscoroutinefunction(stage.func):
+                    result = await stage.func(*args)
+                else:
+                    result = await asyncio.to_thread(stage.func, *args)
+            except PipelineStop:
+                timing.status = "stopped"
+                raise
+            except asyncio.CancelledError:
+                # Annulée après l'échec d'une autre étape: pas une erreur
+                timing.status = "cancelled"
+                raise
+            except BaseException:
+                timing.status = "failed"
+                raise
+            finally:
+                timing.duration = time.perf_counter() - timing.started
+                status = {"failed": "error", "stopped": "stopped", "cancelled": "cancelled"}.get(timing.status, "ok")
+                METRICS.record_span("pipeline_stage", timing.started, timing.duration, status, stage=stage.name)
+
+        if len(stage.outputs) == 1:
+            result = (result,)
+        elif not stage.outputs:
+            result = ()
+        if len(result) != len(stage.outputs):
+            timing.status = "failed"
+            raise ValueError(f"L'étape '{stage.name}' a retourné {len(result)} valeurs "
+                             f"au lieu de {len(stage.outputs)}")
+        values.update(zip(stage.outputs, result))
+        timing.status = "ok"
+
+    async def run(self, resume: bool = True) -> dict[str, Any]:
+        """
+        Exécute le graphe et retourne toutes les valeurs produites.
+
+        Args:
+            resume: Réutiliser les sorties d'un run précédent interrompu
+
+        Returns:
+            Dictionnaire {nom de valeur: valeur}; vide si une étape a levé
+            PipelineStop (le message est alors dans `self.stopped`)
+
+        Raises:
+            Exception: La première erreur levée par une étape (les étapes
+                       en cours sont annulées, le point de reprise est conservé)
+        """
+        values: dict[str, Any] = {}
+        self.timings = {}
+        self.stopped = None
+        self._checkpoint_time = time.time()
+
+        checkpoint = self._load_checkpoint() if resume else {}
+        for stage in self.stages.values():
+            if stage.checkpoint and stage.outputs and all(name in checkpoint for name in stage.outputs):
+                values.update({name: checkpoint[name] for name in stage.outputs})
+                self.timings[stage.name] = StageTiming(stage.name, "resumed")
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        pending = {name for name in self.stages if name not in self.timings}
+        running: dict[asyncio.Task, str] = {}
+        try:
+            while pending or running:
+                for name in sorted(pending):
+                    stage = self.stages[name]
+                    if all(value in values for value in stage.inputs):
+                        pending.discard(name)
+                        task = asyncio.create_task(self._run_stage(stage, values, semaphore))
+                        running[task] = name
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    del running[task]
+                    error = task.exception()
+                    if isinstance(error, PipelineStop):
+                        # Run terminé (rien à faire): ne pas reprendre ses sorties
+                        self.stopped = str(error)
+                        self.clear_checkpoint()
+                        return {}
+                    if error is not None:
+                        raise error
+                self._save_checkpoint(values)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            for name in pending:
+                self.timings.setdefault(name, StageTiming(name, "skipped"))
+        return values
+
+    def run_sync(self, resume: bool = True) -> dict[str, Any]:
+        """Version synchrone de run()."""
+        return asyncio.run(self.run(resume))
+
+    def report(self) -> str:
+        """Rapport des durées par étape, dans l'ordre de démarrage."""
+        timings = sorted(self.timings.values(), key=lambda t: ({"resumed": 0, "skipped": 2}.get(t.status, 1), t.started))
+        width = max((len(t.name) for t in timings), default=0)
+        lines = [f"   {t.name:<{width}}  {t.duration:7.2f}s  {t.status}" for t in timings]
+        return "\n".join(lines)
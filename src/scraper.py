@@ -1,26 +1,41 @@
 """
 CyberDailyWatch - Scraper d'actualités
-Module de récupération des actualités cybersécurité depuis TheHackerNews.
+Module de récupération des actualités cybersécurité depuis TheHackerNews
+et les autres sources déclarées dans sources.py.
 
 Ce module fournit des fonctions pour scraper les derniers articles
-de TheHackerNews.com et extraire les titres, URLs et résumés.
+de TheHackerNews.com (et de flux RSS/Atom) et extraire les titres,
+URLs et résumés. Les sources sont téléchargées en parallèle: la durée
+totale est proche de celle de la source la plus lente. Le texte complet
+des articles retenus peut ensuite être récupéré (fetch_article_bodies).
 
 Configuration modifiable:
-    - URL_SOURCE: URL du site à scraper (ligne 16)
+    - URL_SOURCE: URL de TheHackerNews (déclarée dans sources.py)
     - NUM_ARTICLES: Nombre d'articles par défaut (paramètre de fonction)
-    - USER_AGENT: Agent utilisateur pour les requêtes (ligne 23)
+    - HEADERS: Agent utilisateur pour les requêtes
+    - MAX_WORKERS / PER_HOST_LIMIT: Parallélisme des téléchargements
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterable, List
+from urllib.parse import urlsplit, urlunsplit
+
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict
+
+from http_cache import HTTPCache
+from http_session import get_session
+from metrics import METRICS
+from parsers import parse_article_body
+from sources import DEFAULT_SOURCES, SOURCES, Source, get_source
 
 # =============================================================================
 # CONFIGURATION - Modifiez ces valeurs selon vos besoins
 # =============================================================================
 
 # URL du site source des actualités
-URL_SOURCE = "https://thehackernews.com"
+URL_SOURCE = SOURCES["thehackernews"].url
 
 # En-têtes HTTP pour simuler un navigateur classique
 # Modifiez si vous rencontrez des blocages
@@ -31,8 +46,297 @@ HEADERS = {
 # Délai d'attente maximal pour les requêtes (en secondes)
 TIMEOUT = 15
 
+# Nombre maximal de téléchargements simultanés (toutes sources confondues)
+MAX_WORKERS = 8
+
+# Nombre maximal de téléchargements simultanés vers un même hôte
+PER_HOST_LIMIT = 2
+
+# Requêtes conditionnelles via le cache HTTP sur disque (voir http_cache.py)
+USE_HTTP_CACHE = True
+
+
+# =============================================================================
+# TÉLÉCHARGEMENT CONCURRENT
+# =============================================================================
+
+# Limiteurs par hôte, créés à la demande
+_host_limiters: Dict[str, "HostLimiter"] = {}
+_host_limiters_lock = threading.Lock()
+
+# Cache HTTP partagé et URLs téléchargées pendant ce run
+_http_cache: HTTPCache | None = None
+_fetched_urls: set = set()
+_fetched_urls_lock = threading.Lock()
+
+
+class HostLimiter:
+    """
+    Compte les requêtes en cours vers un hôte.
+
+    Un seul compteur par hôte, quelle que soit la limite demandée: un
+    appel avec une autre limite (autre per_host_limit, configuration
+    modifiée entre deux runs du mode service) attend que le nombre de
+    requêtes en cours passe sous sa propre limite, sans ouvrir de places
+    supplémentaires.
+    """
+
+    def __init__(self):
+        self.active = 0
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def slot(self, limit: int):
+        """Réserve une place tant que moins de `limit` requêtes sont en cours."""
+        with self._condition:
+            self._condition.wait_for(lambda: self.active < max(1, limit))
+            self.active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self.active -= 1
+                # Les appelants en attente n'ont pas tous la même limite
+                self._condition.notify_all()
+
+
+def _host_limiter(url: str) -> HostLimiter:
+    """Retourne le limiteur des requêtes simultanées vers l'hôte de l'URL."""
+    host = urlsplit(url).netloc.lower()
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None:
+            limiter = _host_limiters[host] = HostLimiter()
+        return limiter
+
+
+def get_http_cache() -> HTTPCache | None:
+    """Retourne le cache HTTP partagé (None si USE_HTTP_CACHE est désactivé)."""
+    global _http_cache
+    if not USE_HTTP_CACHE:
+        return None
+    if _http_cache is None:
+        _http_cache = HTTPCache()
+    return _http_cache
+
+
+def fetch_url(url: str, per_host_limit: int = PER_HOST_LIMIT) -> tuple[str | None, bool]:
+    """
+    Télécharge une page en respectant la limite de connexions par hôte.
+
+    Si la page est en cache, la requête est conditionnelle
+    (If-None-Match / If-Modified-Since): sur un 304, le corps est relu
+    depuis le cache sans être retéléchargé.
 
-def scrape_hackernews(num_articles: int = 3) -> List[Dict[str, str]]:
+    Returns:
+        Tuple (contenu texte ou None en cas d'erreur, page inchangée)
+        "Inchangée" signifie: 304 reçu pour un contenu déjà traité par
+        un run précédent (voir mark_sources_processed).
+    """
+    cache = get_http_cache()
+    headers = dict(HEADERS)
+    if cache is not None:
+        headers.update(cache.conditional_headers(url))
+
+    with _host_limiter(url).slot(per_host_limit):
+        try:
+            response = get_session().get(url, headers=headers, timeout=TIMEOUT)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"❌ Erreur lors de la récupération de {url}: {e}")
+            return None, False
+
+    with _fetched_urls_lock:
+        _fetched_urls.add(url)
+
+    if cache is None:
+        return response.text, False
+
+    METRICS.incr("cache_lookups_total", cache="http",
+                 result="hit" if response.status_code == 304 else "miss")
+    if response.status_code == 304:
+        entry = cache.lookup(url)
+        body = cache.read(url)
+        if entry is not None and body is not None:
+            text = body.decode(entry.get("encoding") or "utf-8", errors="replace")
+            return text, cache.is_processed(url)
+        # Entrée disparue entre-temps: retélécharger sans validateurs
+        print(f"⚠️ Cache incohérent pour {url}, nouveau téléchargement")
+        try:
+            response = get_session().get(url, headers=HEADERS, timeout=TIMEOUT)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"❌ Erreur lors de la récupération de {url}: {e}")
+            return None, False
+
+    encoding = response.encoding or response.apparent_encoding
+    cache.store(
+        url,
+        response.content,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+        encoding=encoding
+    )
+    return response.text, False
+
+
+def mark_sources_processed() -> None:
+    """
+    Marque les pages téléchargées pendant ce run comme traitées.
+
+    À appeler une fois le pipeline terminé avec succès: au run suivant,
+    un 304 sur ces pages permettra de sauter tout le traitement.
+    """
+    cache = get_http_cache()
+    with _fetched_urls_lock:
+        if cache is not None:
+            cache.mark_processed(_fetched_urls)
+        _fetched_urls.clear()
+
+
+def _parse_source(source: Source, content: str, num_articles: int) -> List[Dict[str, str]]:
+    """Parse le contenu d'une source et annote chaque article avec son nom."""
+    try:
+        with METRICS.span("parse", source=source.name):
+            articles = source.parser(content, num_articles)
+    except Exception as e:
+        print(f"⚠️ Erreur lors du parsing de {source.name}: {e}")
+        return []
+    for article in articles:
+        article["source"] = source.name
+    return articles
+
+
+def scrape_source(source: Source, num_articles: int = 3,
+                  per_host_limit: int = PER_HOST_LIMIT) -> List[Dict[str, str]]:
+    """
+    Télécharge et parse une source unique.
+
+    Chaque article retourné porte le nom de sa source dans le champ 'source'.
+    """
+    content, _ = fetch_url(source.url, per_host_limit)
+    if content is None:
+        return []
+    return _parse_source(source, content, num_articles)
+
+
+def _normalize_url(url: str) -> str:
+    """Normalise une URL pour la déduplication (schéma, casse, slash final, query)."""
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("https", parts.netloc.lower().removeprefix("www."), path, "", ""))
+
+
+def merge_articles(results: Iterable[List[Dict[str, str]]]) -> List[Dict[str, str]]:
+    """
+    Fusionne les listes d'articles de plusieurs sources.
+
+    Les articles sont entrelacés (1er de chaque source, puis 2e, ...) afin
+    qu'aucune source ne monopolise le haut de la liste, et les doublons
+    (même URL normalisée ou même titre) sont supprimés.
+    """
+    results = [list(articles) for articles in results]
+    merged = []
+    seen_urls = set()
+    seen_titles = set()
+
+    for rank in range(max((len(articles) for articles in results), default=0)):
+        for articles in results:
+            if rank >= len(articles):
+                continue
+            article = articles[rank]
+            url_key = _normalize_url(article["url"])
+            title_key = " ".join(article["title"].lower().split())
+            if url_key in seen_urls or title_key in seen_titles:
+                continue
+            seen_urls.add(url_key)
+            seen_titles.add(title_key)
+            merged.append(article)
+
+    return merged
+
+
+def scrape_sources(
+    sources: Iterable[str | Source] | None = None,
+    num_articles: int = 3,
+    limit: int | None = None,
+    max_workers: int = MAX_WORKERS,
+    per_host_limit: int = PER_HOST_LIMIT,
+    skip_unchanged: bool = False
+) -> List[Dict[str, str]] | None:
+    """
+    Récupère les actualités de plusieurs sources en parallèle.
+
+    Les sources sont téléchargées dans un pool de threads borné, avec au
+    plus `per_host_limit` requêtes simultanées par hôte. Une source en
+    erreur est ignorée sans bloquer les autres.
+
+    Args:
+        sources: Noms de sources enregistrées ou objets Source
+                 (défaut: DEFAULT_SOURCES)
+        num_articles: Nombre d'articles à récupérer par source
+        limit: Nombre maximal d'articles après fusion (défaut: pas de limite)
+        max_workers: Taille du pool de threads
+        per_host_limit: Requêtes simultanées maximales par hôte
+        skip_unchanged: Retourner None si toutes les sources ont répondu
+                        304 pour un contenu déjà traité
+
+    Returns:
+        Liste fusionnée et dédupliquée d'articles (title, url, summary, source),
+        ou None si skip_unchanged est actif et que rien n'a changé
+
+    Exemple d'utilisation:
+        >>> articles = scrape_sources(["thehackernews", "bleepingcomputer"], 3)
+    """
+    if sources is None:
+        sources = DEFAULT_SOURCES
+    resolved = [s if isinstance(s, Source) else get_source(s) for s in sources]
+    if not resolved:
+        return []
+
+    # Téléchargements en parallèle; le parsing n'a lieu qu'ensuite, et
+    # seulement si au moins une source a changé
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(resolved))) as pool:
+        fetched = list(pool.map(lambda source: fetch_url(source.url, per_host_limit), resolved))
+
+    if skip_unchanged and all(unchanged for _, unchanged in fetched):
+        return None
+
+    results = [
+        _parse_source(source, content, num_articles) if content is not None else []
+        for source, (content, _) in zip(resolved, fetched)
+    ]
+
+    merged = merge_articles(results)
+    return merged[:limit] if limit is not None else merged
+
+
+def fetch_article_bodies(articles: List[Dict[str, str]], max_workers: int = MAX_WORKERS,
+                         per_host_limit: int = PER_HOST_LIMIT) -> List[str | None]:
+    """
+    Récupère le texte complet de chaque article (page de l'article).
+
+    Les pages sont téléchargées en parallèle, avec les mêmes limites par
+    hôte et le même cache HTTP que les sources.
+
+    Returns:
+        Pour chaque article, le texte de son corps (paragraphes séparés
+        par une ligne vide), ou None si la page est inaccessible ou vide
+    """
+    def fetch(article: Dict[str, str]) -> str | None:
+        content, _ = fetch_url(article["url"], per_host_limit)
+        if content is None:
+            return None
+        with METRICS.span("parse", source="article"):
+            return parse_article_body(content) or None
+
+    if not articles:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(articles))) as pool:
+        return list(pool.map(fetch, articles))
+
+
+def scrape_hackernews(num_articles: int = 3, skip_unchanged: bool = False) -> List[Dict[str, str]] | None:
     """
     Récupère les dernières actualités de TheHackerNews.com.
     
@@ -42,12 +346,15 @@ def scrape_hackernews(num_articles: int = 3) -> List[Dict[str, str]]:
     Args:
         num_articles: Nombre d'articles à récupérer (défaut: 3)
                       Modifiez cette valeur pour obtenir plus/moins d'articles
+        skip_unchanged: Retourner None si la page d'accueil n'a pas changé
+                        depuis le dernier run traité (réponse 304)
     
     Returns:
         Liste de dictionnaires contenant pour chaque article:
         - title: Titre de l'article (en anglais)
         - url: Lien vers l'article complet
         - summary: Résumé/extrait de l'article
+        - source: Nom de la source ("thehackernews")
     
     Raises:
         Ne lève pas d'exception, retourne une liste vide en cas d'erreur
@@ -57,55 +364,7 @@ def scrape_hackernews(num_articles: int = 3) -> List[Dict[str, str]]:
         >>> for article in articles:
         ...     print(article['title'])
     """
-    try:
-        # Effectuer la requête HTTP
-        response = requests.get(URL_SOURCE, headers=HEADERS, timeout=TIMEOUT)
-        response.raise_for_status()
-    except requests.RequestException as e:
-        print(f"❌ Erreur lors de la récupération de {URL_SOURCE}: {e}")
-        return []
-    
-    # Parser le HTML avec BeautifulSoup
-    soup = BeautifulSoup(response.text, "html.parser")
-    articles = []
-    
-    # Rechercher les éléments d'articles
-    # Structure HTML de TheHackerNews: <a class="story-link"> contient le lien et titre
-    story_links = soup.find_all("a", class_="story-link")
-    
-    for link in story_links[:num_articles]:
-        try:
-            # Extraire l'URL de l'article
-            article_url = link.get("href", "")
-            
-            # Extraire le titre depuis l'élément h2
-            title_element = link.find("h2", class_="home-title")
-            if not title_element:
-                continue
-            
-            title = title_element.get_text(strip=True)
-            
-            # Extraire le résumé depuis le parent (div.body-post)
-            parent = link.find_parent("div", class_="body-post")
-            summary = ""
-            if parent:
-                excerpt_element = parent.find("div", class_="home-desc")
-                summary = excerpt_element.get_text(strip=True) if excerpt_element else ""
-            
-            # Ajouter l'article si les données essentielles sont présentes
-            if title and article_url:
-                articles.append({
-                    "title": title,
-                    "url": article_url,
-                    "summary": summary
-                })
-                
-        except Exception as e:
-            # Continuer avec les autres articles en cas d'erreur
-            print(f"⚠️ Erreur lors du parsing d'un article: {e}")
-            continue
-    
-    return articles
+    return scrape_sources(["thehackernews"], num_articles, skip_unchanged=skip_unchanged)
 
 
 # =============================================================================
@@ -113,13 +372,17 @@ def scrape_hackernews(num_articles: int = 3) -> List[Dict[str, str]]:
 # =============================================================================
 if __name__ == "__main__":
     import json
+    import sys
+    
+    # Sources passées en argument (ex: python scraper.py thehackernews cert-fr)
+    names = sys.argv[1:] or DEFAULT_SOURCES
     
-    print("🔍 Test du scraper TheHackerNews...")
-    print(f"📡 Source: {URL_SOURCE}")
+    print("🔍 Test du scraper...")
+    print(f"📡 Sources: {', '.join(names)}")
     print()
     
     # Récupérer les articles
-    news = scrape_hackernews(3)
+    news = scrape_sources(names, 3)
     
     if news:
         print(f"✅ {len(news)} articles récupérés:\n")
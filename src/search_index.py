@@ -0,0 +1,354 @@
+"""
+CyberDailyWatch - Index de recherche
+Index inversé plein texte des articles archivés.
+
+Chaque article (title, summary et leur traduction dans la langue de
+l'édition, ex: title_fr, summary_fr) est découpé en termes normalisés (minuscules, sans accents). Les identifiants composés
+comme "CVE-2024-3400" ou "LockBit-3" sont indexés entiers et par
+morceaux. L'index est enrichi à chaque run avec les nouveaux articles
+seulement.
+
+L'index est écrit sous une forme prête à être interrogée par le site
+statique (cyber-news/archive/search/):
+    - index.json: manifeste (nombre de documents, de fragments, etc.)
+    - terms/NN.json: listes d'identifiants de documents par terme,
+      réparties en NUM_SHARDS fragments selon le hash FNV-1a du terme
+    - docs/NNNNN.json: titre, URL et date des documents, par blocs de
+      DOC_CHUNK_SIZE
+
+Une recherche ne télécharge que les fragments des termes demandés et
+les blocs des documents affichés, jamais l'archive complète. Seuls les
+fichiers modifiés sont réécrits après un ajout.
+
+Configuration modifiable:
+    - INDEX_DIR: Dossier de l'index
+    - NUM_SHARDS / DOC_CHUNK_SIZE: Découpage des fichiers
+
+Exemple d'utilisation:
+    >>> index = get_search_index()
+    >>> index.add_articles(articles, "2026-01-22")
+    >>> index.save()
+    >>> index.search("CVE-2024-3400")
+"""
+
+import bisect
+import json
+import re
+import threading
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from archive import ARCHIVE_DIR, DEFAULT_EDITION, write_json_atomic
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Dossier de l'index (publié avec le site, à côté de l'archive)
+INDEX_DIR = ARCHIVE_DIR / "search"
+
+# Nombre de fragments de termes (ne pas modifier sur un index existant)
+NUM_SHARDS = 64
+
+# Nombre de documents par bloc
+DOC_CHUNK_SIZE = 1000
+
+# Champs indexés de chaque article ({edition}: code de l'édition, ex: title_fr)
+INDEXED_FIELDS = ("title", "summary", "title_{edition}", "summary_{edition}")
+
+# Mots trop fréquents pour être utiles (français et anglais)
+STOP_WORDS = frozenset("""
+    a an and are as at be by for from has have in is it its of on or that the
+    this to was were will with au aux avec ce ces dans de des du en est et il
+    ils la le les leur mais ne par pas plus pour qu que qui se sont sur un une
+""".split())
+
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:[-_.][a-z0-9]+)*")
+SEPARATOR_RE = re.compile(r"[-_.]")
+COMBINING_RE = re.compile("[\u0300-\u036f]")
+
+
+def normalize(text: str) -> str:
+    """Minuscules et suppression des accents."""
+    if text.isascii():
+        return text.lower()
+    return COMBINING_RE.sub("", unicodedata.normalize("NFKD", text.lower()))
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Découpe un texte en termes indexables.
+
+    Un identifiant composé produit le terme complet puis ses morceaux:
+    "CVE-2024-3400" donne "cve-2024-3400", "cve", "2024" et "3400".
+    """
+    terms = []
+    for token in TOKEN_RE.findall(normalize(text)):
+        terms.extend(_token_terms(token))
+    return terms
+
+
+@lru_cache(maxsize=65536)
+def _token_terms(token: str) -> tuple:
+    parts = SEPARATOR_RE.split(token)
+    terms = (token,) if len(parts) > 1 else ()
+    return terms + tuple(part for part in parts if len(part) > 1 and part not in STOP_WORDS)
+
+
+def query_terms(query: str) -> List[str]:
+    """Termes d'une requête: les identifiants composés ne sont pas redécoupés."""
+    terms = []
+    for token in TOKEN_RE.findall(normalize(query)):
+        if len(token) > 1 and token not in STOP_WORDS and token not in terms:
+            terms.append(token)
+    return terms
+
+
+@lru_cache(maxsize=65536)
+def shard_of(term: str, num_shards: int = NUM_SHARDS) -> int:
+    """Fragment d'un terme: hash FNV-1a 32 bits (reproduit côté frontend)."""
+    h = 0x811C9DC5
+    for byte in term.encode("utf-8"):
+        h = ((h ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return h % num_shards
+
+
+def _delta_encode(ids: List[int]) -> List[int]:
+    return [ids[0]] + [b - a for a, b in zip(ids, ids[1:])] if ids else []
+
+
+def _delta_decode(deltas: List[int]) -> List[int]:
+    ids, total = [], 0
+    for delta in deltas:
+        total += delta
+        ids.append(total)
+    return ids
+
+
+def _article_terms(article: Dict[str, str], edition: str) -> set:
+    """Termes indexés d'un article (titres et résumés, original et traduction de l'édition)."""
+    return set(tokenize(" ".join(article.get(name.format(edition=edition)) or "" for name in INDEXED_FIELDS)))
+
+
+def _doc_title(article: Dict[str, str], edition: str) -> str:
+    """Titre affiché d'un document (traduit dans la langue de l'édition si possible)."""
+    return article.get(f"title_{edition}") or article.get("title", "")
+
+
+class SearchIndex:
+    """
+    Index inversé des articles, persistant sous forme de fichiers JSON.
+
+    Les documents sont numérotés dans l'ordre d'ajout: un identifiant
+    plus grand correspond à un article plus récent.
+
+    Args:
+        directory: Dossier de l'index (None = index en mémoire seulement)
+        num_shards: Nombre de fragments de termes
+        doc_chunk_size: Nombre de documents par bloc
+    """
+
+    def __init__(self, directory: str | Path | None = INDEX_DIR, num_shards: int = NUM_SHARDS,
+                 doc_chunk_size: int = DOC_CHUNK_SIZE):
+        self.directory = Path(directory) if directory else None
+        self._lock = threading.Lock()
+        manifest = self._read(self.directory / "index.json", {}) if self.directory else {}
+        self.num_shards = manifest.get("num_shards") or num_shards
+        self.doc_chunk_size = manifest.get("doc_chunk_size") or doc_chunk_size
+        self.docs: List[list] = []
+        self.postings: Dict[str, List[int]] = {}
+        self._urls: set = set()
+        self._dirty_shards: set = set()
+        self._dirty_chunks: set = set()
+        if manifest:
+            self._load(manifest)
+
+    # -------------------------------------------------------------------------
+    # Fichiers
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _read(path: Path, default):
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return default
+
+    def _shard_path(self, shard: int) -> Path:
+        return self.directory / "terms" / f"{shard:02d}.json"
+
+    def _chunk_path(self, chunk: int) -> Path:
+        return self.directory / "docs" / f"{chunk:05d}.json"
+
+    def _load(self, manifest: dict) -> None:
+        for chunk in range(manifest.get("doc_chunks", 0)):
+            self.docs.extend(self._read(self._chunk_path(chunk), []))
+        for shard in range(self.num_shards):
+            for term, deltas in self._read(self._shard_path(shard), {}).items():
+                self.postings[term] = _delta_decode(deltas)
+        self._urls = {doc[1] for doc in self.docs}
+
+    def save(self) -> None:
+        """Écrit les fragments et blocs modifiés, puis le manifeste."""
+        if not self.directory:
+            return
+        with self._lock:
+            for chunk in sorted(self._dirty_chunks):
+                start = chunk * self.doc_chunk_size
+                write_json_atomic(self._chunk_path(chunk), self.docs[start:start + self.doc_chunk_size])
+            if self._dirty_shards:
+                shards: Dict[int, dict] = {shard: {} for shard in self._dirty_shards}
+                for term, ids in self.postings.items():
+                    shard = shard_of(term, self.num_shards)
+                    if shard in shards:
+                        shards[shard][term] = _delta_encode(ids)
+                for shard, terms in shards.items():
+                    write_json_atomic(self._shard_path(shard), terms)
+            write_json_atomic(self.directory / "index.json", {
+                "version": 1,
+                "docs": len(self.docs),
+                "terms": len(self.postings),
+                "num_shards": self.num_shards,
+                "doc_chunk_size": self.doc_chunk_size,
+                "doc_chunks": -(-len(self.docs) // self.doc_chunk_size)
+            })
+            self._dirty_chunks.clear()
+            self._dirty_shards.clear()
+
+    # -------------------------------------------------------------------------
+    # Indexation
+    # -------------------------------------------------------------------------
+
+    def add_articles(self, articles: Iterable[Dict[str, str]], date: str,
+                     edition: str = DEFAULT_EDITION) -> int:
+        """
+        Indexe les articles pas encore présents (repérés par leur URL).
+
+        Args:
+            articles: Articles (title, url, summary, title_<edition>, summary_<edition>)
+            date: Date de publication du briefing (AAAA-MM-JJ)
+            edition: Code de l'édition des traductions (ex: "fr")
+
+        Returns:
+            Nombre d'articles ajoutés
+        """
+        added = 0
+        with self._lock:
+            for article in articles:
+                url = article.get("url", "")
+                if url in self._urls:
+                    continue
+                doc_id = len(self.docs)
+                self.docs.append([_doc_title(article, edition), url, date])
+                self._urls.add(url)
+                self._dirty_chunks.add(doc_id // self.doc_chunk_size)
+
+                for term in _article_terms(article, edition):
+                    # Les identifiants croissent: la liste reste triée
+                    self.postings.setdefault(term, []).append(doc_id)
+                    self._dirty_shards.add(shard_of(term, self.num_shards))
+                added += 1
+        return added
+
+    def reindex_articles(self, articles: Iterable[Dict[str, str]], date: str,
+                         edition: str = DEFAULT_EDITION) -> int:
+        """
+        Réindexe des articles déjà présents (nouvelle traduction) et ajoute les autres.
+
+        Un article réindexé garde son identifiant (et sa date): seuls son
+        titre et ses termes changent.
+
+        Args:
+            articles: Articles (title, url, summary, title_<edition>, summary_<edition>)
+            date: Date de publication du briefing (AAAA-MM-JJ), pour les nouveaux articles
+            edition: Code de l'édition des traductions (ex: "fr")
+
+        Returns:
+            Nombre d'articles réindexés ou ajoutés
+        """
+        articles = list(articles)
+        with self._lock:
+            urls = {article.get("url", "") for article in articles} & self._urls
+            doc_ids = {doc[1]: i for i, doc in enumerate(self.docs) if doc[1] in urls}
+            terms = {}
+            for article in articles:
+                doc_id = doc_ids.get(article.get("url", ""))
+                if doc_id is not None:
+                    terms[doc_id] = _article_terms(article, edition)
+                    self.docs[doc_id][0] = _doc_title(article, edition)
+                    self._dirty_chunks.add(doc_id // self.doc_chunk_size)
+
+            # Termes qui ne décrivent plus l'article
+            for term, ids in list(self.postings.items()):
+                for doc_id, doc_terms in terms.items():
+                    position = bisect.bisect_left(ids, doc_id)
+                    if term not in doc_terms and position < len(ids) and ids[position] == doc_id:
+                        del ids[position]
+                        self._dirty_shards.add(shard_of(term, self.num_shards))
+                if not ids:
+                    del self.postings[term]
+            # Nouveaux termes, insérés à leur place (les listes restent triées)
+            for doc_id, doc_terms in terms.items():
+                for term in doc_terms:
+                    ids = self.postings.setdefault(term, [])
+                    position = bisect.bisect_left(ids, doc_id)
+                    if position == len(ids) or ids[position] != doc_id:
+                        ids.insert(position, doc_id)
+                        self._dirty_shards.add(shard_of(term, self.num_shards))
+        return len(terms) + self.add_articles(articles, date, edition)
+
+    # -------------------------------------------------------------------------
+    # Recherche
+    # -------------------------------------------------------------------------
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, str]]:
+        """
+        Cherche les articles contenant tous les termes de la requête.
+
+        Returns:
+            Articles trouvés, du plus récent au plus ancien:
+            [{"title": ..., "url": ..., "date": ...}, ...]
+        """
+        terms = query_terms(query)
+        if not terms:
+            return []
+        with self._lock:
+            lists = []
+            for term in terms:
+                ids = self.postings.get(term)
+                parts = tokenize(term)[1:] if ids is None else []
+                if parts:
+                    # Identifiant partiel ("CVE-2024"): tous ses morceaux
+                    lists.extend(self.postings.get(part, []) for part in parts)
+                else:
+                    lists.append(ids or [])
+            lists.sort(key=len)
+            if not lists[0]:
+                return []
+            matches = set(lists[0])
+            for ids in lists[1:]:
+                matches.intersection_update(ids)
+                if not matches:
+                    return []
+            return [
+                {"title": self.docs[i][0], "url": self.docs[i][1], "date": self.docs[i][2]}
+                for i in sorted(matches, reverse=True)[:limit]
+            ]
+
+    def stats(self) -> dict:
+        """Taille de l'index."""
+        return {"docs": len(self.docs), "terms": len(self.postings)}
+
+
+_index: SearchIndex | None = None
+
+
+def get_search_index() -> SearchIndex:
+    """Retourne l'index de recherche partagé, chargé au premier appel."""
+    global _index
+    if _index is None:
+        _index = SearchIndex()
+    return _index
@@ -0,0 +1,458 @@
+"""
+CyberDailyWatch - Mode service
+Processus de longue durée: rafraîchit le Flash Info à intervalle régulier
+et sert les fichiers publiés via une petite API HTTP asynchrone.
+
+Contrairement au run quotidien de la CI (python main.py, qui repart de
+zéro), le service garde en mémoire d'un rafraîchissement à l'autre la
+session HTTP et son pool de connexions, les clients des providers IA,
+la mémoire de traduction, le cache audio, l'historique de déduplication,
+l'archive et l'index de recherche. Un rafraîchissement sans nouveauté
+s'arrête dès la réponse 304 des sources: un intervalle d'une heure
+coûte très peu.
+
+Routes:
+    - GET /data.json, /audio/..., /archive/..., /editions/...: fichiers
+      de PUBLIC_DIR (ETag, Last-Modified, requêtes conditionnelles et
+      Range pour la lecture audio); les versions précompressées écrites
+      par outputs.py (.br, .gz) sont servies aux clients qui les acceptent
+    - GET /api/status: état du service et du dernier rafraîchissement
+    - GET /metrics: mesures du dernier rafraîchissement (Prometheus)
+    - POST /api/refresh: lance un rafraîchissement immédiat
+
+Configuration modifiable:
+    - SERVICE_HOST / SERVICE_PORT: Adresse d'écoute
+    - REFRESH_INTERVAL: Intervalle entre deux rafraîchissements
+    - CORS_ORIGIN: Origine autorisée à lire l'API depuis un navigateur
+
+Usage:
+    python service.py [--host 0.0.0.0] [--port 8080] [--interval 3600]
+"""
+
+import argparse
+import asyncio
+import json
+import mimetypes
+import signal
+import time
+import traceback
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+import main as daily
+from metrics import METRICS
+from outputs import ENCODING_SUFFIXES
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Adresse d'écoute (127.0.0.1 = accessible uniquement depuis la machine)
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8080
+
+# Intervalle entre deux rafraîchissements (en secondes)
+REFRESH_INTERVAL = 3600
+
+# Rafraîchir dès le démarrage du service
+REFRESH_ON_START = True
+
+# Origine autorisée pour les requêtes depuis un navigateur (None = pas d'en-tête CORS)
+CORS_ORIGIN = "*"
+
+# Fermeture d'une connexion inactive (en secondes)
+KEEPALIVE_TIMEOUT = 15
+
+# Nombre maximal de lignes d'en-tête d'une requête
+MAX_HEADER_LINES = 100
+
+# Taille des blocs lus sur le disque pour les réponses (en octets)
+READ_CHUNK = 64 * 1024
+
+# Versions précompressées servies, par ordre de préférence (voir outputs.py)
+SERVED_ENCODINGS = ("br", "gzip")
+
+STATUS_TEXT = {
+    200: "OK", 202: "Accepted", 206: "Partial Content", 302: "Found", 304: "Not Modified",
+    400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 416: "Range Not Satisfiable",
+    500: "Internal Server Error",
+}
+
+
+@dataclass
+class Response:
+    """Réponse HTTP: corps en mémoire (body) ou portion d'un fichier (path, offset, length)."""
+    status: int
+    headers: dict = field(default_factory=dict)
+    body: bytes = b""
+    path: Path | None = None
+    offset: int = 0
+    length: int = 0
+
+    @classmethod
+    def json(cls, data, status: int = 200) -> "Response":
+        body = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        return cls(status, {"Content-Type": "application/json; charset=utf-8", "Cache-Control": "no-store"}, body)
+
+    @classmethod
+    def error(cls, status: int) -> "Response":
+        return cls.json({"error": STATUS_TEXT[status]}, status)
+
+
+# =============================================================================
+# FICHIERS PUBLIÉS
+# =============================================================================
+
+def file_etag(stat) -> str:
+    """ETag d'un fichier: taille et date de modification (change à chaque réécriture)."""
+    return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    candidates = [value.strip().removeprefix("W/") for value in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """
+    Plage d'octets demandée ("bytes=début-fin", une seule plage).
+
+    Returns:
+        Tuple (début, longueur), ou None si la plage est invalide
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        return None
+    start, _, end = spec.strip().partition("-")
+    try:
+        if not start:
+            length = min(int(end), size)
+            return (size - length, length) if length > 0 else None
+        start = int(start)
+        end = min(int(end), size - 1) if end else size - 1
+    except ValueError:
+        return None
+    if start >= size or end < start:
+        return None
+    return start, end - start + 1
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    """Encodages d'un en-tête Accept-Encoding (sauf ceux de poids q=0)."""
+    accepted = set()
+    for item in header.split(","):
+        name, _, params = item.partition(";")
+        weight = params.strip().removeprefix("q=") if params.strip().startswith("q=") else "1"
+        try:
+            if float(weight) > 0:
+                accepted.add(name.strip().lower())
+        except ValueError:
+            continue
+    return accepted
+
+
+def serve_file(root: Path, path: str, headers: dict) -> Response:
+    """
+    Réponse pour un fichier de root (404 hors de root ou pour un fichier caché).
+
+    Les requêtes conditionnelles (If-None-Match, If-Modified-Since)
+    reçoivent un 304 si le fichier n'a pas changé; une requête Range
+    reçoit la portion demandée (206). Si le client accepte un encodage
+    dont la version précompressée existe (fichier.br, fichier.gz, au
+    moins aussi récente que le fichier), c'est elle qui est envoyée.
+    """
+    parts = [part for part in unquote(path).split("/") if part]
+    if any(part.startswith(".") for part in parts):
+        return Response.error(404)
+    target = root.joinpath(*parts)
+    try:
+        if not target.resolve().is_relative_to(root.resolve()) or not target.is_file():
+            return Response.error(404)
+        stat = target.stat()
+    except OSError:
+        return Response.error(404)
+
+    modified = datetime.fromtimestamp(int(stat.st_mtime), timezone.utc)
+    content_type, file_encoding = mimetypes.guess_type(target.name)
+    if file_encoding:
+        # Fichier compressé demandé directement (ex: articles.ndjson.gz)
+        content_type = "application/gzip" if file_encoding == "gzip" else "application/octet-stream"
+    content_type = content_type or "application/octet-stream"
+    if content_type.startswith("text/") or content_type == "application/json":
+        content_type += "; charset=utf-8"
+    response_headers = {
+        "Content-Type": content_type,
+        "Last-Modified": format_datetime(modified, usegmt=True),
+        "Cache-Control": "no-cache",
+        "Accept-Ranges": "bytes",
+    }
+
+    variants = [(encoding, target.with_name(target.name + ENCODING_SUFFIXES[encoding]))
+                for encoding in SERVED_ENCODINGS]
+    variants = [(encoding, sibling) for encoding, sibling in variants if sibling.is_file()]
+    if variants:
+        response_headers["Vary"] = "Accept-Encoding"
+    if variants and "range" not in headers:
+        accepted = _accepted_encodings(headers.get("accept-encoding", ""))
+        for encoding, sibling in variants:
+            sibling_stat = sibling.stat()
+            if encoding in accepted and sibling_stat.st_mtime_ns >= stat.st_mtime_ns:
+                target, stat = sibling, sibling_stat
+                response_headers["Content-Encoding"] = encoding
+                response_headers.pop("Accept-Ranges")
+                break
+    etag = file_etag(stat)
+    response_headers["ETag"] = etag
+
+    if "if-none-match" in headers:
+        not_modified = _etag_matches(headers["if-none-match"], etag)
+    else:
+        try:
+            since = parsedate_to_datetime(headers["if-modified-since"])
+            not_modified = since is not None and modified <= since
+        except (KeyError, TypeError, ValueError):
+            not_modified = False
+    if not_modified:
+        return Response(304, response_headers)
+
+    if "range" in headers and _etag_matches(headers.get("if-range", etag), etag):
+        requested = _parse_range(headers["range"], stat.st_size)
+        if requested is None:
+            return Response(416, {"Content-Range": f"bytes */{stat.st_size}"})
+        start, length = requested
+        response_headers["Content-Range"] = f"bytes {start}-{start + length - 1}/{stat.st_size}"
+        return Response(206, response_headers, path=target, offset=start, length=length)
+    return Response(200, response_headers, path=target, length=stat.st_size)
+
+
+# =============================================================================
+# SERVICE
+# =============================================================================
+
+class NewsService:
+    """
+    Rafraîchissements planifiés et API HTTP, sur une même boucle asyncio.
+
+    Les rafraîchissements (main.main) tournent dans un thread, un seul à
+    la fois; les fichiers publiés sont remplacés de façon atomique et
+    restent lisibles pendant un rafraîchissement.
+
+    Args:
+        public_dir: Dossier des fichiers servis (défaut: main.PUBLIC_DIR)
+        interval: Intervalle entre deux rafraîchissements (en secondes)
+        refresh_on_start: Rafraîchir dès le démarrage
+    """
+
+    def __init__(self, public_dir: Path | None = None, interval: float = REFRESH_INTERVAL,
+                 refresh_on_start: bool = REFRESH_ON_START):
+        self.public_dir = Path(public_dir or daily.PUBLIC_DIR)
+        self.interval = interval
+        self.refresh_on_start = refresh_on_start
+        self.started_at = time.time()
+        self.refreshes = 0
+        self.requests = 0
+        self.last_refresh: dict | None = None
+        self.next_refresh: float | None = None
+        self.refreshing = False
+        self._wake = asyncio.Event()
+
+    # -------------------------------------------------------------------------
+    # Rafraîchissements
+    # -------------------------------------------------------------------------
+
+    def _refresh(self) -> dict:
+        """Un run complet du pipeline (dans un thread)."""
+        started = time.time()
+        try:
+            pipeline = daily.main()
+            status = "stopped" if pipeline.stopped else "ok"
+            message = pipeline.stopped
+            stages = {t.name: {"status": t.status, "seconds": round(t.duration, 3)}
+                      for t in pipeline.timings.values()}
+        except Exception as e:
+            traceback.print_exc()
+            status, message, stages = "failed", f"{type(e).__name__}: {e}", {}
+        return {
+            "started_at": datetime.fromtimestamp(started, timezone.utc).isoformat(),
+            "seconds": round(time.time() - started, 3),
+            "status": status,
+            "message": message,
+            "stages": stages,
+        }
+
+    async def scheduler(self) -> None:
+        """Rafraîchit toutes les `interval` secondes, ou plus tôt sur demande (POST /api/refresh)."""
+        if not self.refresh_on_start:
+            self.next_refresh = time.time() + self.interval
+        while True:
+            if self.next_refresh is not None:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), max(0.0, self.next_refresh - time.time()))
+                except asyncio.TimeoutError:
+                    pass
+            self._wake.clear()
+            started = time.time()
+            self.refreshing = True
+            try:
+                self.last_refresh = await asyncio.to_thread(self._refresh)
+            finally:
+                self.refreshing = False
+            self.refreshes += 1
+            self.next_refresh = started + self.interval
+            print(f"🕒 Prochain rafraîchissement: "
+                  f"{datetime.fromtimestamp(self.next_refresh).strftime('%H:%M:%S')}")
+
+    def status(self) -> dict:
+        return {
+            "started_at": datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(),
+            "uptime_seconds": round(time.time() - self.started_at),
+            "interval_seconds": self.interval,
+            "refreshing": self.refreshing,
+            "refreshes": self.refreshes,
+            "requests": self.requests,
+            "next_refresh": (datetime.fromtimestamp(self.next_refresh, timezone.utc).isoformat()
+                             if self.next_refresh and not self.refreshing else None),
+            "last_refresh": self.last_refresh,
+            "editions": daily.EDITIONS,
+        }
+
+    # -------------------------------------------------------------------------
+    # API HTTP
+    # -------------------------------------------------------------------------
+
+    def route(self, method: str, path: str, headers: dict) -> Response:
+        if path == "/api/refresh":
+            if method != "POST":
+                return Response.error(405)
+            self._wake.set()
+            return Response.json({"refreshing": True}, 202)
+        if method not in ("GET", "HEAD"):
+            return Response.error(405)
+        if path == "/":
+            return Response(302, {"Location": "/data.json"})
+        if path == "/api/status":
+            return Response.json(self.status())
+        if path == "/metrics":
+            return Response(200, {"Content-Type": "text/plain; version=0.0.4; charset=utf-8",
+                                  "Cache-Control": "no-store"}, METRICS.to_prometheus().encode("utf-8"))
+        return serve_file(self.public_dir, path, headers)
+
+    async def _send(self, writer: asyncio.StreamWriter, response: Response, head: bool, keep_alive: bool) -> None:
+        headers = dict(response.headers)
+        if CORS_ORIGIN:
+            headers["Access-Control-Allow-Origin"] = CORS_ORIGIN
+        headers["Content-Length"] = str(response.length if response.path else len(response.body))
+        headers["Connection"] = "keep-alive" if keep_alive else "close"
+        lines = [f"HTTP/1.1 {response.status} {STATUS_TEXT[response.status]}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if head or response.status == 304:
+            await writer.drain()
+            return
+        if response.path is None:
+            writer.write(response.body)
+            await writer.drain()
+            return
+        with open(response.path, "rb") as f:
+            f.seek(response.offset)
+            remaining = response.length
+            while remaining > 0:
+                data = await asyncio.to_thread(f.read, min(READ_CHUNK, remaining))
+                if not data:
+                    break
+                writer.write(data)
+                remaining -= len(data)
+                await writer.drain()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Connexion HTTP/1.1 (keep-alive): une requête après l'autre."""
+        try:
+            while True:
+                request_line = await asyncio.wait_for(reader.readline(), KEEPALIVE_TIMEOUT)
+                if not request_line.strip():
+                    break
+                headers = {}
+                for _ in range(MAX_HEADER_LINES):
+                    line = await asyncio.wait_for(reader.readline(), KEEPALIVE_TIMEOUT)
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                else:
+                    await self._send(writer, Response.error(400), False, False)
+                    break
+
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+                    await self._send(writer, Response.error(400), False, False)
+                    break
+                method, target, version = parts
+                if headers.get("content-length", "0").isdigit():
+                    await reader.readexactly(int(headers.get("content-length", "0")))
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                try:
+                    response = self.route(method, urlsplit(target).path, headers)
+                except Exception:
+                    traceback.print_exc()
+                    response = Response.error(500)
+                self.requests += 1
+                await self._send(writer, response, method == "HEAD", keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def serve(self, host: str = SERVICE_HOST, port: int = SERVICE_PORT) -> None:
+        """Démarre l'API et les rafraîchissements, jusqu'à SIGINT/SIGTERM."""
+        server = await asyncio.start_server(self.handle, host, port)
+        address = server.sockets[0].getsockname()
+        print(f"🌐 API disponible sur http://{address[0]}:{address[1]}/ "
+              f"(rafraîchissement toutes les {self.interval:.0f}s)")
+
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        scheduler = asyncio.create_task(self.scheduler())
+        async with server:
+            await stop.wait()
+        scheduler.cancel()
+        print("👋 Arrêt du service" + (" (fin du rafraîchissement en cours)" if self.refreshing else ""))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Flash Info Cyber en mode service (rafraîchissements + API HTTP).")
+    parser.add_argument("--host", default=SERVICE_HOST, help=f"Adresse d'écoute (défaut: {SERVICE_HOST})")
+    parser.add_argument("--port", type=int, default=SERVICE_PORT, help=f"Port (défaut: {SERVICE_PORT})")
+    parser.add_argument("--interval", type=float, default=REFRESH_INTERVAL,
+                        help=f"Secondes entre deux rafraîchissements (défaut: {REFRESH_INTERVAL})")
+    parser.add_argument("--no-initial-refresh", action="store_true",
+                        help="Attendre un intervalle avant le premier rafraîchissement")
+    args = parser.parse_args(argv)
+
+    try:
+        print(f"🤖 Provider IA configuré: {daily.get_ai_provider().upper()}")
+    except ValueError as e:
+        raise SystemExit(str(e))
+    service = NewsService(interval=args.interval, refresh_on_start=not args.no_initial_refresh)
+    asyncio.run(service.serve(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+CyberDailyWatch - Registre des sources
+Déclare les sites et flux RSS/Atom que le scraper sait interroger.
+
+Chaque source associe une URL à une fonction de parsing qui transforme
+le contenu téléchargé en liste d'articles (title, url, summary).
+
+Configuration modifiable:
+    - SOURCES: Sources disponibles (voir register_source)
+    - DEFAULT_SOURCES: Sources interrogées par défaut
+"""
+
+import html
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from parsers import parse_hackernews_html
+
+
+# =============================================================================
+# PARSERS - Conversion du contenu brut en articles
+# =============================================================================
+# Le parser HTML de TheHackerNews (plusieurs moteurs) est dans parsers.py
+
+# Espaces de noms utilisés par les flux Atom
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+# Balises HTML présentes dans les descriptions RSS
+TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _clean_text(text: str | None) -> str:
+    """Supprime les balises HTML et normalise les espaces d'un extrait."""
+    if not text:
+        return ""
+    text = html.unescape(TAG_RE.sub(" ", text))
+    return " ".join(text.split())
+
+
+def parse_feed(content: str, num_articles: int) -> List[Dict[str, str]]:
+    """
+    Extrait les articles d'un flux RSS 2.0 ou Atom.
+
+    Args:
+        content: XML du flux
+        num_articles: Nombre maximal d'articles à extraire
+
+    Returns:
+        Liste d'articles (title, url, summary)
+    """
+    try:
+        root = ET.fromstring(content.encode("utf-8") if isinstance(content, str) else content)
+    except ET.ParseError as e:
+        print(f"⚠️ Flux XML invalide: {e}")
+        return []
+
+    articles = []
+
+    if root.tag == f"{ATOM_NS}feed":
+        # Format Atom: <entry><title/><link href/><summary/></entry>
+        for entry in root.iter(f"{ATOM_NS}entry"):
+            link = entry.find(f"{ATOM_NS}link[@rel='alternate']")
+            if link is None:
+                link = entry.find(f"{ATOM_NS}link")
+            summary = entry.findtext(f"{ATOM_NS}summary") or entry.findtext(f"{ATOM_NS}content")
+            article = {
+                "title": _clean_text(entry.findtext(f"{ATOM_NS}title")),
+                "url": link.get("href", "") if link is not None else "",
+                "summary": _clean_text(summary)
+            }
+            if article["title"] and article["url"]:
+                articles.append(article)
+            if len(articles) >= num_articles:
+                break
+    else:
+        # Format RSS 2.0: <item><title/><link/><description/></item>
+        for item in root.iter("item"):
+            article = {
+                "title": _clean_text(item.findtext("title")),
+                "url": (item.findtext("link") or "").strip(),
+                "summary": _clean_text(item.findtext("description"))
+            }
+            if article["title"] and article["url"]:
+                articles.append(article)
+            if len(articles) >= num_articles:
+                break
+
+    return articles
+
+
+# =============================================================================
+# REGISTRE DES SOURCES
+# =============================================================================
+
+@dataclass(frozen=True)
+class Source:
+    """
+    Source d'actualités interrogeable par le scraper.
+
+    Attributes:
+        name: Identifiant court de la source (ex: "thehackernews")
+        url: URL de la page ou du flux à télécharger
+        parser: Fonction (contenu, num_articles) -> liste d'articles
+    """
+    name: str
+    url: str
+    parser: Callable[[str, int], List[Dict[str, str]]]
+
+
+# Sources connues, indexées par nom
+SOURCES: Dict[str, Source] = {}
+
+
+def register_source(name: str, url: str, parser: Callable[[str, int], List[Dict[str, str]]]) -> Source:
+    """
+    Ajoute (ou remplace) une source dans le registre.
+
+    Exemple d'utilisation:
+        >>> register_source("mon-blog", "https://exemple.org/feed.xml", parse_feed)
+    """
+    source = Source(name=name, url=url, parser=parser)
+    SOURCES[name] = source
+    return source
+
+
+def get_source(name: str) -> Source:
+    """
+    Retourne la source enregistrée sous ce nom.
+
+    Raises:
+        KeyError: Si la source est inconnue
+    """
+    try:
+        return SOURCES[name]
+    except KeyError:
+        raise KeyError(f"Source inconnue: {name} (disponibles: {', '.join(SOURCES)})") from None
+
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+register_source("thehackernews", "https://thehackernews.com", parse_hackernews_html)
+register_source("bleepingcomputer", "https://www.bleepingcomputer.com/feed/", parse_feed)
+register_source("krebsonsecurity", "https://krebsonsecurity.com/feed/", parse_feed)
+register_source("cert-fr", "https://www.cert.ssi.gouv.fr/feed/", parse_feed)
+
+# Sources interrogées par défaut par scrape_sources()
+DEFAULT_SOURCES = ["thehackernews"]
@@ -0,0 +1,224 @@
+"""
+CyberDailyWatch - Résumé extractif local
+Réduit le texte complet d'un article à quelques phrases clés, sans IA.
+
+Les phrases sont représentées par des vecteurs TF-IDF (termes de
+search_index.tokenize), puis notées:
+    - "textrank": centralité de chaque phrase dans le graphe de
+      similarité cosinus entre phrases (PageRank, itération de puissance)
+    - "tfidf": similarité cosinus avec le centroïde du document
+
+Les SUMMARY_SENTENCES meilleures phrases sont rendues dans leur ordre
+d'origine. Avec NumPy (pip install numpy), matrice TF-IDF, similarités
+et itérations sont vectorisées; sans NumPy, un calcul équivalent en pur
+Python est utilisé (plus lent sur les longs articles).
+
+Le résumé est envoyé à l'IA à la place du texte complet: briefings
+plus riches que le seul chapeau de la page d'accueil, pour un nombre
+de tokens borné.
+
+Configuration modifiable:
+    - SUMMARY_SENTENCES: Nombre de phrases conservées
+    - SUMMARY_METHOD: Méthode de notation ("textrank" ou "tfidf")
+    - USE_NUMPY: Utiliser NumPy s'il est installé
+
+Exemple d'utilisation:
+    >>> summarize(body, max_sentences=4)
+"""
+
+import math
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import List
+
+from search_index import tokenize
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Nombre de phrases conservées par article
+SUMMARY_SENTENCES = 4
+
+# Méthode de notation des phrases: "textrank" ou "tfidf"
+SUMMARY_METHOD = "textrank"
+
+# Toujours conserver la première phrase (le chapeau d'un article de presse)
+KEEP_LEAD = True
+
+# Phrases trop courtes pour être retenues (en mots)
+MIN_SENTENCE_WORDS = 6
+
+# Nombre maximal de phrases analysées (les suivantes sont ignorées)
+MAX_SENTENCES = 300
+
+# Paramètres de TextRank
+TEXTRANK_DAMPING = 0.85
+TEXTRANK_ITERATIONS = 50
+TEXTRANK_TOLERANCE = 1e-6
+
+# Utiliser NumPy s'il est installé (False = toujours le calcul en pur Python)
+USE_NUMPY = True
+
+# Fin de phrase: ponctuation, espaces, puis majuscule, chiffre ou guillemet
+# (évite de couper "e.g. the" ou "v1.2")
+SENTENCE_RE = re.compile(r"(?<=[.!?…])[\"”»']?\s+(?=[\"“«'(]?[A-Z0-9À-Ý])")
+
+# Abréviations après lesquelles une phrase ne se termine pas ("U.S.", "Inc.")
+ABBREVIATION_RE = re.compile(r"(?:\b(?:[A-Z]\.){1,3}|\b(?:Mr|Mrs|Ms|Dr|Inc|Corp|Ltd|Co|vs|No|St|M|Mme)\.)$")
+
+
+@lru_cache(maxsize=1)
+def _numpy():
+    """Module NumPy, importé au premier résumé (None s'il n'est pas installé)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def split_sentences(text: str) -> List[str]:
+    """Découpe un texte en phrases (les paragraphes ne sont jamais fusionnés)."""
+    sentences = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = " ".join(paragraph.split())
+        if not paragraph:
+            continue
+        parts = SENTENCE_RE.split(paragraph)
+        sentences.append(parts[0])
+        for part in parts[1:]:
+            if ABBREVIATION_RE.search(sentences[-1]):
+                sentences[-1] = f"{sentences[-1]} {part}"
+            else:
+                sentences.append(part)
+    return sentences
+
+
+# =============================================================================
+# NOTATION DES PHRASES
+# =============================================================================
+
+def _scores_numpy(terms: List[List[str]], method: str) -> List[float]:
+    np = _numpy()
+    vocabulary = {}
+    rows, cols, counts = [], [], []
+    for i, sentence in enumerate(terms):
+        for term, count in Counter(sentence).items():
+            rows.append(i)
+            cols.append(vocabulary.setdefault(term, len(vocabulary)))
+            counts.append(count)
+    n = len(terms)
+    matrix = np.zeros((n, max(1, len(vocabulary))))
+    matrix[rows, cols] = counts
+
+    # TF sous-linéaire et IDF lissé, lignes normalisées (cosinus = produit scalaire)
+    document_frequency = np.count_nonzero(matrix, axis=0)
+    matrix = np.log1p(matrix) * (np.log((1 + n) / (1 + document_frequency)) + 1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix /= np.where(norms > 0, norms, 1)
+
+    if method == "tfidf":
+        centroid = matrix.sum(axis=0)
+        norm = np.linalg.norm(centroid)
+        return (matrix @ centroid / norm if norm else np.zeros(n)).tolist()
+
+    similarity = matrix @ matrix.T
+    np.fill_diagonal(similarity, 0.0)
+    weights = similarity.sum(axis=1, keepdims=True)
+    # Une phrase sans voisin distribue son score uniformément
+    transition = np.where(weights > 0, similarity / np.where(weights > 0, weights, 1), 1.0 / n)
+    scores = np.full(n, 1.0 / n)
+    for _ in range(TEXTRANK_ITERATIONS):
+        updated = (1 - TEXTRANK_DAMPING) / n + TEXTRANK_DAMPING * (transition.T @ scores)
+        converged = np.abs(updated - scores).sum() < TEXTRANK_TOLERANCE
+        scores = updated
+        if converged:
+            break
+    return scores.tolist()
+
+
+def _scores_python(terms: List[List[str]], method: str) -> List[float]:
+    n = len(terms)
+    document_frequency = Counter(term for sentence in terms for term in set(sentence))
+    idf = {term: math.log((1 + n) / (1 + df)) + 1 for term, df in document_frequency.items()}
+    vectors = []
+    for sentence in terms:
+        vector = {term: math.log1p(count) * idf[term] for term, count in Counter(sentence).items()}
+        norm = math.sqrt(sum(value * value for value in vector.values())) or 1.0
+        vectors.append({term: value / norm for term, value in vector.items()})
+
+    if method == "tfidf":
+        centroid = Counter()
+        for vector in vectors:
+            centroid.update(vector)
+        norm = math.sqrt(sum(value * value for value in centroid.values()))
+        if not norm:
+            return [0.0] * n
+        return [sum(value * centroid[term] for term, value in vector.items()) / norm for vector in vectors]
+
+    similarity = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            small, large = sorted((vectors[i], vectors[j]), key=len)
+            value = sum(weight * large.get(term, 0.0) for term, weight in small.items())
+            similarity[i][j] = similarity[j][i] = value
+    weights = [sum(row) for row in similarity]
+    scores = [1.0 / n] * n
+    for _ in range(TEXTRANK_ITERATIONS):
+        updated = [(1 - TEXTRANK_DAMPING) / n] * n
+        for i in range(n):
+            if weights[i] > 0:
+                share = TEXTRANK_DAMPING * scores[i] / weights[i]
+                for j, value in enumerate(similarity[i]):
+                    if value:
+                        updated[j] += share * value
+            else:
+                for j in range(n):
+                    updated[j] += TEXTRANK_DAMPING * scores[i] / n
+        converged = sum(abs(a - b) for a, b in zip(updated, scores)) < TEXTRANK_TOLERANCE
+        scores = updated
+        if converged:
+            break
+    return scores
+
+
+def score_sentences(sentences: List[str], method: str = SUMMARY_METHOD) -> List[float]:
+    """
+    Note chaque phrase (plus le score est élevé, plus la phrase est centrale).
+
+    Raises:
+        ValueError: Si la méthode est inconnue
+    """
+    if method not in ("textrank", "tfidf"):
+        raise ValueError(f"Méthode de résumé inconnue: {method} (disponibles: textrank, tfidf)")
+    if not sentences:
+        return []
+    terms = [tokenize(sentence) for sentence in sentences]
+    if USE_NUMPY and _numpy() is not None:
+        return _scores_numpy(terms, method)
+    return _scores_python(terms, method)
+
+
+def summarize(text: str, max_sentences: int = SUMMARY_SENTENCES, method: str = SUMMARY_METHOD) -> str:
+    """
+    Résumé extractif d'un texte: ses max_sentences phrases les plus centrales.
+
+    Les phrases de moins de MIN_SENTENCE_WORDS mots ne sont pas retenues;
+    à score égal, la phrase la plus proche du début l'emporte. Avec
+    KEEP_LEAD, la première phrase est toujours conservée.
+
+    Returns:
+        Phrases retenues, dans leur ordre d'origine, séparées par un espace
+        (le texte normalisé s'il compte déjà au plus max_sentences phrases)
+    """
+    sentences = split_sentences(text)[:MAX_SENTENCES]
+    candidates = [i for i, sentence in enumerate(sentences) if len(sentence.split()) >= MIN_SENTENCE_WORDS]
+    if len(candidates) <= max_sentences:
+        return " ".join(sentences[i] for i in candidates) if candidates else " ".join(sentences)
+    scores = score_sentences([sentences[i] for i in candidates], method)
+    lead = [0] if KEEP_LEAD and max_sentences > 0 else []
+    ranked = sorted((k for k in range(len(candidates)) if k not in lead), key=lambda k: (-scores[k], k))
+    best = lead + ranked[:max_sentences - len(lead)]
+    return " ".join(sentences[candidates[k]] for k in sorted(best))
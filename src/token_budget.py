@@ -0,0 +1,247 @@
+"""
+CyberDailyWatch - Budget de tokens
+Estimation de la taille des prompts, découpage en requêtes et suivi des coûts.
+
+La taille d'un texte en tokens est calculée avec tiktoken s'il est
+installé (modèles OpenAI), sinon estimée à partir du nombre de
+caractères (un token pour ~3.5 caractères, estimation prudente pour le
+français). Les limites de contexte et de sortie de chaque modèle
+permettent de:
+    - raccourcir les résumés trop longs, de façon déterministe (coupure
+      en fin de phrase, sinon en fin de mot)
+    - regrouper les articles dans le moins de requêtes possible sans
+      dépasser les limites (la réponse n'est jamais tronquée)
+    - calculer max_tokens d'après la taille attendue de la réponse
+
+La consommation réelle (tokens envoyés et reçus, coût estimé) de chaque
+appel est comptabilisée par provider et modèle, et ajoutée au journal
+USAGE_LOG à la fin du run (les MAX_USAGE_RUNS derniers runs).
+
+Configuration modifiable:
+    - MODEL_LIMITS: Contexte, sortie maximale et prix de chaque modèle
+    - USAGE_LOG: Journal de consommation (une ligne JSON par run)
+    - MAX_USAGE_RUNS: Nombre de runs conservés dans le journal
+
+Exemple d'utilisation:
+    >>> count_tokens("Bonjour le monde", "gpt-4o-mini")
+    >>> compact_text(summary, 120)
+    >>> pack(articles, article_tokens, max_input=3000)
+"""
+
+import json
+import math
+import os
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, List, Sequence, TypeVar
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Limites et prix (en dollars par million de tokens) des modèles
+MODEL_LIMITS = {
+    "gpt-4o-mini": {"context": 128_000, "output": 16_384, "input_price": 0.15, "output_price": 0.60},
+    "gemini-1.5-flash": {"context": 1_048_576, "output": 8_192, "input_price": 0.075, "output_price": 0.30},
+}
+
+# Limites prudentes pour un modèle inconnu
+DEFAULT_LIMITS = {"context": 8_192, "output": 2_048, "input_price": 0.0, "output_price": 0.0}
+
+# Nombre de caractères par token (estimation sans tiktoken)
+CHARS_PER_TOKEN = 3.5
+
+# Journal de consommation (dans .cache/, conservé entre deux runs par la CI)
+USAGE_LOG = Path(__file__).parent.parent / ".cache" / "token_usage.jsonl"
+
+# Nombre de runs conservés dans le journal (les plus anciens sont supprimés)
+MAX_USAGE_RUNS = 500
+
+SENTENCE_END_RE = re.compile(r"[.!?…](?=\s|$)")
+
+T = TypeVar("T")
+
+
+def model_limits(model: str | None) -> dict:
+    """Limites et prix d'un modèle (DEFAULT_LIMITS s'il est inconnu)."""
+    return MODEL_LIMITS.get(model or "", DEFAULT_LIMITS)
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    """Encodeur tiktoken du modèle, ou None si tiktoken est absent ou ne le connaît pas."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return None
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """Nombre de tokens du texte (exact avec tiktoken, estimé sinon)."""
+    if not text:
+        return 0
+    encoding = _encoding(model) if model else None
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def compact_text(text: str, max_tokens: int, model: str | None = None) -> str:
+    """
+    Raccourcit un texte à max_tokens, de façon déterministe.
+
+    Les espaces sont normalisés; le texte est coupé après la dernière
+    phrase complète qui tient dans le budget, ou à défaut après le
+    dernier mot complet (suivi de "…").
+    """
+    text = " ".join(text.split())
+    if count_tokens(text, model) <= max_tokens:
+        return text
+
+    # Préfixe le plus long qui tient dans le budget (recherche dichotomique)
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if count_tokens(text[:middle] + "…", model) <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    prefix = text[:low]
+
+    sentences = [m.end() for m in SENTENCE_END_RE.finditer(prefix)]
+    if sentences and sentences[-1] >= len(prefix) // 2:
+        return prefix[:sentences[-1]]
+    words = prefix.rsplit(" ", 1)[0] if " " in prefix else prefix
+    return words.rstrip(" ,;:") + "…"
+
+
+def pack(items: Sequence[T], size: Callable[[T], int], max_input: int,
+         max_output: int | None = None, output_size: Callable[[T], int] | None = None,
+         max_items: int | None = None) -> List[List[T]]:
+    """
+    Regroupe les éléments en lots consécutifs qui respectent les budgets.
+
+    Args:
+        items: Éléments, dans l'ordre
+        size: Tokens d'un élément dans le prompt
+        max_input: Budget de tokens du prompt (hors instructions fixes)
+        max_output: Budget de tokens de la réponse (None = pas de limite)
+        output_size: Tokens attendus dans la réponse pour un élément
+        max_items: Nombre maximal d'éléments par lot
+
+    Returns:
+        Lots d'éléments; un élément plus grand qu'un budget forme un lot à lui seul
+    """
+    batches: List[List[T]] = []
+    current: List[T] = []
+    used_input = used_output = 0
+    for item in items:
+        item_input = size(item)
+        item_output = output_size(item) if output_size else 0
+        fits = (used_input + item_input <= max_input
+                and (max_output is None or used_output + item_output <= max_output)
+                and (max_items is None or len(current) < max_items))
+        if current and not fits:
+            batches.append(current)
+            current, used_input, used_output = [], 0, 0
+        current.append(item)
+        used_input += item_input
+        used_output += item_output
+    if current:
+        batches.append(current)
+    return batches
+
+
+# =============================================================================
+# SUIVI DE LA CONSOMMATION
+# =============================================================================
+
+@dataclass
+class Usage:
+    """Consommation cumulée d'un modèle."""
+    provider: str
+    model: str
+    requests: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    @property
+    def cost(self) -> float:
+        """Coût estimé en dollars."""
+        limits = model_limits(self.model)
+        return (self.prompt_tokens * limits["input_price"]
+                + self.completion_tokens * limits["output_price"]) / 1_000_000
+
+
+class UsageTracker:
+    """Compteurs de tokens du run courant, par provider et modèle (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._usage: dict[tuple[str, str], Usage] = {}
+
+    def record(self, provider: str, model: str, prompt_tokens: int, completion_tokens: int) -> None:
+        with self._lock:
+            usage = self._usage.setdefault((provider, model), Usage(provider, model))
+            usage.requests += 1
+            usage.prompt_tokens += prompt_tokens
+            usage.completion_tokens += completion_tokens
+
+    def stats(self) -> dict:
+        """Totaux du run: requêtes, tokens et coût, globalement et par modèle."""
+        with self._lock:
+            models = [dict(vars(u), cost=round(u.cost, 6)) for u in self._usage.values()]
+        return {
+            "requests": sum(m["requests"] for m in models),
+            "prompt_tokens": sum(m["prompt_tokens"] for m in models),
+            "completion_tokens": sum(m["completion_tokens"] for m in models),
+            "cost": round(sum(m["cost"] for m in models), 6),
+            "models": models
+        }
+
+    def reset(self) -> None:
+        """Remet les compteurs à zéro (début d'un nouveau run)."""
+        with self._lock:
+            self._usage.clear()
+
+    def save(self, path: str | Path | None = None) -> None:
+        """
+        Ajoute les totaux du run au journal de consommation (défaut: USAGE_LOG).
+
+        Seuls les MAX_USAGE_RUNS derniers runs sont conservés; le journal
+        est réécrit via un fichier temporaire renommé ensuite (atomique).
+        """
+        stats = self.stats()
+        if not stats["requests"]:
+            return
+        path = Path(path or USAGE_LOG)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            lines = []
+        lines = (lines + [json.dumps(dict(stats, at=time.time()))])[-MAX_USAGE_RUNS:]
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+
+USAGE = UsageTracker()
+
+
+def get_usage() -> dict:
+    """Consommation de tokens du run courant."""
+    return USAGE.stats()
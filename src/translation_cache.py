@@ -0,0 +1,129 @@
+"""
+CyberDailyWatch - Mémoire de traduction
+Cache persistant (SQLite) des traductions produites par l'IA.
+
+Chaque traduction est indexée par le hash du texte source (titre +
+résumé), le modèle qui l'a produite et la version du prompt. Un article
+déjà traduit lors d'un run précédent n'est donc plus envoyé à l'IA.
+Changer le prompt (TRANSLATION_PROMPT_VERSION dans main.py) invalide
+naturellement les anciennes entrées.
+
+Configuration modifiable:
+    - CACHE_PATH: Fichier SQLite du cache
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from metrics import METRICS
+
+# =============================================================================
+# CONFIGURATION - Modifiez ces valeurs selon vos besoins
+# =============================================================================
+
+# Fichier SQLite (dans .cache/, conservé entre deux runs par la CI)
+CACHE_PATH = Path(__file__).parent.parent / ".cache" / "translations.sqlite3"
+
+
+def source_hash(*texts: str) -> str:
+    """Hash SHA-256 du texte source (les champs sont séparés par un octet nul)."""
+    return hashlib.sha256("\0".join(texts).encode("utf-8")).hexdigest()
+
+
+class TranslationCache:
+    """
+    Mémoire de traduction sur SQLite.
+
+    Args:
+        path: Chemin du fichier SQLite (":memory:" pour un cache temporaire)
+    """
+
+    def __init__(self, path: str | Path = CACHE_PATH):
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS translations (
+                text_hash TEXT NOT NULL,
+                model TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                language TEXT NOT NULL,
+                title TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (text_hash, model, prompt_version, language)
+            )"""
+        )
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def get(self, title: str, summary: str, models: list[str], prompt_version: str,
+            language: str = "fr") -> dict | None:
+        """
+        Cherche une traduction produite par l'un des modèles donnés.
+
+        Les modèles sont essayés dans l'ordre de la liste (le modèle
+        principal d'abord).
+
+        Returns:
+            {"title": ..., "summary": ..., "model": ...} ou None
+        """
+        key = source_hash(title, summary)
+        with self._lock:
+            rows = self._conn.execute(
+                f"""SELECT model, title, summary FROM translations
+                    WHERE text_hash = ? AND prompt_version = ? AND language = ?
+                    AND model IN ({", ".join("?" * len(models))})""",
+                (key, prompt_version, language, *models)
+            ).fetchall()
+            found = {model: (title_tr, summary_tr) for model, title_tr, summary_tr in rows}
+            for model in models:
+                if model in found:
+                    self.hits += 1
+                    METRICS.incr("cache_lookups_total", cache="translation", result="hit")
+                    return {"title": found[model][0], "summary": found[model][1], "model": model}
+            self.misses += 1
+            METRICS.incr("cache_lookups_total", cache="translation", result="miss")
+            return None
+
+    def put(self, title: str, summary: str, model: str, prompt_version: str,
+            title_tr: str, summary_tr: str, language: str = "fr") -> None:
+        """Enregistre (ou remplace) une traduction."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (source_hash(title, summary), model, prompt_version, language,
+                 title_tr, summary_tr, time.time())
+            )
+            self._conn.commit()
+            self.stores += 1
+
+    def stats(self) -> dict:
+        """Compteurs du run courant."""
+        return {"hits": self.hits, "misses": self.misses, "stores": self.stores}
+
+    def reset_stats(self) -> None:
+        """Remet les compteurs à zéro (début d'un nouveau run; le cache est conservé)."""
+        with self._lock:
+            self.hits = self.misses = self.stores = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_cache: TranslationCache | None = None
+
+
+def get_translation_cache() -> TranslationCache:
+    """Retourne la mémoire de traduction partagée, ouverte au premier appel."""
+    global _cache
+    if _cache is None:
+        _cache = TranslationCache()
+    return _cache
@@ -0,0 +1,13 @@
+"""
+CyberDailyWatch - Configuration des tests
+Les modules de src/ s'importent comme dans les scripts (import pipeline,
+import main...), sans installation; ceux de benchmarks/ aussi (serveur de
+fixtures, services simulés).
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "benchmarks"))
+sys.path.insert(0, str(ROOT / "src"))
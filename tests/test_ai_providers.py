@@ -0,0 +1,201 @@
+"""Tests des providers IA (disjoncteur, basculement, mode hedged), avec des providers simulés."""
+
+import asyncio
+
+import pytest
+
+import ai_providers
+from ai_providers import CircuitBreaker, _is_quota_error, complete
+from fake_services import FakeProvider
+from metrics import METRICS
+
+
+class Clock:
+    """Horloge monotone contrôlée par le test."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(ai_providers.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def register(monkeypatch):
+    def register(provider):
+        monkeypatch.setitem(ai_providers.PROVIDERS, provider.name, provider)
+        return provider
+    return register
+
+
+class FailingProvider(FakeProvider):
+    """Échoue tant que `down` est vrai."""
+
+    def __init__(self, *args, error: str = "service indisponible", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.down = True
+        self.error = error
+
+    async def _complete(self, *args):
+        if self.down:
+            self.calls += 1
+            await asyncio.sleep(self.latency)
+            raise RuntimeError(self.error)
+        return await super()._complete(*args)
+
+
+class CancellableProvider(FakeProvider):
+    """Note l'annulation de ses requêtes."""
+
+    cancelled = 0
+
+    async def _complete(self, *args):
+        try:
+            return await super()._complete(*args)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+
+def test_breaker_open_half_open_closed(clock):
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=60)
+    assert breaker.state == "closed" and breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.available() and not breaker.allow()
+
+    clock.now += 61
+    assert breaker.state == "half_open" and breaker.available()
+    assert breaker.acquire() == "probe"
+    # Une seule tentative d'essai à la fois
+    assert breaker.acquire() is None and not breaker.available()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.acquire() == "closed" and breaker.acquire() == "closed"
+
+
+def test_failed_probe_reopens_and_cancelled_probe_is_released(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=60)
+    breaker.record_failure()
+    clock.now += 61
+    assert breaker.acquire() == "probe"
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now += 61
+    assert breaker.acquire() == "probe"
+    breaker.release()
+    assert breaker.acquire() == "probe"
+
+
+def test_quota_error_uses_long_cooldown(clock):
+    breaker = CircuitBreaker(cooldown=60, quota_cooldown=3600)
+    breaker.record_failure(quota=True)
+    clock.now += 61
+    assert breaker.state == "open"
+    clock.now += 3600
+    assert breaker.state == "half_open"
+
+
+@pytest.mark.parametrize("message, quota", [
+    ("Error code: 429 - insufficient_quota", True),
+    ("Rate limit reached for gpt-4o-mini", True),
+    ("429 Resource exhausted", True),
+    ("failed to generate content", False),
+    ("moderate load, accurate answer unavailable", False),
+    ("insufficient permissions", False),
+])
+def test_quota_error_detection(message, quota):
+    assert _is_quota_error(RuntimeError(message)) is quota
+
+
+def test_quota_error_detection_from_status_and_type():
+    class RateLimitError(Exception):
+        pass
+
+    error = RuntimeError("boom")
+    error.status_code = 429
+    assert _is_quota_error(error)
+    assert _is_quota_error(RateLimitError("boom"))
+
+
+def test_half_open_admits_a_single_probe_among_concurrent_calls(register):
+    primary = register(FailingProvider("primary", latency=0.05))
+    backup = register(FakeProvider("backup"))
+    primary.breaker = CircuitBreaker(failure_threshold=1, cooldown=0.01)
+
+    async def scenario():
+        await complete("s", "u", chain=["primary", "backup"], hedge_delay=None)
+        assert primary.breaker.state == "open"
+        await asyncio.sleep(0.02)
+        primary.calls = 0
+        results = await asyncio.gather(*(
+            complete("s", "u", chain=["primary", "backup"], hedge_delay=None) for _ in range(8)
+        ))
+        return results
+
+    results = asyncio.run(scenario())
+    assert primary.calls == 1
+    assert all(result.provider == "backup" for result in results)
+    assert primary.breaker.state == "open"
+
+
+def test_probe_success_closes_the_circuit(register):
+    primary = register(FailingProvider("primary"))
+    register(FakeProvider("backup"))
+    primary.breaker = CircuitBreaker(failure_threshold=1, cooldown=0.01)
+
+    async def scenario():
+        await complete("s", "u", chain=["primary", "backup"], hedge_delay=None)
+        await asyncio.sleep(0.02)
+        primary.down = False
+        return await complete("s", "u", chain=["primary", "backup"], hedge_delay=None)
+
+    assert asyncio.run(scenario()).provider == "primary"
+    assert primary.breaker.state == "closed"
+
+
+def test_hedged_request_keeps_fastest_and_cancels_the_other(register):
+    slow = register(CancellableProvider("slow", latency=1.0))
+    fast = register(FakeProvider("fast", latency=0.01))
+    METRICS.reset()
+
+    result = asyncio.run(complete("s", "u", chain=["slow", "fast"], hedge_delay=0.05))
+    assert result.provider == "fast"
+    assert (slow.calls, fast.calls) == (1, 1)
+    assert slow.cancelled == 1
+    assert slow.breaker.state == "closed" and slow.breaker.failures == 0
+    # La requête perdante est annulée, pas en erreur
+    report = METRICS.snapshot()
+    assert not [c for c in report["counters"] if c["name"] == "ai_request_errors_total"]
+    assert {e["labels"]["provider"]: e["status"] for e in report["events"] if e["name"] == "ai_request"} == {
+        "slow": "cancelled", "fast": "ok"}
+
+
+def test_sequential_fallback_after_error(register):
+    broken = register(FailingProvider("broken"))
+    register(FakeProvider("backup"))
+
+    result = asyncio.run(complete("s", "u", chain=["broken", "backup"], hedge_delay=None))
+    assert result.provider == "backup"
+    assert broken.breaker.failures == 1 and broken.breaker.state == "closed"
+
+
+def test_all_circuits_open_still_tries_the_chain(register):
+    only = register(FakeProvider("only"))
+    only.breaker.record_failure(quota=True)
+
+    result = asyncio.run(complete("s", "u", chain=["only"], hedge_delay=None))
+    assert result.provider == "only"
+    assert only.breaker.state == "closed"
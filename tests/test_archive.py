@@ -0,0 +1,98 @@
+"""Tests de l'archive des briefings et de l'index de recherche."""
+
+from archive import NewsArchive
+from search_index import SearchIndex
+
+
+def briefing(generated_at: str, title: str, title_fr: str = "", fingerprint: str = "") -> dict:
+    article = {"title": title, "url": f"https://example.com/{title}", "summary": title}
+    if title_fr:
+        article.update(title_fr=title_fr, summary_fr=title_fr)
+    return {"generated_at": generated_at, "fingerprint": fingerprint or title, "articles": [article]}
+
+
+def test_append_keeps_date_range_and_inserts_older_days(tmp_path):
+    archive = NewsArchive(tmp_path)
+    assert archive.append(briefing("2026-01-10T08:00:00Z", "a"))
+    assert archive.append(briefing("2026-01-10T20:00:00Z", "b"))
+    assert archive.append(briefing("2026-01-12T08:00:00Z", "c"))
+    assert archive.append(briefing("2026-01-11T08:00:00Z", "d"))
+    assert not archive.append(briefing("2026-01-11T09:00:00Z", "d"))
+
+    index = archive.load_index()
+    assert (index["first_date"], index["last_date"], index["total"]) == ("2026-01-10", "2026-01-12", 4)
+    assert index["updated_at"] == "2026-01-12T08:00:00Z"
+    assert [entry["date"] for entry in archive.read_page(1)] == [
+        "2026-01-10", "2026-01-10", "2026-01-11", "2026-01-12"]
+
+
+def test_insert_rewrites_pages_from_the_first_affected_one(tmp_path):
+    archive = NewsArchive(tmp_path, page_size=2)
+    for day in ("2026-01-01", "2026-01-02", "2026-01-04", "2026-01-05", "2026-01-06"):
+        archive.append(briefing(f"{day}T08:00:00Z", day))
+    page1 = archive.page_path(1).read_bytes()
+
+    assert archive.append(briefing("2026-01-03T08:00:00Z", "2026-01-03"))
+
+    assert archive.page_path(1).read_bytes() == page1
+    assert archive.load_index()["pages"] == 3
+    assert [[entry["date"][-2:] for entry in archive.read_page(page)] for page in (1, 2, 3)] == [
+        ["01", "02"], ["03", "04"], ["05", "06"]]
+    assert [archive.read_day(f"2026-01-0{n}")[0]["page"] for n in range(1, 7)] == [1, 1, 2, 2, 3, 3]
+    assert [b["articles"][0]["title"][-2:] for b in archive.iter_briefings()] == [
+        "01", "02", "03", "04", "05", "06"]
+
+
+def test_replace_latest_updates_page_and_keeps_generated_at(tmp_path):
+    archive = NewsArchive(tmp_path, page_size=2)
+    archive.append(briefing("2026-01-10T08:00:00Z", "a", "ancien a"))
+    archive.append(briefing("2026-01-11T08:00:00Z", "b", "ancien b"))
+    archive.append(briefing("2026-01-12T08:00:00Z", "c", "ancien c"))
+
+    assert archive.replace_latest(briefing("2026-01-11T00:00:00Z", "b", "nouveau b"))
+
+    day = archive.read_day("2026-01-11")
+    assert len(day) == 1
+    assert day[0]["generated_at"] == "2026-01-11T08:00:00Z"
+    assert day[0]["articles"][0]["title_fr"] == "nouveau b"
+    entries = archive.read_page(day[0]["page"])
+    assert [entry["generated_at"] for entry in entries] == ["2026-01-10T08:00:00Z", "2026-01-11T08:00:00Z"]
+    assert entries[1]["articles"][0]["title_fr"] == "nouveau b"
+    assert archive.read_page(2)[0]["articles"][0]["title_fr"] == "ancien c"
+
+
+def test_reindex_replaces_translation_terms(tmp_path):
+    index = SearchIndex(tmp_path / "search")
+    old = briefing("2026-01-10T08:00:00Z", "ransomware", "rançongiciel ancien")["articles"]
+    other = briefing("2026-01-11T08:00:00Z", "botnet", "réseau zombie")["articles"]
+    index.add_articles(old, "2026-01-10")
+    index.add_articles(other, "2026-01-11")
+
+    new = briefing("2026-01-10T08:00:00Z", "ransomware", "logiciel rançon")["articles"]
+    assert index.reindex_articles(new, "2026-01-10") == 1
+    index.save()
+
+    reloaded = SearchIndex(tmp_path / "search")
+    assert reloaded.stats()["docs"] == 2
+    assert reloaded.search("ancien") == []
+    assert reloaded.search("logiciel") == [
+        {"title": "logiciel rançon", "url": "https://example.com/ransomware", "date": "2026-01-10"}
+    ]
+    assert [hit["title"] for hit in reloaded.search("zombie")] == ["réseau zombie"]
+    assert all(ids == sorted(ids) for ids in reloaded.postings.values())
+
+
+def test_pages_and_index_use_the_briefing_edition(tmp_path):
+    article = {"title": "Botnet takedown", "url": "https://example.com/botnet", "summary": "Botnet",
+               "title_fr": "Démantèlement", "title_es": "Desmantelamiento", "summary_es": "Red de bots"}
+    archive = NewsArchive(tmp_path)
+    archive.append({"generated_at": "2026-01-10T08:00:00Z", "edition": "es", "articles": [article]})
+    entry = archive.read_page(1)[0]
+    assert entry["edition"] == "es"
+    assert entry["articles"] == [{"title": "Botnet takedown", "title_es": "Desmantelamiento",
+                                  "url": "https://example.com/botnet"}]
+
+    index = SearchIndex(None)
+    index.add_articles([article], "2026-01-10", "es")
+    assert index.search("bots")[0]["title"] == "Desmantelamiento"
+    assert index.search("démantèlement") == []
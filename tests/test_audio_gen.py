@@ -0,0 +1,74 @@
+"""Tests de la synthèse segmentée: erreurs du cache audio et de la synthèse."""
+
+import asyncio
+
+import pytest
+
+import audio_cache
+import audio_gen
+from audio_cache import AudioSegmentCache
+
+SCRIPT = "Première phrase du briefing. Deuxième phrase du briefing."
+
+
+async def fake_stream(text, voice="", rate="", pitch=""):
+    for word in text.split():
+        yield word.encode("utf-8") + b"|"
+
+
+def run(output):
+    # wait_for: un producteur mort sans prévenir bloquerait le lecteur
+    return asyncio.run(asyncio.wait_for(
+        audio_gen.generate_audio_segmented(SCRIPT, output, concurrency=2), timeout=5))
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = AudioSegmentCache(tmp_path / "cache")
+    monkeypatch.setattr(audio_cache, "_cache", cache)
+    monkeypatch.setattr(audio_gen, "USE_AUDIO_CACHE", True)
+    monkeypatch.setattr(audio_gen, "SEGMENT_MAX_CHARS", 30)
+    monkeypatch.setattr(audio_gen, "synthesize_stream", fake_stream)
+    return cache
+
+
+def expected() -> bytes:
+    return b"".join(word.encode("utf-8") + b"|" for word in SCRIPT.split())
+
+
+def test_commit_failure_keeps_the_audio(cache, tmp_path, monkeypatch):
+    def no_space(*args):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(cache, "_commit", no_space)
+    output = run(tmp_path / "briefing.mp3")
+    assert output.read_bytes() == expected()
+    assert not list(cache.directory.glob("*"))
+
+
+def test_open_writer_failure_keeps_the_audio(cache, tmp_path, monkeypatch):
+    def read_only(key):
+        raise PermissionError("read-only")
+
+    monkeypatch.setattr(cache, "open_writer", read_only)
+    assert run(tmp_path / "briefing.mp3").read_bytes() == expected()
+
+
+def test_evicted_segment_is_synthesized_again(cache, tmp_path):
+    run(tmp_path / "first.mp3")
+    # Segments évincés entre lookup() et open(): lookup les voit encore
+    for path in cache.directory.glob("*.mp3"):
+        path.unlink()
+    cache.lookup = lambda key: cache.directory / f"{key}.mp3"
+    assert run(tmp_path / "second.mp3").read_bytes() == expected()
+
+
+def test_synthesis_failure_is_raised(cache, tmp_path, monkeypatch):
+    async def broken(text, voice="", rate="", pitch=""):
+        raise RuntimeError("TTS indisponible")
+        yield b""
+
+    monkeypatch.setattr(audio_gen, "synthesize_stream", broken)
+    with pytest.raises(RuntimeError, match="TTS indisponible"):
+        run(tmp_path / "briefing.mp3")
+    assert not (tmp_path / "briefing.mp3").exists()
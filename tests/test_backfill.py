@@ -0,0 +1,90 @@
+"""Tests du backfill (erreurs par jour, nouveau rendu de l'archive)."""
+
+import asyncio
+import shutil
+from pathlib import Path
+
+import pytest
+
+import archive
+import backfill
+import search_index
+from archive import NewsArchive
+from search_index import SearchIndex
+
+FIXTURE_PAGE = Path(__file__).parent.parent / "benchmarks" / "fixtures" / "thehackernews.html"
+
+
+@pytest.fixture
+def offline(tmp_path, monkeypatch):
+    """Archive, index et état dans tmp_path; rendu sans IA (titre traduit = "FR " + titre)."""
+    monkeypatch.setattr(archive, "_archive", NewsArchive(tmp_path / "archive"))
+    monkeypatch.setattr(search_index, "_index", SearchIndex(tmp_path / "archive" / "search"))
+    monkeypatch.setattr(backfill, "STATE_PATH", tmp_path / "state.json")
+
+    async def render_day(day, news, audio, tts_semaphore, generated_at=None):
+        for article in news:
+            article["title_fr"] = "FR " + article["title"]
+        return {
+            "generated_at": generated_at or f"{day}T00:00:00Z",
+            "fingerprint": day,
+            "articles": [backfill.as_dict(article) for article in news],
+            "script": "",
+        }
+
+    monkeypatch.setattr(backfill, "render_day", render_day)
+    return tmp_path
+
+
+def run(days, mode):
+    return asyncio.run(backfill.run_backfill(days, mode, audio=False, workers=1))
+
+
+def test_unreadable_snapshot_fails_only_its_day(offline):
+    good = offline / "2026-01-02.html"
+    shutil.copy(FIXTURE_PAGE, good)
+    days = {
+        "2026-01-01": [(offline / "2026-01-01.html", "thehackernews")],  # absent
+        "2026-01-02": [(good, "thehackernews")],
+    }
+    report = run(days, "snapshots")
+    assert report["done"] == 1
+    assert list(report["failed"]) == ["2026-01-01"]
+    assert archive.get_archive().read_day("2026-01-02")
+
+
+def test_snapshots_before_last_archived_day_are_inserted(offline):
+    archive.get_archive().append({"generated_at": "2026-02-01T08:00:00Z", "articles": []})
+    shutil.copy(FIXTURE_PAGE, offline / "2026-01-02.html")
+    report = run({"2026-01-02": [(offline / "2026-01-02.html", "thehackernews")]}, "snapshots")
+    assert report["done"] == 1
+    index = archive.get_archive().load_index()
+    assert (index["first_date"], index["last_date"]) == ("2026-01-02", "2026-02-01")
+    assert [entry["date"] for entry in archive.get_archive().read_page(1)] == ["2026-01-02", "2026-02-01"]
+
+
+def test_rerender_updates_page_and_search_index(offline):
+    article = {"title": "Botnet takedown", "url": "https://example.com/botnet", "summary": "Botnet",
+               "title_fr": "Ancienne traduction"}
+    archive.get_archive().append({"generated_at": "2026-01-05T08:30:00Z", "articles": [article]})
+    search_index.get_search_index().add_articles([article], "2026-01-05")
+
+    report = run({"2026-01-05": None}, "rerender")
+    assert report == {"done": 1, "skipped": 0, "failed": {}}
+    day = archive.get_archive().read_day("2026-01-05")
+    assert day[0]["generated_at"] == "2026-01-05T08:30:00Z"
+    assert archive.get_archive().read_page(1)[0]["articles"][0]["title_fr"] == "FR Botnet takedown"
+    index = search_index.get_search_index()
+    assert index.search("ancienne") == []
+    assert index.search("botnet")[0]["title"] == "FR Botnet takedown"
+
+
+def test_corrupt_day_file_fails_only_its_day(offline):
+    for day in ("2026-01-05", "2026-01-06"):
+        archive.get_archive().append({"generated_at": f"{day}T08:00:00Z",
+                                      "articles": [{"title": day, "url": day, "summary": day}]})
+    archive.get_archive().day_path("2026-01-05").write_text('{"briefings": [{}]}')
+
+    report = run({"2026-01-05": None, "2026-01-06": None}, "rerender")
+    assert report["done"] == 1
+    assert list(report["failed"]) == ["2026-01-05"]
@@ -0,0 +1,46 @@
+"""Tests de la déduplication (lot courant, historique des jours précédents)."""
+
+from dedup import DedupHistory, deduplicate, record_published
+
+TEASER = "Le groupe LockBit revendique une attaque par rançongiciel contre un hôpital de Lyon"
+
+
+def article(url: str, summary: str = TEASER, **fields) -> dict:
+    return {"title": "Rançongiciel: un hôpital lyonnais paralysé", "url": url,
+            "summary": summary, "source": url.split("/")[2], **fields}
+
+
+def test_summarized_article_is_compared_on_its_teaser():
+    history = DedupHistory(":memory:")
+    body_summary = ("Les urgences ont été réorientées vers les établissements voisins pendant "
+                    "trois jours; les équipes informatiques ont restauré les sauvegardes, "
+                    "l'ANSSI accompagne l'enquête et aucune rançon n'a été versée à ce stade.")
+    record_published([article("https://a.example/lockbit", body_summary, teaser=TEASER)], history)
+
+    assert deduplicate([article("https://b.example/lyon")], history=history) == []
+    history.close()
+
+
+def test_same_story_is_merged_into_the_first_article():
+    first = article("https://a.example/lockbit")
+    other = dict(article("https://b.example/lyon"), title="Rançongiciel: un hôpital lyonnais paralysé !")
+    unrelated = {"title": "Microsoft corrige une faille Exchange", "url": "https://c.example/exchange",
+                 "summary": "Le correctif de mars comble une vulnérabilité exploitée", "source": "c.example"}
+
+    stories = deduplicate([first, other, unrelated])
+    assert [story["url"] for story in stories] == ["https://a.example/lockbit", "https://c.example/exchange"]
+    assert stories[0]["sources"] == [{"source": "a.example", "url": "https://a.example/lockbit"},
+                                     {"source": "b.example", "url": "https://b.example/lyon"}]
+    assert "sources" not in first
+
+
+def test_history_drops_stories_published_under_another_url():
+    history = DedupHistory(":memory:")
+    record_published([article("https://a.example/lockbit")], history)
+
+    assert deduplicate([article("https://b.example/lyon")], history=history) == []
+    # Le même article (même URL) reste publiable, et l'historique expire
+    assert len(deduplicate([article("https://a.example/lockbit")], history=history)) == 1
+    assert history.prune(max_age=-1) == 1
+    assert len(deduplicate([article("https://b.example/lyon")], history=history)) == 1
+    history.close()
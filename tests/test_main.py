@@ -0,0 +1,52 @@
+"""Tests de l'orchestrateur: compteurs remis à zéro à chaque run (mode service), traduction."""
+
+import pytest
+
+import ai_providers
+import audio_cache
+import main
+import translation_cache
+from editions import get_edition
+from fake_services import FakeProvider
+from http_session import STATS
+from pipeline import Pipeline, Stage
+
+
+@pytest.fixture
+def offline_main(tmp_path, monkeypatch):
+    monkeypatch.setattr(translation_cache, "_cache", translation_cache.TranslationCache(":memory:"))
+    monkeypatch.setattr(audio_cache, "_cache", audio_cache.AudioSegmentCache(tmp_path / "audio"))
+    monkeypatch.setattr(main, "get_ai_provider", lambda: "fake")
+    monkeypatch.setattr(main, "WRITE_METRICS", False)
+    monkeypatch.setattr(main.USAGE, "save", lambda: None)
+
+    def lookups():
+        cache = translation_cache.get_translation_cache()
+        cache.get("titre", "résumé", ["modèle"], "v1")
+        audio_cache.get_audio_cache().lookup("absent")
+        STATS.incr("requests")
+
+    monkeypatch.setattr(main, "build_pipeline", lambda: Pipeline(
+        [Stage("lookups", lookups, checkpoint=False)], checkpoint_path=None))
+
+
+def test_each_run_reports_its_own_cache_counters(offline_main):
+    for _ in range(3):
+        main.main()
+        assert translation_cache.get_translation_cache().stats()["misses"] == 1
+        assert audio_cache.get_audio_cache().stats()["misses"] == 1
+        assert STATS.requests == 1
+
+
+def test_batch_translation_records_the_model_that_answered(monkeypatch):
+    monkeypatch.setattr(main, "AI_PROVIDER", main.AI_PROVIDER)
+    monkeypatch.setattr(ai_providers, "AI_PROVIDER_CHAIN", ["primary", "backup"])
+    monkeypatch.setitem(ai_providers.PROVIDERS, "primary",
+                        FakeProvider("primary", error_rate=1.0, quota_error=True))
+    monkeypatch.setitem(ai_providers.PROVIDERS, "backup", FakeProvider(
+        "backup", model="backup-model",
+        response=lambda *args: "[ARTICLE 1]\nTITRE: Titre traduit\nRESUME: Résumé traduit"))
+
+    results = main._translate_batch([{"title": "Title", "summary": "Summary"}], get_edition("fr"))
+    assert results == [("Titre traduit", "Résumé traduit", "backup-model")]
+    assert main.AI_PROVIDER == "backup"
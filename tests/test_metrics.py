@@ -0,0 +1,47 @@
+"""Tests du registre de mesures (statuts des spans, historique des runs)."""
+
+import asyncio
+import json
+
+import pytest
+
+import metrics
+from metrics import Metrics
+
+
+def counter(registry: Metrics, name: str) -> float:
+    return sum(c["value"] for c in registry.snapshot()["counters"] if c["name"] == name)
+
+
+def test_span_counts_errors_but_not_cancellations():
+    registry = Metrics()
+
+    with pytest.raises(RuntimeError):
+        with registry.span("ai_request", provider="a"):
+            raise RuntimeError("échec")
+
+    async def cancelled():
+        async def request():
+            with registry.span("ai_request", provider="b"):
+                await asyncio.sleep(10)
+        task = asyncio.ensure_future(request())
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(cancelled())
+    assert counter(registry, "ai_request_errors_total") == 1
+    assert [event["status"] for event in registry.snapshot()["events"]] == ["error", "cancelled"]
+
+
+def test_history_keeps_last_runs(tmp_path, monkeypatch):
+    monkeypatch.setattr(metrics, "MAX_HISTORY_RUNS", 3)
+    history = tmp_path / "history.jsonl"
+    registry = Metrics()
+    for run in range(5):
+        registry.reset()
+        registry.incr("runs_total", run)
+        registry.write_reports(tmp_path, history)
+
+    lines = [json.loads(line) for line in history.read_text().splitlines()]
+    assert [line["counters"].get("runs_total", 0) for line in lines] == [2, 3, 4]
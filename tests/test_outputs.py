@@ -0,0 +1,46 @@
+"""Tests des sorties dérivées (JSON minifié, manifeste incrémental)."""
+
+import json
+
+import pytest
+
+import outputs
+
+
+@pytest.fixture
+def public(tmp_path, monkeypatch):
+    root = tmp_path / "public"
+    monkeypatch.setattr(outputs, "OUTPUTS_ROOT", root)
+    monkeypatch.setattr(outputs, "OUTPUTS_MANIFEST", tmp_path / "cache" / "outputs_manifest.json")
+    return root
+
+
+def data(title: str) -> dict:
+    return {"generated_at": "2026-01-01T08:00:00Z",
+            "articles": [{"title": title, "url": "https://example.com", "summary": "x " * 400}]}
+
+
+def manifest() -> dict:
+    return json.loads(outputs.OUTPUTS_MANIFEST.read_text())
+
+
+def test_manifest_keys_are_relative_and_pruned(public):
+    manifest_path = outputs.OUTPUTS_MANIFEST
+    manifest_path.parent.mkdir(parents=True)
+    manifest_path.write_text(json.dumps({"/tmp/tmpgone/data.min.json": "abc", "editions/xx/data.min.json": "abc"}))
+
+    written = outputs.write_json_outputs(public / "data.json", data("a"))
+    assert public / "data.min.json.gz" in written
+    assert sorted(manifest()) == ["data.min.json", "headlines.json"]
+
+
+def test_unchanged_outputs_are_not_rewritten(public):
+    outputs.write_json_outputs(public / "data.json", data("a"))
+    compressed = public / "data.min.json.gz"
+    compressed.write_bytes(b"marqueur")
+
+    outputs.write_json_outputs(public / "data.json", data("a"))
+    assert compressed.read_bytes() == b"marqueur"
+
+    outputs.write_json_outputs(public / "data.json", data("b"))
+    assert compressed.read_bytes() != b"marqueur"
@@ -0,0 +1,110 @@
+"""Tests de l'exécuteur du pipeline (points de reprise, arrêt propre)."""
+
+import json
+import time
+
+import pytest
+
+from pipeline import Pipeline, PipelineStop, Stage
+
+
+def make_pipeline(feed: list, previous: list, path):
+    """scrape -> compare (avec previous): s'arrête si rien n'a changé."""
+    def scrape():
+        return list(feed)
+
+    def load_previous():
+        return list(previous)
+
+    def compare(news, old):
+        new = [item for item in news if item not in old]
+        if not new:
+            raise PipelineStop("Rien de nouveau")
+        return new
+
+    return Pipeline([
+        Stage("scrape", scrape, outputs=("news",)),
+        Stage("previous", load_previous, outputs=("previous",), checkpoint=False),
+        Stage("compare", compare, inputs=("news", "previous"), outputs=("news_new",), checkpoint=False),
+    ], checkpoint_path=path, run_key="test")
+
+
+def statuses(pipeline: Pipeline) -> dict:
+    return {name: timing.status for name, timing in pipeline.timings.items()}
+
+
+def test_stop_clears_checkpoint_and_rerun_sees_new_data(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    feed, previous = ["a"], ["a"]
+
+    first = make_pipeline(feed, previous, path)
+    assert first.run_sync() == {}
+    assert first.stopped == "Rien de nouveau"
+    assert not path.exists()
+
+    feed.append("b")
+    second = make_pipeline(feed, previous, path)
+    values = second.run_sync()
+    assert second.stopped is None
+    assert statuses(second)["scrape"] == "ok"
+    assert values["news_new"] == ["b"]
+
+
+def test_failed_run_resumes_completed_stages(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    calls = []
+
+    def scrape():
+        calls.append("scrape")
+        return ["a"]
+
+    def translate(news):
+        if len(calls) == 1:
+            raise RuntimeError("provider indisponible")
+        return [item.upper() for item in news]
+
+    def build():
+        return Pipeline([
+            Stage("scrape", scrape, outputs=("news",)),
+            Stage("translate", translate, inputs=("news",), outputs=("news_fr",)),
+        ], checkpoint_path=path, run_key="test")
+
+    with pytest.raises(RuntimeError):
+        build().run_sync()
+    assert json.loads(path.read_text())["values"] == {"news": ["a"]}
+
+    calls.append("retry")
+    pipeline = build()
+    assert pipeline.run_sync()["news_fr"] == ["A"]
+    assert statuses(pipeline) == {"scrape": "resumed", "translate": "ok"}
+    assert calls == ["scrape", "retry"]
+
+
+def test_resumed_run_keeps_checkpoint_age(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    saved_at = time.time() - 3600
+    path.write_text(json.dumps({"run_key": "test", "saved_at": saved_at, "values": {"news": ["a"]}}))
+
+    def fail(news, old):
+        raise RuntimeError("échec")
+
+    pipeline = Pipeline([
+        Stage("scrape", lambda: ["b"], outputs=("news",)),
+        Stage("previous", lambda: [], outputs=("previous",), checkpoint=False),
+        Stage("compare", fail, inputs=("news", "previous"), outputs=("news_new",)),
+    ], checkpoint_path=path, run_key="test")
+    with pytest.raises(RuntimeError):
+        pipeline.run_sync()
+    assert statuses(pipeline)["scrape"] == "resumed"
+    assert json.loads(path.read_text())["saved_at"] == saved_at
+
+
+def test_expired_checkpoint_is_ignored(tmp_path):
+    import pipeline as pipeline_module
+    path = tmp_path / "checkpoint.json"
+    saved_at = time.time() - pipeline_module.CHECKPOINT_MAX_AGE - 1
+    path.write_text(json.dumps({"run_key": "test", "saved_at": saved_at, "values": {"news": ["a"]}}))
+
+    pipeline = make_pipeline(["b"], [], path)
+    assert pipeline.run_sync()["news_new"] == ["b"]
+    assert statuses(pipeline)["scrape"] == "ok"
@@ -0,0 +1,80 @@
+"""Tests du scraper multi-sources, contre le serveur de fixtures local."""
+
+import threading
+
+import pytest
+
+import scraper
+from fixture_server import FixtureServer
+from sources import Source, parse_feed, parse_hackernews_html
+
+
+@pytest.fixture(autouse=True)
+def no_http_cache(monkeypatch):
+    monkeypatch.setattr(scraper, "USE_HTTP_CACHE", False)
+
+
+def test_scrape_sources_merges_all_sources():
+    with FixtureServer() as thn, FixtureServer() as bleeping, FixtureServer() as krebs:
+        sources = [
+            Source("thehackernews", thn.url("thehackernews.html"), parse_hackernews_html),
+            Source("bleepingcomputer", bleeping.url("feed_rss.xml"), parse_feed),
+            Source("krebsonsecurity", krebs.url("feed_atom.xml"), parse_feed),
+            Source("missing", thn.url("absent.xml"), parse_feed),
+        ]
+        articles = scraper.scrape_sources(sources, 3)
+        sequential = scraper.scrape_sources(sources, 3, max_workers=1)
+
+    assert articles == sequential
+    assert [article["source"] for article in articles[:3]] == ["thehackernews", "bleepingcomputer",
+                                                                "krebsonsecurity"]
+    assert {article["source"] for article in articles} == {"thehackernews", "bleepingcomputer",
+                                                           "krebsonsecurity"}
+    assert all(article["title"] and article["url"] for article in articles)
+    assert len({article["url"] for article in articles}) == len(articles)
+
+
+def test_host_limiter_is_shared_across_limits():
+    limiter = scraper._host_limiter("http://127.0.0.1:1/page.html")
+    assert scraper._host_limiter("http://127.0.0.1:1/other.html") is limiter
+    entered = threading.Event()
+
+    def request():
+        with limiter.slot(1):
+            entered.set()
+
+    with limiter.slot(2), limiter.slot(2):
+        thread = threading.Thread(target=request)
+        thread.start()
+        # Deux requêtes en cours: un appel limité à 1 attend, sans place supplémentaire
+        assert not entered.wait(0.2)
+    assert entered.wait(5)
+    thread.join()
+    assert limiter.active == 0
+
+
+def test_per_host_limit_bounds_concurrent_requests(monkeypatch):
+    session = scraper.get_session()
+    fetch = session.get
+    lock = threading.Lock()
+    active = peak = 0
+
+    def counting_get(*args, **kwargs):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        try:
+            return fetch(*args, **kwargs)
+        finally:
+            with lock:
+                active -= 1
+
+    monkeypatch.setattr(session, "get", counting_get)
+    with FixtureServer(latency=0.1) as server:
+        sources = [Source(f"feed{i}", server.url(f"feed_rss.xml?{i}"), parse_feed) for i in range(6)]
+        scraper.scrape_sources(sources, 1, per_host_limit=1)
+        assert peak == 1
+        peak = 0
+        scraper.scrape_sources(sources, 1, per_host_limit=3)
+        assert peak == 3
@@ -0,0 +1,62 @@
+"""
+Tests du découpage en termes et du hash des fragments de l'index de recherche.
+
+Les vecteurs sont partagés avec script.js (searchQueryTerms,
+searchShardOf): le frontend doit retrouver les mêmes termes dans les
+mêmes fragments. Ils sont aussi vérifiés sur le code JavaScript quand
+Node.js est disponible.
+"""
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from search_index import query_terms, shard_of, tokenize
+
+SCRIPT_JS = Path(__file__).parent.parent / "script.js"
+
+# Terme -> (fragment sur 64, hash FNV-1a 32 bits complet)
+SHARD_VECTORS = {
+    "a": (44, 0xE40C292C),
+    "lockbit": (13, 1775847821),
+    "cve-2024-3400": (22, 1046720086),
+    "rançongiciel": (44, 3131476588),
+    "zéro-day": (13, 2601203021),
+}
+
+QUERY = "Le groupe LockBit-3 exploite CVE-2024-3400 : rançongiciel à Lyon, lockbit-3"
+QUERY_TERMS = ["groupe", "lockbit-3", "exploite", "cve-2024-3400", "rancongiciel", "lyon"]
+
+
+def test_shard_of_is_fnv1a():
+    for term, (shard, digest) in SHARD_VECTORS.items():
+        assert shard_of(term) == shard
+        assert shard_of(term, 2**32) == digest
+
+
+def test_tokenize_and_query_terms():
+    assert tokenize(QUERY) == [
+        "groupe", "lockbit-3", "lockbit", "exploite", "cve-2024-3400", "cve", "2024", "3400",
+        "rancongiciel", "lyon", "lockbit-3", "lockbit"]
+    assert query_terms(QUERY) == QUERY_TERMS
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="Node.js indisponible")
+def test_script_js_uses_the_same_vectors():
+    source = SCRIPT_JS.read_text(encoding="utf-8")
+    start = source.index("const SEARCH_STOP_WORDS")
+    end = source.index("function decodePostings")
+    program = source[start:end] + f"""
+        const terms = {json.dumps(list(SHARD_VECTORS))};
+        console.log(JSON.stringify({{
+            shards: terms.map(term => [searchShardOf(term, 64), searchShardOf(term, 2 ** 32)]),
+            query: searchQueryTerms({json.dumps(QUERY)})
+        }}));
+    """
+    output = subprocess.run(["node", "-e", program], capture_output=True, text=True, check=True).stdout
+    result = json.loads(output)
+    assert result["shards"] == [list(vector) for vector in SHARD_VECTORS.values()]
+    assert result["query"] == QUERY_TERMS
@@ -0,0 +1,71 @@
+"""Tests des fichiers servis par le mode service (Range, requêtes conditionnelles, précompression)."""
+
+import os
+
+import pytest
+
+from service import serve_file
+
+
+@pytest.fixture
+def public(tmp_path):
+    (tmp_path / "audio").mkdir()
+    (tmp_path / "audio" / "latest.mp3").write_bytes(bytes(range(10)))
+    (tmp_path / "data.json").write_text('{"articles": []}')
+    (tmp_path / "data.json.br").write_bytes(b"br")
+    (tmp_path / "data.json.gz").write_bytes(b"gz")
+    (tmp_path / ".env").write_text("SECRET=1")
+    return tmp_path
+
+
+def test_range_requests(public):
+    response = serve_file(public, "/audio/latest.mp3", {"range": "bytes=2-5"})
+    assert (response.status, response.offset, response.length) == (206, 2, 4)
+    assert response.headers["Content-Range"] == "bytes 2-5/10"
+
+    response = serve_file(public, "/audio/latest.mp3", {"range": "bytes=-3"})
+    assert (response.status, response.offset, response.length) == (206, 7, 3)
+    assert serve_file(public, "/audio/latest.mp3", {"range": "bytes=4-"}).length == 6
+
+    assert serve_file(public, "/audio/latest.mp3", {"range": "bytes=10-12"}).status == 416
+    assert serve_file(public, "/audio/latest.mp3", {"range": "bytes=0-1,4-5"}).status == 416
+    # If-Range périmé: le fichier complet
+    stale = serve_file(public, "/audio/latest.mp3", {"range": "bytes=2-5", "if-range": '"0-0"'})
+    assert (stale.status, stale.length) == (200, 10)
+
+
+def test_if_none_match(public):
+    etag = serve_file(public, "/audio/latest.mp3", {}).headers["ETag"]
+    assert serve_file(public, "/audio/latest.mp3", {"if-none-match": f'W/{etag}'}).status == 304
+    assert serve_file(public, "/audio/latest.mp3", {"if-none-match": '"0-0"'}).status == 200
+
+    os.utime(public / "audio" / "latest.mp3", ns=(0, 10**18))
+    changed = serve_file(public, "/audio/latest.mp3", {"if-none-match": etag})
+    assert changed.status == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_precompressed_variant_selection(public):
+    def encoding(accept_encoding, **headers):
+        response = serve_file(public, "/data.json", dict(headers, **{"accept-encoding": accept_encoding}))
+        assert response.headers["Vary"] == "Accept-Encoding"
+        return response.headers.get("Content-Encoding"), response.path.name
+
+    assert encoding("gzip, deflate, br") == ("br", "data.json.br")
+    assert encoding("gzip") == ("gzip", "data.json.gz")
+    assert encoding("br;q=0, gzip") == ("gzip", "data.json.gz")
+    assert encoding("identity") == (None, "data.json")
+    # Une requête Range porte sur le fichier d'origine
+    assert encoding("br", range="bytes=0-1") == (None, "data.json")
+
+    # Une version précompressée plus ancienne que le fichier est ignorée
+    data = (public / "data.json").stat().st_mtime_ns
+    os.utime(public / "data.json.br", ns=(data - 10**9, data - 10**9))
+    assert encoding("br, gzip") == ("gzip", "data.json.gz")
+
+
+def test_hidden_and_outside_files_are_not_served(public):
+    assert serve_file(public, "/.env", {}).status == 404
+    assert serve_file(public, "/audio/../.env", {}).status == 404
+    assert serve_file(public, "/%2e%2e/etc/passwd", {}).status == 404
+    assert serve_file(public, "/audio", {}).status == 404
@@ -0,0 +1,20 @@
+"""Tests du suivi de consommation des tokens (journal des runs)."""
+
+import json
+
+import token_budget
+from token_budget import UsageTracker
+
+
+def test_usage_log_keeps_last_runs(tmp_path, monkeypatch):
+    monkeypatch.setattr(token_budget, "MAX_USAGE_RUNS", 3)
+    log = tmp_path / "usage.jsonl"
+    tracker = UsageTracker()
+    for run in range(1, 6):
+        tracker.reset()
+        tracker.record("fake", "fake-model", run, 1)
+        tracker.save(log)
+
+    lines = [json.loads(line) for line in log.read_text().splitlines()]
+    assert [line["prompt_tokens"] for line in lines] == [3, 4, 5]
+    assert list(tmp_path.iterdir()) == [log]